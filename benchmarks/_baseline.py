@@ -0,0 +1,81 @@
+"""
+Helpers shared by the benchmarks: import `esd` from the repository (no
+install needed), or from a baseline commit to compare against.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+BASELINE_PATH = "ESD_BENCHMARK_PATH"
+"""
+The environment variable holding the directory of the baseline `esd` package.
+"""
+
+
+def use_tree() -> None:
+    """
+    Import `esd` from the baseline directory when running a baseline,
+    from the repository root otherwise. Call it before importing `esd`.
+    """
+    sys.path.insert(0, os.environ.get(BASELINE_PATH, str(ROOT)))
+
+
+def is_baseline() -> bool:
+    """
+    Whether this process runs the baseline.
+    """
+    return BASELINE_PATH in os.environ
+
+
+def last_release() -> str:
+    """
+    Get the last release, the most recent tag reachable from HEAD.
+
+    Returns:
+        str: The tag.
+    """
+    result = subprocess.run(
+        ["git", "-C", str(ROOT), "describe", "--tags", "--abbrev=0"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit("No release tag found, pass a git ref to --baseline.")
+    return result.stdout.strip()
+
+
+def run_baseline(ref: str | None = None) -> None:
+    """
+    Run the current script again, with the `esd` package of a git ref.
+
+    Args:
+        ref (str | None): The git ref of the baseline (e.g. a branch or a
+            tag), the last release if None.
+    """
+    ref = ref or last_release()
+    archive = subprocess.run(
+        ["git", "-C", str(ROOT), "archive", "--format=tar", ref, "esd"],
+        check=True,
+        capture_output=True,
+    ).stdout
+    # the data filter (Python 3.9.17+) refuses links and absolute paths
+    options = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    with tempfile.TemporaryDirectory() as path:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(path, **options)
+        print(f"baseline ({ref}):", flush=True)
+        subprocess.run(
+            [sys.executable, *sys.argv],
+            env={**os.environ, BASELINE_PATH: path},
+            check=True,
+        )
+    print("current:")
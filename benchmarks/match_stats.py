@@ -0,0 +1,177 @@
+"""
+This benchmark measures the parsing time of match statistics. By default it
+uses synthetic payloads shaped like the Sofascore `/event/{id}/statistics`
+responses (three periods, seven groups, a few unknown statistics), so it runs
+offline and needs no recorded Sofascore data in the repository. Pass
+`--payloads DIR` to parse recorded responses instead, one JSON file per
+match, as returned by
+`SofascoreClient().get_match_stats(event_id, win_probability=False, raw=True)`.
+
+Usage, from the repository root:
+
+python benchmarks/match_stats.py --matches 2000
+
+Pass `--baseline` to run the same measure first on the last release (the
+latest git tag), or `--baseline <git ref>` on any branch, tag or commit.
+Reference, 2000 synthetic matches, best of 5, CPython 3.11 on x86-64 Linux,
+measured with `--baseline` on the commit before the key-to-field table:
+
+  before the table  315-325 ms, ~160 us/match
+  with the table    218-224 ms, ~110 us/match
+"""
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+
+import _baseline
+
+_baseline.use_tree()
+
+from esd.sofascore.types import parse_match_stats  # noqa: E402
+
+GROUPS = {
+    "Match overview": [
+        "ballPossession",
+        "expectedGoals",
+        "bigChanceCreated",
+        "totalShotsOnGoal",
+        "goalkeeperSaves",
+        "cornerKicks",
+        "fouls",
+        "passes",
+        "totalTackle",
+        "freeKicks",
+        "yellowCards",
+        "redCards",
+    ],
+    "Shots": [
+        "totalShotsOnGoal",
+        "shotsOnGoal",
+        "hitWoodwork",
+        "shotsOffGoal",
+        "blockedScoringAttempt",
+        "totalShotsInsideBox",
+        "totalShotsOutsideBox",
+    ],
+    "Attack": [
+        "bigChanceScored",
+        "bigChanceMissed",
+        "accurateThroughBall",
+        "touchesInOppBox",
+        "fouledFinalThird",
+        "offsides",
+    ],
+    "Passes": [
+        "accuratePasses",
+        "throwIns",
+        "finalThirdEntries",
+        "finalThirdPhaseStatistic",
+        "accurateLongBalls",
+        "accurateCross",
+    ],
+    "Duels": [
+        "duelWonPercent",
+        "dispossessed",
+        "groundDuelsPercentage",
+        "aerialDuelsPercentage",
+        "dribblesPercentage",
+    ],
+    "Defending": [
+        "wonTacklePercent",
+        "totalTackle",
+        "interceptionWon",
+        "ballRecovery",
+        "totalClearance",
+        "errorsLeadToShot",
+    ],
+    "Goalkeeping": [
+        "goalkeeperSaves",
+        "goalsPrevented",
+        "highClaims",
+        "punches",
+        "goalKicks",
+    ],
+}
+
+
+def statistic_item(key: str) -> dict:
+    home, away = random.randint(0, 30), random.randint(0, 30)
+    return {
+        "name": key,
+        "home": str(home),
+        "away": str(away),
+        "compareCode": 1 if home > away else 2,
+        "statisticsType": "positive",
+        "valueType": "event",
+        "homeValue": home,
+        "awayValue": away,
+        "renderType": 1,
+        "key": key,
+    }
+
+
+def statistics_payload() -> list[dict]:
+    return [
+        {
+            "period": period,
+            "groups": [
+                {
+                    "groupName": name,
+                    "statisticsItems": [statistic_item(key) for key in keys],
+                }
+                for name, keys in GROUPS.items()
+            ],
+        }
+        for period in ("ALL", "1ST", "2ND")
+    ]
+
+
+def recorded_payloads(path: str, matches: int) -> list[list[dict]]:
+    """
+    Load the recorded responses of a directory, repeated up to `matches`.
+    """
+    files = sorted(Path(path).glob("*.json"))
+    if not files:
+        raise SystemExit(f"No JSON files in {path}")
+    recorded = [json.loads(file.read_text())["statistics"] for file in files]
+    return [recorded[index % len(recorded)] for index in range(matches)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--matches", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--payloads", metavar="DIR", help="recorded responses")
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const="",
+        metavar="REF",
+        help="git ref to compare with, the last release if omitted",
+    )
+    args = parser.parse_args()
+    if args.baseline is not None and not _baseline.is_baseline():
+        _baseline.run_baseline(args.baseline or None)
+    if args.payloads:
+        payloads = recorded_payloads(args.payloads, args.matches)
+    else:
+        random.seed(0)
+        payloads = [statistics_payload() for _ in range(args.matches)]
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        for payload in payloads:
+            parse_match_stats(payload)
+        best = min(best, time.perf_counter() - start)
+    print(
+        f"{args.matches} matches: {best * 1000:.1f} ms, "
+        f"{best / args.matches * 1e6:.1f} us/match (best of {args.repeat})"
+    )
+
+
+if __name__ == "__main__":
+    main()
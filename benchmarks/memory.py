@@ -0,0 +1,130 @@
+"""
+This benchmark measures the memory held by a large list of parsed events,
+in total and per object, using synthetic Sofascore payloads.
+
+Usage, from the repository root:
+
+python benchmarks/memory.py --events 50000
+
+Pass `--baseline` to run the same measure first on the last release (the
+latest git tag), or `--baseline <git ref>` on any branch, tag or commit.
+Reference, 20000 events, CPython 3.11 on x86-64 Linux, measured with
+`--baseline` on the commit before the slotted dataclasses:
+
+  before __slots__  2074 B/event
+  with __slots__    1329 B/event
+"""
+
+import argparse
+import inspect
+import sys
+import tracemalloc
+from collections import Counter
+from dataclasses import fields, is_dataclass
+
+import _baseline
+
+_baseline.use_tree()
+
+from esd.sofascore.types import parse_events  # noqa: E402
+
+
+def team_payload(team_id: int) -> dict:
+    return {
+        "id": team_id,
+        "name": f"Team {team_id}",
+        "slug": f"team-{team_id}",
+        "shortName": f"T{team_id}",
+        "nameCode": f"T{team_id % 1000:03d}",
+        "gender": "M",
+        "type": 0,
+        "userCount": 1000 + team_id,
+        "disabled": False,
+        "country": {"alpha2": "EN", "alpha3": "ENG", "name": "England"},
+        "teamColors": {"primary": "#ff0000", "secondary": "#ffffff", "text": "#000"},
+    }
+
+
+def event_payload(event_id: int) -> dict:
+    return {
+        "id": event_id,
+        "slug": f"team-{2 * event_id}-team-{2 * event_id + 1}",
+        "startTimestamp": 1700000000 + event_id,
+        "tournament": {
+            "id": event_id % 500,
+            "name": "Premier League",
+            "slug": "premier-league",
+            "category": {"id": 1, "name": "England", "slug": "england"},
+        },
+        "homeTeam": team_payload(2 * event_id),
+        "awayTeam": team_payload(2 * event_id + 1),
+        "homeScore": {"current": 2, "display": 2, "period1": 1, "normaltime": 2},
+        "awayScore": {"current": 1, "display": 1, "period1": 0, "normaltime": 1},
+        "status": {"code": 100, "description": "Ended", "type": "finished"},
+        "time": {"injuryTime1": 2, "injuryTime2": 5},
+        "statusTime": {},
+        "roundInfo": {"round": event_id % 38 + 1},
+    }
+
+
+def instance_size(obj: object) -> int:
+    """
+    The shallow size of an object, including its __dict__ if any.
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(payloads: list[dict], lazy: bool) -> tuple[int, list]:
+    tracemalloc.start()
+    events = parse_events(payloads, lazy) if lazy else parse_events(payloads)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const="",
+        metavar="REF",
+        help="git ref to compare with, the last release if omitted",
+    )
+    args = parser.parse_args()
+    if args.baseline is not None and not _baseline.is_baseline():
+        _baseline.run_baseline(args.baseline or None)
+    payloads = [event_payload(event_id) for event_id in range(args.events)]
+
+    size, events = measure(payloads, lazy=False)
+    print(
+        f"{args.events} events: {size / 2**20:.1f} MiB, {size / args.events:.0f} B/event"
+    )
+    # older trees have no lazy events
+    if "lazy" in inspect.signature(parse_events).parameters:
+        size, _ = measure(payloads, lazy=True)
+        print(f"{args.events} lazy events: {size / 2**20:.1f} MiB (before access)")
+
+    print("\nPer object (shallow, including __dict__):")
+    counts, sizes = Counter(), {}
+    stack = [events[0]]
+    while stack:
+        obj = stack.pop()
+        name = type(obj).__name__
+        counts[name] += 1
+        sizes[name] = instance_size(obj)
+        stack.extend(
+            value
+            for value in (getattr(obj, item.name) for item in fields(obj))
+            if is_dataclass(value)
+        )
+    for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        print(f"  {name:<12} {size:>5} B x {counts[name]} per event")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,12 +14,28 @@ any of the sources used to extract data.
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _version
 
-from .fbref import FBrefClient
+from .breaker import CircuitBreaker, CircuitOpenError
+from .fbref import AsyncFBrefClient, FBrefClient
 from .fbref import types as FBrefTypes
-from .promiedos import PromiedosClient
+from .promiedos import AsyncPromiedosClient, PromiedosClient
 from .promiedos import types as PromiedosTypes
-from .sofascore import SofascoreClient
+from .proxy import ProxyPool
+from .retry import RetryPolicy
+from .sofascore import (
+    AsyncLivePoller,
+    AsyncMatchScheduler,
+    AsyncMatchTimeline,
+    AsyncSofascoreClient,
+    LiveObserver,
+    LivePoller,
+    LiveServer,
+    MatchScheduler,
+    MatchTimeline,
+    PollingPolicy,
+    SofascoreClient,
+)
 from .sofascore import types as SofascoreTypes
+from .transport import APIError
 
 try:
     __version__ = _version("EasySoccerData")
@@ -28,9 +44,26 @@ except PackageNotFoundError:
 
 __all__ = [
     "SofascoreClient",
+    "AsyncSofascoreClient",
+    "LivePoller",
+    "AsyncLivePoller",
+    "MatchScheduler",
+    "AsyncMatchScheduler",
+    "PollingPolicy",
+    "MatchTimeline",
+    "AsyncMatchTimeline",
+    "LiveObserver",
+    "LiveServer",
     "SofascoreTypes",
     "PromiedosClient",
+    "AsyncPromiedosClient",
     "PromiedosTypes",
     "FBrefClient",
+    "AsyncFBrefClient",
     "FBrefTypes",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "APIError",
+    "ProxyPool",
 ]
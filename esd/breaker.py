@@ -0,0 +1,248 @@
+"""
+This module contains the circuit breaker shared by the transports.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable
+from urllib.parse import urlsplit
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Exception raised when a request is refused because its circuit is open.
+    """
+
+    def __init__(self, key: str, retry_in: float) -> None:
+        super().__init__(
+            f"Circuit {key} is open, requests are refused for {retry_in:.1f} seconds."
+        )
+        self.key = key
+        self.retry_in = retry_in
+
+
+@dataclass
+class CircuitState:
+    """
+    The state of a circuit.
+    """
+
+    state: str = field(default=CLOSED)
+    failures: int = field(default=0)
+    retry_in: float = field(default=0.0)
+
+
+@dataclass
+class _Circuit:
+    state: str = field(default=CLOSED)
+    failures: int = field(default=0)
+    retry_at: float = field(default=0.0)
+    probes: int = field(default=0)
+
+
+class CircuitBreaker:
+    """
+    A thread-safe circuit breaker, with one circuit per host and endpoint family
+    (e.g. "api.sofascore.com/event").
+
+    A circuit opens after `failure_threshold` consecutive failures and refuses
+    every request for `reset_timeout` seconds. It is then half-open: up to
+    `half_open_probes` requests are let through, closing the circuit if they
+    succeed or opening it again if they fail.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        per_host: bool = False,
+        failure_statuses: frozenset[int] = frozenset({403, 429}),
+    ) -> None:
+        """
+        Initializes the circuit breaker.
+
+        Args:
+            failure_threshold (int): The consecutive failures that open a circuit.
+            reset_timeout (float): Seconds a circuit stays open before probing.
+            half_open_probes (int): The requests let through while half-open.
+            per_host (bool): Whether to use one circuit per host instead of
+                one per endpoint family.
+            failure_statuses (frozenset[int]): The statuses below 500 counted as
+                failures (server errors and network errors always are).
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.per_host = per_host
+        self.failure_statuses = failure_statuses
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def key(self, url: str) -> str:
+        """
+        Get the circuit key of the given URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            str: The host, followed by the endpoint family unless `per_host`.
+        """
+        parts = urlsplit(url)
+        host = parts.netloc.lower()
+        if self.per_host:
+            return host
+        # skip the API prefix, e.g. "/api/v1/event/123" -> "event"
+        segments = [
+            segment
+            for segment in parts.path.split("/")
+            if segment and not re.fullmatch(r"api|v\d+", segment)
+        ]
+        return f"{host}/{segments[0]}" if segments else host
+
+    def before(self, url: str) -> str:
+        """
+        Check the circuit of a request before sending it.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            str: The circuit key, to report the outcome of the request.
+
+        Raises:
+            CircuitOpenError: If the circuit refuses the request.
+        """
+        key = self.key(url)
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state == CLOSED:
+                return key
+            now = time.monotonic()
+            if circuit.state == OPEN and now >= circuit.retry_at:
+                circuit.state = HALF_OPEN
+                circuit.probes = 0
+            if circuit.state == HALF_OPEN and circuit.probes < self.half_open_probes:
+                circuit.probes += 1
+                return key
+            raise CircuitOpenError(key, max(0.0, circuit.retry_at - now))
+
+    def success(self, key: str) -> None:
+        """
+        Report a successful request, closing its circuit.
+
+        Args:
+            key (str): The circuit key.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.probes = 0
+
+    def failure(self, key: str) -> None:
+        """
+        Report a failed request, opening its circuit if needed.
+
+        Args:
+            key (str): The circuit key.
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.retry_at = time.monotonic() + self.reset_timeout
+                circuit.probes = 0
+
+    def record(self, key: str, status: int | None) -> None:
+        """
+        Report the status of a request.
+
+        Args:
+            key (str): The circuit key.
+            status (int | None): The HTTP status (or the error code embedded in
+                it), None if the request ended without an outcome of the source
+                (e.g. stopped by a local rate limit), leaving the circuit as is.
+        """
+        if status is None:
+            self._release(key)
+        elif status >= 500 or status in self.failure_statuses:
+            self.failure(key)
+        else:
+            self.success(key)
+
+    def _release(self, key: str) -> None:
+        # give a half-open probe back, for a request without an outcome
+        with self._lock:
+            circuit = self._circuits[key]
+            circuit.probes = max(0, circuit.probes - 1)
+
+    @contextmanager
+    def guard(self, url: str) -> Iterator[Callable[[int | None], None]]:
+        """
+        Guard a request: refuse it if its circuit is open, count it as a failure
+        if it raises, and report the status given to the yielded callback.
+
+        Args:
+            url (str): The request URL.
+
+        Yields:
+            Callable[[int | None], None]: The callback receiving the response
+                status (see record).
+
+        Raises:
+            CircuitOpenError: If the circuit refuses the request.
+        """
+        key = self.before(url)
+        try:
+            yield lambda status: self.record(key, status)
+        except Exception:
+            self.failure(key)
+            raise
+        except BaseException:
+            # cancelled: give the half-open probe back
+            self._release(key)
+            raise
+
+    @property
+    def states(self) -> dict[str, CircuitState]:
+        """
+        Get a snapshot of the state of every circuit.
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {
+                key: CircuitState(
+                    state=(
+                        HALF_OPEN
+                        if circuit.state == OPEN and now >= circuit.retry_at
+                        else circuit.state
+                    ),
+                    failures=circuit.failures,
+                    retry_in=(
+                        max(0.0, circuit.retry_at - now)
+                        if circuit.state == OPEN
+                        else 0.0
+                    ),
+                )
+                for key, circuit in self._circuits.items()
+            }
+
+    def reset(self) -> None:
+        """
+        Close every circuit.
+        """
+        with self._lock:
+            self._circuits.clear()
@@ -0,0 +1,467 @@
+"""
+This module contains the response caches shared by the services.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .decoder import dumps, loads
+
+
+@dataclass
+class CacheStats:
+    """
+    Cache counters.
+    """
+
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+    evictions: int = field(default=0)
+    size: int = field(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the ratio of lookups served from the cache.
+
+        Returns:
+            float: The hit rate, between 0 and 1.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTLCache:
+    """
+    A thread-safe LRU cache whose entries expire after a per-entry time to live.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            max_size (int): The maximum number of entries kept.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any | None: The value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                # kept (until evicted) so it can still be served stale
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def get_stale(self, key: str) -> Any | None:
+        """
+        Get a cached value, even if expired (e.g. when the source is unavailable).
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any | None: The value, or None if missing or evicted.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry is not None else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to store.
+            ttl (float): Seconds the value stays valid.
+        """
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key (str): The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove every value from the cache.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Get a snapshot of the cache counters.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+
+class ParseMemo:
+    """
+    A thread-safe LRU memo of parsed payloads.
+
+    A parsed result is reused as long as it is asked for the very same payload
+    objects, which is the case when the transport answers a revalidated request
+    with the payload it already had (304 Not Modified) or a cache serves it.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        """
+        Initializes the memo.
+
+        Args:
+            max_size (int): The maximum number of parsed results kept.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[tuple, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(self, key: str, parse: Callable[..., Any], *payloads: Any) -> Any:
+        """
+        Parse the given payloads, or reuse the result of the last identical call.
+
+        Args:
+            key (str): The memo key (e.g. the request URL).
+            parse (Callable[..., Any]): The parser, called with the payloads.
+            *payloads (Any): The decoded responses.
+
+        Returns:
+            Any: The parsed result.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and len(entry[0]) == len(payloads):
+                if all(old is new for old, new in zip(entry[0], payloads)):
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[1]
+            self._misses += 1
+        parsed = parse(*payloads)
+        with self._lock:
+            self._entries[key] = (payloads, parsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return parsed
+
+    def clear(self) -> None:
+        """
+        Remove every parsed result.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Get a snapshot of the memo counters.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
+
+
+class IdentityMap:
+    """
+    A thread-safe LRU map of parsed entities (teams, tournaments...) by id.
+
+    While a map is active (see `activate`), an entity parsed again from the
+    same data is shared instead of rebuilt, e.g. a tournament repeated
+    across the events of a list. Shared entities must not be modified.
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        """
+        Initializes the identity map.
+
+        Args:
+            max_size (int): The maximum number of entities kept.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, Any], tuple[dict, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, data: dict, parse: Callable[[dict], Any]) -> Any:
+        """
+        Get the entity of the given data, parsing it unless it is known.
+
+        Args:
+            kind (str): The entity kind (e.g. "team").
+            data (dict): The entity data, with its "id".
+            parse (Callable[[dict], Any]): The entity parser.
+
+        Returns:
+            Any: The shared entity.
+        """
+        key = (kind, data.get("id"))
+        if key[1] is None:
+            return parse(data)
+        with self._lock:
+            entry = self._entries.get(key)
+            # the same id may come with more or updated fields
+            if entry is not None and entry[0] == data:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+        entity = parse(data)
+        with self._lock:
+            self._entries[key] = (data, entity)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entity
+
+    @contextmanager
+    def activate(self) -> Iterator[IdentityMap]:
+        """
+        Share the entities parsed in the current context through this map.
+
+        Yields:
+            IdentityMap: The identity map.
+        """
+        token = _identity_map.set(self)
+        try:
+            yield self
+        finally:
+            _identity_map.reset(token)
+
+    def clear(self) -> None:
+        """
+        Remove every entity.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Get a snapshot of the identity map counters.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
+
+
+_identity_map: ContextVar[IdentityMap | None] = ContextVar("identity_map", default=None)
+
+
+def active_identity_map() -> IdentityMap | None:
+    """
+    Get the identity map active in the current context.
+
+    Returns:
+        IdentityMap | None: The active identity map, if any.
+    """
+    return _identity_map.get()
+
+
+def interned(kind: str, data: dict, parse: Callable[[dict], Any]) -> Any:
+    """
+    Parse an entity, sharing it through the active identity map if any.
+
+    Args:
+        kind (str): The entity kind (e.g. "team").
+        data (dict): The entity data, with its "id".
+        parse (Callable[[dict], Any]): The entity parser.
+
+    Returns:
+        Any: The parsed entity.
+    """
+    identity_map = _identity_map.get()
+    if identity_map is None:
+        return parse(data)
+    return identity_map.get(kind, data, parse)
+
+
+class DiskCache:
+    """
+    A persistent cache of compressed JSON payloads backed by SQLite.
+
+    Entries never expire; they can be tagged (e.g. with an event id)
+    so every entry of a tag can be invalidated at once.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the disk cache, creating the database if needed.
+
+        Args:
+            path (str): The SQLite database path.
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            # WAL lets several processes share the same cache file
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, tag INTEGER, payload BLOB, created_at REAL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_tag ON responses (tag)"
+            )
+
+    def __enter__(self) -> DiskCache:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()[0]
+
+    def get(self, key: str) -> Any | None:
+        """
+        Get a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any | None: The value, or None if missing.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return loads(zlib.decompress(row[0]))
+
+    def set(self, key: str, value: Any, tag: int | None = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The JSON serializable value to store.
+            tag (int | None): The tag used to invalidate related entries.
+        """
+        payload = zlib.compress(dumps(value))
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, tag, payload, time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value from the cache.
+
+        Args:
+            key (str): The cache key.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def delete_tag(self, tag: int) -> None:
+        """
+        Remove every value stored with the given tag.
+
+        Args:
+            tag (int): The tag.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses WHERE tag = ?", (tag,))
+
+    def clear(self) -> None:
+        """
+        Remove every value from the cache.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Get a snapshot of the cache counters.
+        """
+        size = len(self)
+        with self._lock:
+            return CacheStats(hits=self._hits, misses=self._misses, size=size)
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
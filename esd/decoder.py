@@ -0,0 +1,66 @@
+"""
+This module contains the JSON backend used to decode the responses.
+
+The fastest available backend is picked at import: orjson, then msgspec,
+falling back to the standard library. Install one with
+`pip install EasySoccerData[fast]`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+if orjson is not None:
+    BACKEND = "orjson"
+    _loads: Callable[[bytes | str], Any] = orjson.loads
+    _dumps: Callable[[Any], bytes] = orjson.dumps
+elif msgspec is not None:
+    BACKEND = "msgspec"
+    _loads = msgspec.json.decode
+    _dumps = msgspec.json.encode
+else:
+    BACKEND = "json"
+    _loads = json.loads
+    _dumps = _stdlib_dumps
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Decode a JSON document, straight from the response bytes when possible.
+
+    Args:
+        data (bytes | str): The JSON document.
+
+    Returns:
+        Any: The decoded value.
+    """
+    return _loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode a value as compact JSON.
+
+    Args:
+        value (Any): The JSON serializable value.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    return _dumps(value)
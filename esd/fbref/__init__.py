@@ -3,7 +3,8 @@ FBref client module.
 """
 
 from . import types
+from .async_client import AsyncFBrefClient
 from .client import FBrefClient
 from .types import Match, MatchDetails
 
-__all__ = ["FBrefClient", "types", "Match", "MatchDetails"]
+__all__ = ["FBrefClient", "AsyncFBrefClient", "types", "Match", "MatchDetails"]
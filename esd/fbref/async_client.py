@@ -0,0 +1,130 @@
+"""
+This module contains the asyncio client class for interacting with the FBref website.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from ..breaker import CircuitBreaker, CircuitState
+from ..proxy import ProxyPool, ProxyStats
+from ..retry import RetryPolicy, RetryStats
+from ..transport import AsyncTransport
+from .async_service import AsyncFBrefService
+from .types import Match, MatchDetails
+
+
+class AsyncFBrefClient:
+    """
+    A class to represent the asyncio client for interacting with the FBref website.
+    It provides the same methods as `FBrefClient`, as coroutines.
+    """
+
+    def __init__(
+        self,
+        language: str = "en",
+        proxies: dict = None,
+        pool_size: int = 10,
+        max_concurrency: int = 50,
+        wait_on_rate_limit: bool = True,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: bool | CircuitBreaker = False,
+        proxy_pool: ProxyPool | Iterable[str] | None = None,
+    ) -> None:
+        """
+        Initializes the async FBref client.
+
+        Args:
+            language (str): The website language.
+            proxies (dict): The proxy settings.
+            pool_size (int): The maximum number of pooled connections.
+            max_concurrency (int): The maximum number of requests in flight.
+            wait_on_rate_limit (bool): Whether to wait until the FBref rate limit
+                (shared by every client) allows a request, instead of raising
+                `RateLimitExceeded`.
+            retry (RetryPolicy | None): The policy used to retry transient failures
+                (timeouts, 5xx, 429...), the default one if None.
+            circuit_breaker (bool | CircuitBreaker): Whether to stop sending requests
+                to a failing source for a while, or the circuit breaker to use
+                (e.g. to tune its thresholds or share it between clients).
+            proxy_pool (ProxyPool | Iterable[str] | None): The proxies (or the proxy
+                pool) every request is rotated through, scored and evicted on their
+                latency and block rates.
+        """
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        if not isinstance(circuit_breaker, CircuitBreaker):
+            circuit_breaker = None
+        if proxy_pool is not None and not isinstance(proxy_pool, ProxyPool):
+            proxy_pool = ProxyPool(proxy_pool)
+        self.__transport = AsyncTransport(
+            pool_size=pool_size,
+            max_concurrency=max_concurrency,
+            retry=retry,
+            breaker=circuit_breaker,
+            proxy_pool=proxy_pool,
+        )
+        self.__service = AsyncFBrefService(
+            language=language,
+            proxies=proxies,
+            transport=self.__transport,
+            wait_on_rate_limit=wait_on_rate_limit,
+        )
+
+    async def __aenter__(self) -> AsyncFBrefClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the client and release its pooled connections.
+        """
+        await self.__transport.close()
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get the retry counters, to tune the retry policy.
+        """
+        return self.__transport.retry_stats
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Get the state of the circuits (e.g. "fbref.com/en"),
+        empty if the circuit breaker is disabled.
+        """
+        return self.__transport.circuit_states
+
+    @property
+    def proxy_stats(self) -> list[ProxyStats]:
+        """
+        Get the health of every proxy, best first (empty without proxy pool).
+        """
+        return self.__transport.proxy_stats
+
+    async def get_matchs(self, date: str = None) -> list[Match]:
+        """
+        Get the scheduled matchs.
+
+        Args:
+            date (str): The date of the matchs in the format "YYYY-MM-DD".
+
+        Returns:
+            list[Match]: The scheduled matchs.
+        """
+        return await self.__service.get_matchs(date)
+
+    async def get_match_details(self, match_id: str) -> MatchDetails:
+        """
+        Get the match report.
+
+        Args:
+            match_id (str): The match id.
+
+        Returns:
+            MatchDetails: The match details.
+        """
+        return await self.__service.get_match_details(match_id)
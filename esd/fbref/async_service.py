@@ -0,0 +1,88 @@
+"""
+FBref async service module.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+from ..transport import AsyncTransport
+from ..utils import get_today
+from .endpoints import FBrefEndpoints
+from .exceptions import InvalidMatchId
+from .types import Match, MatchDetails, parse_match_details, parse_matchs
+from .utils import RateLimiter, rate_limiter
+
+
+class AsyncFBrefService:
+    """
+    A class to represent the FBref service using asyncio.
+    """
+
+    def __init__(
+        self,
+        language: str = "en",
+        proxies: dict = None,
+        transport: AsyncTransport | None = None,
+        limiter: RateLimiter | None = None,
+        wait_on_rate_limit: bool = True,
+    ) -> None:
+        """
+        Initializes the async FBref service.
+        """
+        self.proxies: dict = proxies or None
+        self.transport: AsyncTransport = transport or AsyncTransport()
+        self.limiter: RateLimiter = limiter or rate_limiter
+        self.wait_on_rate_limit = wait_on_rate_limit
+        self.endpoints: FBrefEndpoints = FBrefEndpoints(language=language)
+
+    async def get_matchs(self, date: str = None) -> list[Match]:
+        """
+        Get the scheduled matchs.
+
+        Args:
+            date (str): The date of the matchs in the format "YYYY-MM-DD".
+
+        Returns:
+            list[Match]: The scheduled
+        """
+        try:
+            if not date:
+                date = get_today()
+            url = self.endpoints.matchs_endpoint.format(date=date)
+            acquire = partial(self.limiter.acquire_async, url, self.wait_on_rate_limit)
+            await acquire()
+            # every retry of the request takes a token too
+            document = await self.transport.get_document(
+                url, self.proxies, before_retry=acquire
+            )
+            return parse_matchs(document)
+        except Exception as exc:
+            raise exc
+
+    async def get_match_details(self, match_id: str) -> MatchDetails:
+        """
+        Get the match details.
+
+        Args:
+            match_id (str): The match id.
+
+        Returns:
+            MatchDetails: The match details.
+
+        Raises:
+            InvalidMatchId: If the match id is invalid.
+        """
+        if "matches" not in match_id:
+            raise InvalidMatchId(match_id)
+        try:
+            url = self.endpoints.match_details_endpoint.format(match_id=match_id)
+            acquire = partial(self.limiter.acquire_async, url, self.wait_on_rate_limit)
+            await acquire()
+            # every retry of the request takes a token too
+            document = await self.transport.get_document(
+                url, self.proxies, before_retry=acquire
+            )
+            return parse_match_details(document)
+        except Exception as exc:
+            raise exc
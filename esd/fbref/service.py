@@ -4,11 +4,14 @@ FBref service module.
 
 from __future__ import annotations
 
-from ..utils import get_document, get_today
+from functools import partial
+
+from ..transport import Transport
+from ..utils import get_today
 from .endpoints import FBrefEndpoints
 from .exceptions import InvalidMatchId
 from .types import Match, MatchDetails, parse_match_details, parse_matchs
-from .utils import rate_limit
+from .utils import RateLimiter, rate_limiter
 
 
 class FBrefService:
@@ -16,14 +19,23 @@ class FBrefService:
     A class to represent the FBref service.
     """
 
-    def __init__(self, language: str = "en", proxies: dict = None) -> None:
+    def __init__(
+        self,
+        language: str = "en",
+        proxies: dict = None,
+        transport: Transport | None = None,
+        limiter: RateLimiter | None = None,
+        wait_on_rate_limit: bool = True,
+    ) -> None:
         """
         Initializes the FBref service.
         """
         self.proxies: dict = proxies or None
+        self.transport: Transport = transport or Transport()
+        self.limiter: RateLimiter = limiter or rate_limiter
+        self.wait_on_rate_limit = wait_on_rate_limit
         self.endpoints: FBrefEndpoints = FBrefEndpoints(language=language)
 
-    @rate_limit(calls=9, period=60)
     def get_matchs(self, date: str = None) -> list[Match]:
         """
         Get the scheduled matchs.
@@ -38,12 +50,16 @@ class FBrefService:
             if not date:
                 date = get_today()
             url = self.endpoints.matchs_endpoint.format(date=date)
-            document = get_document(self.proxies, url)
+            acquire = partial(self.limiter.acquire, url, self.wait_on_rate_limit)
+            acquire()
+            # every retry of the request takes a token too
+            document = self.transport.get_document(
+                url, self.proxies, before_retry=acquire
+            )
             return parse_matchs(document)
         except Exception as exc:
             raise exc
 
-    @rate_limit(calls=9, period=60)
     def get_match_details(self, match_id: str) -> MatchDetails:
         """
         Get the match details.
@@ -61,7 +77,12 @@ class FBrefService:
             raise InvalidMatchId(match_id)
         try:
             url = self.endpoints.match_details_endpoint.format(match_id=match_id)
-            document = get_document(self.proxies, url)
+            acquire = partial(self.limiter.acquire, url, self.wait_on_rate_limit)
+            acquire()
+            # every retry of the request takes a token too
+            document = self.transport.get_document(
+                url, self.proxies, before_retry=acquire
+            )
             return parse_match_details(document)
         except Exception as exc:
             raise exc
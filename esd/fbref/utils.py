@@ -4,44 +4,157 @@ FBref service module.
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
-from collections import deque
-from functools import wraps
+from urllib.parse import urlsplit
 
 from .exceptions import RateLimitExceeded
 
 
-def rate_limit(calls: int = 8, period: int = 60) -> callable:
+class TokenBucket:
     """
-    A decorator to rate limit the number of calls to a function.
+    A thread-safe token bucket.
 
-    Args:
-        calls (int): The number of allowed calls.
-        period (int): The time period in seconds.
+    Tokens are refilled continuously at `calls / period` per second, up to `calls`.
+    Each acquired token is reserved immediately, so the callers that wait for a
+    token are served in order at the maximum sustainable rate.
+    """
+
+    def __init__(self, calls: int = 9, period: float = 60) -> None:
+        """
+        Initializes the token bucket, full.
+
+        Args:
+            calls (int): The number of allowed calls (the bucket capacity).
+            period (float): The time period in seconds.
+        """
+        self.calls = calls
+        self.period = period
+        self._rate = calls / period
+        self._tokens = float(calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, block: bool) -> float:
+        """
+        Reserve a token.
+
+        Args:
+            block (bool): Whether to reserve a token that is not available yet.
+
+        Returns:
+            float: The seconds to wait before the token can be used.
+
+        Raises:
+            RateLimitExceeded: If no token is available and block is False.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.calls, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens < 1 and not block:
+                raise RateLimitExceeded(
+                    f"Please wait {(1 - self._tokens) / self._rate:.2f} seconds "
+                    "before retrying. Attempting to bypass? Use proxies."
+                )
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self._rate)
+
+    def acquire(self, block: bool = True) -> None:
+        """
+        Acquire a token, sleeping until it is available.
+
+        Args:
+            block (bool): Whether to wait for a token instead of raising.
+
+        Raises:
+            RateLimitExceeded: If no token is available and block is False.
+        """
+        delay = self._reserve(block)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, block: bool = True) -> None:
+        """
+        Acquire a token, awaiting until it is available.
+
+        Args:
+            block (bool): Whether to wait for a token instead of raising.
+
+        Raises:
+            RateLimitExceeded: If no token is available and block is False.
+        """
+        delay = self._reserve(block)
+        if delay:
+            await asyncio.sleep(delay)
 
-    Returns:
-        callable: The decorator.
+
+class RateLimiter:
+    """
+    A set of token buckets, one per host.
     """
 
-    def decorator(func: callable) -> callable:
-        timestamps = deque(maxlen=calls)
+    def __init__(self, calls: int = 9, period: float = 60) -> None:
+        """
+        Initializes the rate limiter.
+
+        Args:
+            calls (int): The number of allowed calls per host.
+            period (float): The time period in seconds.
+        """
+        self.calls = calls
+        self.period = period
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        """
+        Get the token bucket of the host of the given URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            TokenBucket: The host token bucket.
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.calls, self.period)
+            return bucket
 
-        @wraps(func)
-        def wrapper(*args, **kwargs) -> any:
-            current_time = time.time()
-            if len(timestamps) == calls:
-                oldest = timestamps[0]
-                elapsed = current_time - oldest
-                if elapsed < period:
-                    sleep_time = period - elapsed
-                    raise RateLimitExceeded(
-                        f"Please wait {sleep_time:.2f} seconds before retrying. "
-                        "Attempting to bypass? Use proxies."
-                    )
+    def acquire(self, url: str, block: bool = True) -> None:
+        """
+        Acquire a token for the host of the given URL.
 
-            timestamps.append(time.time())
-            return func(*args, **kwargs)
+        Args:
+            url (str): The request URL.
+            block (bool): Whether to wait for a token instead of raising.
 
-        return wrapper
+        Raises:
+            RateLimitExceeded: If no token is available and block is False.
+        """
+        self.bucket(url).acquire(block)
 
-    return decorator
+    async def acquire_async(self, url: str, block: bool = True) -> None:
+        """
+        Acquire a token for the host of the given URL, awaiting if needed.
+
+        Args:
+            url (str): The request URL.
+            block (bool): Whether to wait for a token instead of raising.
+
+        Raises:
+            RateLimitExceeded: If no token is available and block is False.
+        """
+        await self.bucket(url).acquire_async(block)
+
+
+rate_limiter = RateLimiter(calls=9, period=60)
+"""
+The rate limiter shared by every FBref client, as the limit applies per IP.
+"""
@@ -3,6 +3,7 @@ Promiedos module.
 """
 
 from . import types
+from .async_client import AsyncPromiedosClient
 from .client import PromiedosClient
 from .types import (
     Color,
@@ -33,6 +34,7 @@ from .types import (
 
 __all__ = [
     "PromiedosClient",
+    "AsyncPromiedosClient",
     "types",
     "Color",
     "Event",
@@ -0,0 +1,156 @@
+"""
+This module contains the asyncio client class for interacting with the Promiedos.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from ..breaker import CircuitBreaker, CircuitState
+from ..proxy import ProxyPool, ProxyStats
+from ..retry import RetryPolicy, RetryStats
+from ..transport import AsyncTransport
+from .async_service import AsyncPromiedosService
+from .exceptions import NotMatchIdProvided
+from .types import Event, Match, Tournament
+
+
+class AsyncPromiedosClient:
+    """
+    Asyncio client for interacting with the Promiedos website.
+    It provides the same methods as `PromiedosClient`, as coroutines.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_concurrency: int = 50,
+        revalidate: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: bool | CircuitBreaker = False,
+        proxy_pool: ProxyPool | Iterable[str] | None = None,
+    ) -> None:
+        """
+        Initializes the async Promiedos client.
+
+        Args:
+            pool_size (int): The maximum number of pooled connections.
+            max_concurrency (int): The maximum number of requests in flight.
+            revalidate (bool): Whether to revalidate repeated requests with their
+                ETag / Last-Modified validators. A 304 Not Modified response reuses
+                the last payload.
+            retry (RetryPolicy | None): The policy used to retry transient failures
+                (timeouts, 5xx, 429...), the default one if None.
+            circuit_breaker (bool | CircuitBreaker): Whether to stop sending requests
+                to a failing source for a while, or the circuit breaker to use
+                (e.g. to tune its thresholds or share it between clients).
+            proxy_pool (ProxyPool | Iterable[str] | None): The proxies (or the proxy
+                pool) every request is rotated through, scored and evicted on their
+                latency and block rates.
+        """
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        if not isinstance(circuit_breaker, CircuitBreaker):
+            circuit_breaker = None
+        if proxy_pool is not None and not isinstance(proxy_pool, ProxyPool):
+            proxy_pool = ProxyPool(proxy_pool)
+        self.__transport = AsyncTransport(
+            pool_size=pool_size,
+            max_concurrency=max_concurrency,
+            revalidate=revalidate,
+            retry=retry,
+            breaker=circuit_breaker,
+            proxy_pool=proxy_pool,
+        )
+        self.__service = AsyncPromiedosService(self.__transport)
+
+    async def __aenter__(self) -> AsyncPromiedosClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the client and release its pooled connections.
+        """
+        await self.__transport.close()
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get the retry counters, to tune the retry policy.
+        """
+        return self.__transport.retry_stats
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Get the state of the circuits (e.g. "api.promiedos.com.ar/games"),
+        empty if the circuit breaker is disabled.
+        """
+        return self.__transport.circuit_states
+
+    @property
+    def proxy_stats(self) -> list[ProxyStats]:
+        """
+        Get the health of every proxy, best first (empty without proxy pool).
+        """
+        return self.__transport.proxy_stats
+
+    async def get_events(self, date: str = "today") -> list[Event]:
+        """
+        Get the events for the given date.
+
+        Args:
+            date (str): The date to get the events. Defaults to "today".
+
+        Returns:
+            list[Event]: The events for the given date.
+        """
+        return await self.__service.get_events(date)
+
+    async def get_match(self, match_id: str = None, match: Match = None) -> Match:
+        """
+        Get the match for the given slug and match ID.
+
+        Args:
+            match_id (str): The match ID. E.g. "ediecji".
+            Match (Match): The match object.
+
+        Returns:
+            Match: The match for the given slug and match ID.
+        """
+        if not match_id and not match:
+            raise NotMatchIdProvided(
+                "No match ID provided OR no match object provided."
+            )
+        if match:
+            return await self.__service.get_match(match.id)
+        return await self.__service.get_match(match_id)
+
+    async def get_tournament(self, tournament_id: str) -> Tournament:
+        """
+        Get the matches for the given tournament ID.
+
+        Args:
+            tournament_id (str): The tournament ID. E.g. "hc".
+
+        Returns:
+            Tournament: The tournament for the given tournament ID.
+        """
+        return await self.__service.get_tournament(tournament_id)
+
+    async def get_tournament_matchs(
+        self, tournament_id: str, stage_id: str = None
+    ) -> list[Match]:
+        """
+        Get the matches for the given tournament ID using the stage ID.
+
+        Args:
+            tournament_id (str): The tournament ID. E.g. "hc".
+            stage_id (str): The stage ID.
+        Returns:
+            list[Match]: The matches for the given tournament ID.
+        """
+        return await self.__service.get_tournament_matchs(tournament_id, stage_id)
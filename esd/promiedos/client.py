@@ -4,6 +4,12 @@ This module contains the client class for interacting with the Promiedos.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+from ..breaker import CircuitBreaker, CircuitState
+from ..proxy import ProxyPool, ProxyStats
+from ..retry import RetryPolicy, RetryStats
+from ..transport import Transport
 from .exceptions import NotMatchIdProvided
 from .service import PromiedosService
 from .types import Event, Match, Tournament
@@ -15,11 +21,79 @@ class PromiedosClient:
     This class provides methods to access and retrieve data from Promiedos.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        pool_size: int = 10,
+        revalidate: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: bool | CircuitBreaker = False,
+        proxy_pool: ProxyPool | Iterable[str] | None = None,
+    ) -> None:
         """
         Initializes the Promiedos client.
+
+        Args:
+            pool_size (int): The maximum number of pooled connections.
+            revalidate (bool): Whether to revalidate repeated requests with their
+                ETag / Last-Modified validators. A 304 Not Modified response reuses
+                the last payload.
+            retry (RetryPolicy | None): The policy used to retry transient failures
+                (timeouts, 5xx, 429...), the default one if None.
+            circuit_breaker (bool | CircuitBreaker): Whether to stop sending requests
+                to a failing source for a while, or the circuit breaker to use
+                (e.g. to tune its thresholds or share it between clients).
+            proxy_pool (ProxyPool | Iterable[str] | None): The proxies (or the proxy
+                pool) every request is rotated through, scored and evicted on their
+                latency and block rates.
+        """
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        if not isinstance(circuit_breaker, CircuitBreaker):
+            circuit_breaker = None
+        if proxy_pool is not None and not isinstance(proxy_pool, ProxyPool):
+            proxy_pool = ProxyPool(proxy_pool)
+        self.__transport = Transport(
+            pool_size=pool_size,
+            revalidate=revalidate,
+            retry=retry,
+            breaker=circuit_breaker,
+            proxy_pool=proxy_pool,
+        )
+        self.__service = PromiedosService(self.__transport)
+
+    def __enter__(self) -> PromiedosClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the client and release its pooled connections.
+        """
+        self.__transport.close()
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get the retry counters, to tune the retry policy.
+        """
+        return self.__transport.retry_stats
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Get the state of the circuits (e.g. "api.promiedos.com.ar/games"),
+        empty if the circuit breaker is disabled.
+        """
+        return self.__transport.circuit_states
+
+    @property
+    def proxy_stats(self) -> list[ProxyStats]:
+        """
+        Get the health of every proxy, best first (empty without proxy pool).
         """
-        self.__service = PromiedosService()
+        return self.__transport.proxy_stats
 
     def get_events(self, date: str = "today") -> list[Event]:
         """
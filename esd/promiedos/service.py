@@ -4,7 +4,8 @@ Promiedos service module.
 
 from __future__ import annotations
 
-from ..utils import get_api_json, is_available_date
+from ..transport import Transport
+from ..utils import is_available_date
 from .endpoints import PromiedosEndpoints
 from .exceptions import InvalidDate
 from .types import (
@@ -27,11 +28,15 @@ class PromiedosService:
     A class to represent the Promiedos service.
     """
 
-    def __init__(self):
+    def __init__(self, transport: Transport | None = None) -> None:
         """
         Initializes the Promiedos service.
+
+        Args:
+            transport (Transport | None): The pooled transport to use.
         """
         self.endpoints = PromiedosEndpoints()
+        self.transport = transport or Transport()
 
     def get_events(self, date: str = "today") -> list[Event]:
         """
@@ -53,7 +58,8 @@ class PromiedosService:
                 ) from exc
         try:
             url = self.endpoints.events_endpoint.format(date=date)
-            data = get_api_json(url, headers=_PROMIEDOS_HEADERS)["leagues"]
+            data = self.transport.get_api_json(url, headers=_PROMIEDOS_HEADERS)
+            data = data["leagues"]
             return parse_events(date, data)
         except Exception as exc:
             raise exc
@@ -70,7 +76,8 @@ class PromiedosService:
         """
         try:
             url = self.endpoints.match_endpoint.format(id=match_id)
-            data = get_api_json(url, headers=_PROMIEDOS_HEADERS)["game"]
+            data = self.transport.get_api_json(url, headers=_PROMIEDOS_HEADERS)
+            data = data["game"]
             match = parse_match(data)
             match.league = parse_league(data["league"])
             if data.get("statistics"):
@@ -92,7 +99,7 @@ class PromiedosService:
         """
         try:
             url = self.endpoints.tournament_endpoint.format(id=tournament_id)
-            data = get_api_json(url, headers=_PROMIEDOS_HEADERS)
+            data = self.transport.get_api_json(url, headers=_PROMIEDOS_HEADERS)
             return parse_tournament(data)
         except Exception as exc:
             raise exc
@@ -114,7 +121,8 @@ class PromiedosService:
             url = self.endpoints.tournament_matchs_endpoint.format(
                 id=tournament_id, stage_id=stage_id
             )
-            data = get_api_json(url, headers=_PROMIEDOS_HEADERS)["games"]
+            data = self.transport.get_api_json(url, headers=_PROMIEDOS_HEADERS)
+            data = data["games"]
             return [parse_match(match) for match in data]
         except Exception as exc:
             raise exc
@@ -0,0 +1,177 @@
+"""
+This module contains the retry policy shared by the transports.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+import httpx
+from curl_cffi.requests import exceptions as curl_exceptions
+
+RETRYABLE_ERRORS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+    curl_exceptions.Timeout,
+    curl_exceptions.ConnectionError,
+    curl_exceptions.ChunkedEncodingError,
+)
+"""
+The transient network errors (timeouts, connection resets...) that are retried.
+"""
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value (str | None): The header value, in seconds or as an HTTP date.
+
+    Returns:
+        float | None: The seconds to wait, or None if missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a request.
+
+    Network errors are retried up to `max_attempts` attempts; HTTP statuses
+    (including the error codes embedded in Sofascore responses) up to the
+    attempts given by `statuses`, the other statuses are never retried.
+    The n-th retry waits `backoff_factor * 2 ** (n - 1)` seconds (at most
+    `max_backoff`), shortened by a random `jitter` fraction, or what the
+    server asks through Retry-After.
+    """
+
+    max_attempts: int = field(default=3)
+    statuses: dict[int, int] = field(
+        default_factory=lambda: {429: 5, 500: 3, 502: 3, 503: 3, 504: 3}
+    )
+    backoff_factor: float = field(default=0.5)
+    max_backoff: float = field(default=30.0)
+    jitter: float = field(default=0.5)
+    respect_retry_after: bool = field(default=True)
+    max_retry_after: float = field(default=120.0)
+
+    def attempts(self, reason: int | str) -> int:
+        """
+        Get the maximum number of attempts for a failure.
+
+        Args:
+            reason (int | str): The HTTP status, or the network error name.
+
+        Returns:
+            int: The maximum number of attempts (1 means no retry).
+        """
+        if isinstance(reason, int):
+            return self.statuses.get(reason, 1)
+        return self.max_attempts
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """
+        Get the seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1.
+            retry_after (float | None): The delay asked by the server.
+
+        Returns:
+            float | None: The seconds to wait, or None if the server asks
+                to wait longer than `max_retry_after`.
+        """
+        if self.respect_retry_after and retry_after is not None:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return delay * (1 - random.uniform(0, self.jitter))
+
+
+@dataclass
+class RetryStats:
+    """
+    Retry counters.
+    """
+
+    retries: int = field(default=0)
+    give_ups: int = field(default=0)
+    wait_time: float = field(default=0.0)
+    reasons: dict[int | str, int] = field(default_factory=dict)
+
+
+class Retrier:
+    """
+    Applies a retry policy and counts the retries, thread-safely.
+    """
+
+    def __init__(self, policy: RetryPolicy | None = None) -> None:
+        """
+        Initializes the retrier.
+
+        Args:
+            policy (RetryPolicy | None): The retry policy, the default one if None.
+        """
+        self.policy = policy or RetryPolicy()
+        self._lock = threading.Lock()
+        self._stats = RetryStats()
+
+    def delay(
+        self, attempt: int, reason: int | str, retry_after: str | None = None
+    ) -> float | None:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1.
+            reason (int | str): The HTTP status, or the network error name.
+            retry_after (str | None): The Retry-After header of the response.
+
+        Returns:
+            float | None: The seconds to wait before retrying,
+                or None if the failure must not be retried.
+        """
+        attempts = self.policy.attempts(reason)
+        if attempts <= 1:
+            return None
+        delay = None
+        if attempt < attempts:
+            delay = self.policy.backoff(attempt, parse_retry_after(retry_after))
+        with self._lock:
+            if delay is None:
+                self._stats.give_ups += 1
+            else:
+                self._stats.retries += 1
+                self._stats.wait_time += delay
+                self._stats.reasons[reason] = self._stats.reasons.get(reason, 0) + 1
+        return delay
+
+    @property
+    def stats(self) -> RetryStats:
+        """
+        Get a snapshot of the retry counters.
+        """
+        with self._lock:
+            return RetryStats(
+                retries=self._stats.retries,
+                give_ups=self._stats.give_ups,
+                wait_time=self._stats.wait_time,
+                reasons=dict(self._stats.reasons),
+            )
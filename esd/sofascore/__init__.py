@@ -3,7 +3,21 @@ Sofascore client module.
 """
 
 from . import types
+from .async_client import AsyncSofascoreClient
+from .cache import SofascoreCache, SofascoreDiskCache
 from .client import SofascoreClient
+from .live import (
+    AsyncLivePoller,
+    AsyncMatchScheduler,
+    AsyncMatchTimeline,
+    EventChange,
+    LiveObserver,
+    LivePoller,
+    MatchScheduler,
+    MatchTimeline,
+    PollingPolicy,
+)
+from .server import LiveServer
 from .types import (
     Bracket,
     Category,
@@ -13,7 +27,9 @@ from .types import (
     Event,
     Incident,
     IncidentType,
+    LazyEvent,
     Lineups,
+    MatchBundle,
     MatchStats,
     Player,
     PlayerAttributes,
@@ -35,15 +51,30 @@ from .types import (
 
 __all__ = [
     "SofascoreClient",
+    "AsyncSofascoreClient",
+    "LivePoller",
+    "AsyncLivePoller",
+    "MatchScheduler",
+    "AsyncMatchScheduler",
+    "PollingPolicy",
+    "MatchTimeline",
+    "AsyncMatchTimeline",
+    "LiveObserver",
+    "LiveServer",
+    "EventChange",
+    "SofascoreCache",
+    "SofascoreDiskCache",
     "types",
     "EntityType",
     "Category",
     "Event",
+    "LazyEvent",
     "Player",
     "Team",
     "Tournament",
     "Season",
     "MatchStats",
+    "MatchBundle",
     "Lineups",
     "Status",
     "StatusType",
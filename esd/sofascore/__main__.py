@@ -0,0 +1,33 @@
+"""
+Runs the live server (see esd.sofascore.server):
+
+python -m esd.sofascore --port 8765
+"""
+
+import argparse
+
+from .server import LiveServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Fan out the Sofascore live events over Server-Sent Events."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--interval", type=float, default=10.0)
+    parser.add_argument("--no-incidents", action="store_true")
+    args = parser.parse_args()
+    server = LiveServer(
+        host=args.host,
+        port=args.port,
+        interval=args.interval,
+        incidents=not args.no_incidents,
+    )
+    host, port = server.address
+    print(f"Streaming the live events on http://{host}:{port}/events")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,564 @@
+"""
+This module contains the asyncio client class for interacting with the Sofascore API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from copy import copy
+
+from ..breaker import CircuitBreaker, CircuitState
+from ..cache import CacheStats, IdentityMap
+from ..proxy import ProxyPool, ProxyStats
+from ..retry import RetryPolicy, RetryStats
+from ..transport import AsyncTransport
+from .async_service import AsyncSofascoreService
+from .cache import SofascoreCache, SofascoreDiskCache
+from .types import (
+    Bracket,
+    Category,
+    Comment,
+    EntityType,
+    Event,
+    Incident,
+    Lineups,
+    MatchBundle,
+    MatchStats,
+    Player,
+    Season,
+    Shot,
+    Standing,
+    Team,
+    TopPlayersMatch,
+    TopTournamentPlayers,
+    TopTournamentTeams,
+    Tournament,
+)
+
+
+class AsyncSofascoreClient:
+    """
+    Asyncio client for interacting with the Sofascore website.
+    It provides the same methods as `SofascoreClient`, as coroutines.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_concurrency: int = 50,
+        cache: bool | SofascoreCache = False,
+        disk_cache: str | SofascoreDiskCache | None = None,
+        revalidate: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: bool | CircuitBreaker = False,
+        proxy_pool: ProxyPool | Iterable[str] | None = None,
+        lazy_events: bool = False,
+        identity_map: bool = False,
+    ) -> None:
+        """
+        Initializes the async Sofascore client.
+
+        Args:
+            pool_size (int): The maximum number of pooled connections.
+            max_concurrency (int): The maximum number of requests in flight.
+            cache (bool | SofascoreCache): Whether to cache the responses, or the
+                cache to use (e.g. to customize the time to live of each endpoint).
+            disk_cache (str | SofascoreDiskCache | None): The SQLite database path
+                (or the disk cache) used to persist the payloads of finished events.
+                A cache created from a path is closed with the client.
+            revalidate (bool): Whether to revalidate repeated requests with their
+                ETag / Last-Modified validators. A 304 Not Modified response reuses
+                the last payload and its parsed result.
+            retry (RetryPolicy | None): The policy used to retry transient failures
+                (timeouts, 5xx, 429...), the default one if None.
+            circuit_breaker (bool | CircuitBreaker): Whether to stop sending requests
+                to a failing source for a while, or the circuit breaker to use
+                (e.g. to tune its thresholds or share it between clients).
+            proxy_pool (ProxyPool | Iterable[str] | None): The proxies (or the proxy
+                pool) every request is rotated through, scored and evicted on their
+                latency and block rates.
+            lazy_events (bool): Whether the events of the lists (daily, live, team
+                and tournament events) parse their nested objects on first access,
+                which is cheaper when only a few attributes are read.
+            identity_map (bool): Whether to share the teams and tournaments parsed
+                again from the same data (e.g. the tournament of every event of a
+                list) instead of rebuilding them. Shared objects must not be
+                modified.
+        """
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        if not isinstance(circuit_breaker, CircuitBreaker):
+            circuit_breaker = None
+        if proxy_pool is not None and not isinstance(proxy_pool, ProxyPool):
+            proxy_pool = ProxyPool(proxy_pool)
+        self.__transport = AsyncTransport(
+            pool_size=pool_size,
+            max_concurrency=max_concurrency,
+            revalidate=revalidate,
+            retry=retry,
+            breaker=circuit_breaker,
+            proxy_pool=proxy_pool,
+        )
+        if cache is True:
+            cache = SofascoreCache()
+        self.__cache = cache if isinstance(cache, SofascoreCache) else None
+        self.__owns_disk_cache = isinstance(disk_cache, str)
+        if self.__owns_disk_cache:
+            disk_cache = SofascoreDiskCache(disk_cache)
+        self.__disk_cache = disk_cache
+        self.__service = AsyncSofascoreService(
+            self.__transport,
+            cache=self.__cache,
+            disk_cache=self.__disk_cache,
+            lazy_events=lazy_events,
+            identity_map=IdentityMap() if identity_map else None,
+        )
+
+    async def __aenter__(self) -> AsyncSofascoreClient:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the client and release its pooled connections.
+        """
+        await self.__transport.close()
+        if self.__owns_disk_cache:
+            self.__disk_cache.close()
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """
+        Get the response cache counters (hits, misses, evictions and size).
+        None if the cache is disabled.
+        """
+        if self.__cache is None:
+            return None
+        return self.__cache.stats
+
+    @property
+    def disk_cache_stats(self) -> CacheStats | None:
+        """
+        Get the disk cache counters (hits, misses and size).
+        None if the disk cache is disabled.
+        """
+        if self.__disk_cache is None:
+            return None
+        return self.__disk_cache.stats
+
+    @property
+    def identity_map_stats(self) -> CacheStats | None:
+        """
+        Get the identity map counters (hits, misses and size).
+        None if the identity map is disabled.
+        """
+        if self.__service.identity_map is None:
+            return None
+        return self.__service.identity_map.stats
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get the retry counters, to tune the retry policy.
+        """
+        return self.__transport.retry_stats
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Get the state of the circuits (e.g. "api.sofascore.com/event"),
+        empty if the circuit breaker is disabled.
+        """
+        return self.__transport.circuit_states
+
+    @property
+    def proxy_stats(self) -> list[ProxyStats]:
+        """
+        Get the health of every proxy, best first (empty without proxy pool).
+        """
+        return self.__transport.proxy_stats
+
+    async def get_events(
+        self, date: str = "today", live: bool = False, raw: bool = False
+    ) -> list[Event] | dict:
+        """
+        Get the scheduled events.
+
+        Args:
+            date (str): The date of the events in the format "YYYY-MM-DD" or "today".
+            live (bool): Whether to get the live events (more precise).
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Event]: The scheduled events.
+        """
+        if live:
+            return await self.__service.get_live_events(raw=raw)
+        return await self.__service.get_events(date, raw=raw)
+
+    async def get_event(self, event_id: int, raw: bool = False) -> Event | dict:
+        """
+        Get the event information.
+
+        Args:
+            event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            Event: The event information.
+        """
+        return await self.__service.get_event(event_id, raw=raw)
+
+    async def get_player(
+        self,
+        player_id: int,
+        include_attributes: bool = True,
+        include_transfers: bool = True,
+        raw: bool = False,
+    ) -> Player | dict:
+        """
+        Get the player information.
+
+        Args:
+            player_id (int): The player id.
+            include_attributes (bool): Whether to also fetch the player attributes.
+            include_transfers (bool): Whether to also fetch the transfer history.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            Player: The player information.
+        """
+        return await self.__service.get_player(
+            player_id, include_attributes, include_transfers, raw=raw
+        )
+
+    async def get_match_incidents(
+        self, event_id: int, raw: bool = False
+    ) -> list[Incident] | dict:
+        """
+        Get the events of a match.
+
+        Args:
+            event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Incident]: The match incidents.
+        """
+        return await self.__service.get_match_incidents(event_id, raw=raw)
+
+    async def get_match_top_players(
+        self, event_id: int, raw: bool = False
+    ) -> TopPlayersMatch | dict:
+        """
+        Get the top players of a match.
+
+        Args:
+            event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            TopPlayersMatch: The match top players.
+        """
+        return await self.__service.get_match_top_players(event_id, raw=raw)
+
+    async def get_match_comments(
+        self, event_id: int, raw: bool = False
+    ) -> list[Comment] | dict:
+        """
+        Get the comments of a match.
+
+        Args:
+            event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Comment]: The match comments.
+        """
+        return await self.__service.get_match_comments(event_id, raw=raw)
+
+    async def get_match_stats(
+        self, event_id: int, win_probability: bool = True, raw: bool = False
+    ) -> MatchStats | dict:
+        """
+        Get the match statistics by event id.
+
+        Args:
+            event_id (int): The event id (also known as match id).
+            win_probability (bool): Whether to also fetch the win probability.
+                Skipping it saves one request, leaving `win_probability` as None.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            MatchStats: The match statistics.
+        """
+        return await self.__service.get_match_stats(event_id, win_probability, raw=raw)
+
+    async def get_match_lineups(
+        self, event_id: int, raw: bool = False
+    ) -> Lineups | dict:
+        """
+        Get the match lineups.
+
+        Args:
+            event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            Lineups: The match lineups.
+        """
+        return await self.__service.get_match_lineups(event_id, raw=raw)
+
+    async def get_match_shots(
+        self, event_id: int, raw: bool = False
+    ) -> list[Shot] | dict:
+        """
+        Get the shots of a match.
+
+        Args:
+            event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Shot]: The match shots.
+        """
+        return await self.__service.get_match_shots(event_id, raw=raw)
+
+    async def get_match_bundle(
+        self, event_id: int, include: Iterable[str] | None = None, raw: bool = False
+    ) -> MatchBundle | dict:
+        """
+        Get every per-match resource in one call, fetching them concurrently.
+
+        Args:
+            event_id (int): The event id.
+            include (Iterable[str] | None): The parts to fetch, any of "event",
+                "stats", "lineups", "incidents", "shots", "comments" and
+                "top_players". Defaults to None (all of them).
+            raw (bool): Whether to return the JSON responses by part,
+                skipping the parsing.
+
+        Returns:
+            MatchBundle: The match bundle.
+        """
+        return await self.__service.get_match_bundle(event_id, include, raw=raw)
+
+    async def get_team(
+        self, team_id: int, include_players: bool = True, raw: bool = False
+    ) -> Team | dict:
+        """
+        Get detailed information about a team.
+
+        Args:
+            team_id (int): The team id.
+            include_players (bool): Whether to also fetch the team players.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            TeamEx: The team information.
+        """
+        if not include_players:
+            return await self.__service.get_team(team_id, raw=raw)
+        team, players = await asyncio.gather(
+            self.__service.get_team(team_id, raw=raw),
+            self.__service.get_team_players(team_id, raw=raw),
+        )
+        if raw:
+            return {**team, **players}
+        # the parsed team may be shared with other callers, so fill a copy
+        team = copy(team)
+        team.players = players
+        return team
+
+    async def get_team_players(
+        self, team_id: int, raw: bool = False
+    ) -> list[Player] | dict:
+        """
+        Get the players of a team.
+
+        Args:
+            team_id (int): The team id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Player]: The players of the team.
+        """
+        return await self.__service.get_team_players(team_id, raw=raw)
+
+    async def get_team_events(
+        self, team_id: int, upcoming: bool = False, page: int = 0, raw: bool = False
+    ) -> list[Event] | dict:
+        """
+        Get the events (matchs) of a team.
+
+        Args:
+            team_id (int): The team id.
+            upcoming (bool): Whether to get the upcoming events.
+            page (int): The page number.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Event]: The events of the team.
+        """
+        return await self.__service.get_team_events(team_id, upcoming, page, raw=raw)
+
+    async def get_tournaments(
+        self, category_id: Category, raw: bool = False
+    ) -> list[Tournament] | dict:
+        """
+        Get the tournaments by category.
+        TODO: maybe add a argument to include seasons.
+
+        Args:
+            category_id (Category): The category id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Tournament]: The tournaments.
+        """
+        return await self.__service.get_tournaments_by_category(category_id, raw=raw)
+
+    async def get_tournament_seasons(
+        self, tournament_id: int, raw: bool = False
+    ) -> list[Season] | dict:
+        """
+        Get the seasons of a tournament.
+
+        Args:
+            tournament_id (int): The tournament id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Season]: The seasons of the tournament.
+        """
+        return await self.__service.get_tournament_seasons(tournament_id, raw=raw)
+
+    async def get_tournament_brackets(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> list[Bracket] | dict:
+        """
+        Get the tournament bracket.
+
+        Args:
+            tournament_id (int, Tournament): The tournament id.
+            season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Bracket]: The tournament bracket.
+        """
+        return await self.__service.get_tournament_bracket(
+            tournament_id, season_id, raw=raw
+        )
+
+    async def get_tournament_standings(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> list[Standing] | dict:
+        """
+        Get the tournament standings.
+
+        Args:
+            tournament_id (int, Tournament): The tournament id.
+            season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Standing]: The tournament standings.
+        """
+        return await self.__service.get_tournament_standings(
+            tournament_id, season_id, raw=raw
+        )
+
+    async def get_tournament_top_teams(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> TopTournamentTeams | dict:
+        """
+        Get the top teams of the tournament.
+
+        Args:
+            tournament_id (int, Tournament): The tournament id.
+            season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            TopTournamentTeams: The top teams of the tournament.
+        """
+        return await self.__service.get_tournament_top_teams(
+            tournament_id, season_id, raw=raw
+        )
+
+    async def get_tournament_top_players(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> TopTournamentPlayers | dict:
+        """
+        Get the top players of the tournament.
+
+        Args:
+            tournament_id (int, Tournament): The tournament id.
+            season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            TopTournamentPlayers: The top players of the tournament.
+        """
+        return await self.__service.get_tournament_top_players(
+            tournament_id, season_id, raw=raw
+        )
+
+    async def get_tournament_events(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        upcoming: bool = False,
+        page: int = 0,
+        raw: bool = False,
+    ) -> list[Event] | dict:
+        """
+        Get the events of the tournament.
+
+        Args:
+            tournament_id (int, Tournament): The tournament id.
+            season_id (int, Season): The season id.
+            upcoming (bool): Whether to get the upcoming events.
+            page (int): The page number.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Event]: The events of the tournament.
+        """
+        return await self.__service.get_tournament_events(
+            tournament_id, season_id, upcoming, page, raw=raw
+        )
+
+    async def search(
+        self, query: str, entity: str | EntityType = EntityType.ALL, raw: bool = False
+    ) -> list[Event | Team | Player | Tournament] | dict:
+        """
+        Search query for matches, teams, players, and tournaments.
+
+        Args:
+            query (str): The search query.
+            entity (str, EntityType): The entity type to search for.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
+
+        Returns:
+            list[Event | Team | Player | Tournament]: The search results.
+        """
+        if isinstance(entity, str):
+            entity = EntityType(entity)
+        return await self.__service.search(query, entity, raw=raw)
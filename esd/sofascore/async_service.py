@@ -0,0 +1,635 @@
+"""
+Sofascore async service module
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from contextlib import nullcontext
+from copy import copy
+from typing import Any, Callable
+
+from ..breaker import CircuitOpenError
+from ..cache import IdentityMap, ParseMemo
+from ..transport import AsyncSingleFlight, AsyncTransport
+from ..utils import get_today
+from .cache import SofascoreCache, SofascoreDiskCache
+from .endpoints import SofascoreEndpoints
+from .service import _merge_payloads, _parse_search_results
+from .types import (
+    Bracket,
+    Category,
+    Comment,
+    EntityType,
+    Event,
+    Incident,
+    Lineups,
+    MatchBundle,
+    MatchStats,
+    Player,
+    PlayerAttributes,
+    Season,
+    Shot,
+    Standing,
+    Team,
+    TopPlayersMatch,
+    TopTournamentPlayers,
+    TopTournamentTeams,
+    Tournament,
+    TransferHistory,
+    parse_brackets,
+    parse_bundle_parts,
+    parse_comments,
+    parse_event,
+    parse_events,
+    parse_incidents,
+    parse_lineups,
+    parse_match_stats,
+    parse_player,
+    parse_player_attributes,
+    parse_seasons,
+    parse_shots,
+    parse_standings,
+    parse_team,
+    parse_top_players_match,
+    parse_top_tournament_players,
+    parse_top_tournament_teams,
+    parse_tournaments,
+    parse_transfer_history,
+)
+
+
+class AsyncSofascoreService:
+    """
+    A class to represent the SofaScore service using asyncio.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncTransport | None = None,
+        cache: SofascoreCache | None = None,
+        disk_cache: SofascoreDiskCache | None = None,
+        lazy_events: bool = False,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        self.endpoints = SofascoreEndpoints()
+        self.transport = transport or AsyncTransport()
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.lazy_events = lazy_events
+        self.identity_map = identity_map
+        self.memo = ParseMemo() if self.transport.revalidate else None
+        self.flights = AsyncSingleFlight() if self.transport.coalesce else None
+
+    async def _get_api_json(
+        self, url: str, endpoint: str, event_id: int | None = None
+    ) -> dict:
+        """
+        Get the JSON response of an endpoint, using the caches if enabled.
+        The memory cache is consulted first, then the disk cache. While the
+        circuit of the endpoint is open, an expired cached response is served.
+
+        Args:
+            url (str): The endpoint URL.
+            endpoint (str): The endpoint name, used to pick the cache policy.
+            event_id (int | None): The event id of a per-match endpoint.
+
+        Returns:
+            dict: The JSON response.
+        """
+        if self.cache is not None:
+            data = self.cache.get(url)
+            if data is not None:
+                return data
+        data = None
+        if self.disk_cache is not None and self.disk_cache.is_finished(event_id):
+            # SQLite and zlib work, kept off the event loop
+            data = await asyncio.to_thread(self.disk_cache.lookup, url, event_id)
+        if data is None:
+            try:
+                data = await self.transport.get_api_json(url)
+            except CircuitOpenError:
+                # the source is failing: serve the expired response if any
+                stale = self.cache.get_stale(url) if self.cache is not None else None
+                if stale is None:
+                    raise
+                return stale
+            if data and self.disk_cache is not None:
+                await asyncio.to_thread(self.disk_cache.store, url, data, event_id)
+        if data and self.cache is not None:
+            self.cache.store(url, data, endpoint, event_id)
+        return data
+
+    def _parse(self, key: str, parse: Callable[..., Any], *payloads: Any) -> Any:
+        """
+        Parse the given payloads, reusing the last result of the same payloads
+        when the transport revalidates its requests, and sharing the repeated
+        entities through the identity map if enabled.
+
+        Args:
+            key (str): The memo key (e.g. the endpoint URL).
+            parse (Callable[..., Any]): The parser, called with the payloads.
+            *payloads (Any): The JSON responses.
+
+        Returns:
+            Any: The parsed result.
+        """
+        scope = (
+            nullcontext() if self.identity_map is None else self.identity_map.activate()
+        )
+        with scope:
+            if self.memo is None:
+                return parse(*payloads)
+            return self.memo.parse(key, parse, *payloads)
+
+    async def _get(
+        self,
+        url: str,
+        endpoint: str,
+        parse: Callable[[dict], Any],
+        event_id: int | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Get and parse the JSON response of an endpoint.
+        Concurrent calls for the same URL share one request and parsed result.
+
+        Args:
+            url (str): The endpoint URL.
+            endpoint (str): The endpoint name, used to pick the cache policy.
+            parse (Callable[[dict], Any]): The parser of the JSON response.
+            event_id (int | None): The event id of a per-match endpoint.
+            raw (bool): Whether to return the JSON response without parsing it.
+
+        Returns:
+            Any: The parsed response, or the JSON response if raw.
+        """
+
+        async def fetch() -> Any:
+            data = await self._get_api_json(url, endpoint, event_id)
+            return data if raw else self._parse(url, parse, data)
+
+        if self.flights is None:
+            return await fetch()
+        return await self.flights.do((url, raw), fetch)
+
+    async def get_event(self, event_id: int, raw: bool = False) -> Event:
+        try:
+            url = self.endpoints.event_endpoint(event_id)
+            return await self._get(
+                url,
+                "event_endpoint",
+                lambda data: parse_event(data["event"]),
+                event_id,
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_events(self, date: str = "today", raw: bool = False) -> list[Event]:
+        if date == "today":
+            date = get_today()
+        try:
+            url = self.endpoints.events_endpoint.format(date=date)
+            return await self._get(
+                url,
+                "events_endpoint",
+                lambda data: parse_events(data["events"], self.lazy_events),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_live_events(self, raw: bool = False) -> list[Event]:
+        try:
+            url = self.endpoints.live_events_endpoint
+            return await self._get(
+                url,
+                "live_events_endpoint",
+                lambda data: parse_events(data["events"], self.lazy_events),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_player(
+        self,
+        player_id: int,
+        include_attributes: bool = True,
+        include_transfers: bool = True,
+        raw: bool = False,
+    ) -> Player:
+        try:
+            url = self.endpoints.player_endpoint(player_id)
+            calls = [self._get_api_json(url, "player_endpoint")]
+            if include_attributes:
+                calls.append(self.get_player_attributes(player_id, raw=raw))
+            if include_transfers:
+                calls.append(self.get_player_transfer_history(player_id, raw=raw))
+            data, *extras = await asyncio.gather(*calls)
+            if raw:
+                return _merge_payloads(data, *extras)
+            if "player" in data:
+                # the parsed player may be shared, so the extras go on a copy
+                player = copy(
+                    self._parse(url, lambda data: parse_player(data["player"]), data)
+                )
+                if include_attributes:
+                    player.attributes = extras.pop(0)
+                if include_transfers:
+                    player.transfer_history = extras.pop(0)
+                return player
+            return Player()
+        except Exception as exc:
+            raise exc
+
+    async def get_player_attributes(
+        self, player_id: int, raw: bool = False
+    ) -> PlayerAttributes:
+        try:
+            url = self.endpoints.player_attributes_endpoint(player_id)
+            return await self._get(
+                url,
+                "player_attributes_endpoint",
+                lambda data: (
+                    parse_player_attributes(data["playerAttributes"])
+                    if "playerAttributes" in data
+                    else PlayerAttributes()
+                ),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_player_transfer_history(
+        self, player_id: int, raw: bool = False
+    ) -> TransferHistory:
+        try:
+            url = self.endpoints.player_transfer_history_endpoint(player_id)
+            return await self._get(
+                url,
+                "player_transfer_history_endpoint",
+                lambda data: (
+                    parse_transfer_history(data)
+                    if data is not None
+                    else TransferHistory()
+                ),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_player_stats(self, player_id: int) -> dict:
+        try:
+            url = self.endpoints.player_stats_endpoint(player_id)
+            return await self._get_api_json(url, "player_stats_endpoint")
+        except Exception as exc:
+            raise exc
+
+    async def get_match_lineups(self, event_id: int, raw: bool = False) -> Lineups:
+        try:
+            url = self.endpoints.match_lineups_endpoint(event_id)
+            return await self._get(
+                url, "match_lineups_endpoint", parse_lineups, event_id, raw=raw
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_match_incidents(
+        self, event_id: int, raw: bool = False
+    ) -> list[Incident]:
+        try:
+            url = self.endpoints.match_events_endpoint(event_id)
+            return await self._get(
+                url,
+                "match_events_endpoint",
+                lambda data: parse_incidents(data["incidents"]),
+                event_id,
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_match_top_players(
+        self, event_id: int, raw: bool = False
+    ) -> TopPlayersMatch:
+        try:
+            url = self.endpoints.match_top_players_endpoint(event_id)
+            return await self._get(
+                url,
+                "match_top_players_endpoint",
+                parse_top_players_match,
+                event_id,
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_match_comments(
+        self, event_id: int, raw: bool = False
+    ) -> list[Comment]:
+        try:
+            url = self.endpoints.match_comments_endpoint(event_id)
+            return await self._get(
+                url,
+                "match_comments_endpoint",
+                lambda data: parse_comments(data["comments"]),
+                event_id,
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_match_stats(
+        self, event_id: int, win_probability: bool = True, raw: bool = False
+    ) -> MatchStats:
+        try:
+            stats_url = self.endpoints.match_stats_endpoint(event_id)
+            if not win_probability:
+                return await self._get(
+                    stats_url,
+                    "match_stats_endpoint",
+                    lambda data: parse_match_stats(data.get("statistics", {})),
+                    event_id,
+                    raw=raw,
+                )
+            probabilities_url = self.endpoints.match_probabilities_endpoint(event_id)
+            data, probabilities = await asyncio.gather(
+                self._get_api_json(stats_url, "match_stats_endpoint", event_id),
+                self._get_api_json(
+                    probabilities_url, "match_probabilities_endpoint", event_id
+                ),
+            )
+            if raw:
+                return _merge_payloads(data, probabilities)
+            return self._parse(
+                probabilities_url,
+                lambda data, probabilities: parse_match_stats(
+                    data.get("statistics", {}), probabilities.get("winProbability", {})
+                ),
+                data,
+                probabilities,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_match_shots(self, event_id: int, raw: bool = False) -> dict:
+        try:
+            url = self.endpoints.match_shots_endpoint(event_id)
+            return await self._get(
+                url,
+                "match_shots_endpoint",
+                lambda data: (
+                    parse_shots(data["shotmap"]) if "shotmap" in data else Shot()
+                ),
+                event_id,
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_match_bundle(
+        self, event_id: int, include: Iterable[str] | None = None, raw: bool = False
+    ) -> MatchBundle:
+        try:
+            parts = parse_bundle_parts(include)
+            fetchers = {
+                "event": self.get_event,
+                "stats": self.get_match_stats,
+                "lineups": self.get_match_lineups,
+                "incidents": self.get_match_incidents,
+                "shots": self.get_match_shots,
+                "comments": self.get_match_comments,
+                "top_players": self.get_match_top_players,
+            }
+            results = {}
+            if (
+                "event" in parts
+                and self.disk_cache is not None
+                and not self.disk_cache.is_finished(event_id)
+            ):
+                # the event status decides whether the other parts are persisted
+                results["event"] = await self.get_event(event_id, raw=raw)
+            rest = [part for part in parts if part not in results]
+            results.update(
+                zip(
+                    rest,
+                    await asyncio.gather(
+                        *(fetchers[part](event_id, raw=raw) for part in rest)
+                    ),
+                )
+            )
+            results = {part: results[part] for part in parts}
+            if raw:
+                return results
+            return MatchBundle(**results)
+        except Exception as exc:
+            raise exc
+
+    async def get_team(self, team_id: int, raw: bool = False) -> Team:
+        try:
+            url = self.endpoints.team_endpoint(team_id)
+            return await self._get(
+                url, "team_endpoint", lambda data: parse_team(data["team"]), raw=raw
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_team_players(self, team_id: int, raw: bool = False) -> list[Player]:
+        try:
+            url = self.endpoints.team_players_endpoint(team_id)
+            return await self._get(
+                url,
+                "team_players_endpoint",
+                lambda data: [
+                    parse_player(player["player"]) for player in data["players"]
+                ],
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_team_events(
+        self, team_id: int, upcoming: bool, page: int, raw: bool = False
+    ) -> list[Event]:
+        try:
+            url = self.endpoints.team_events_endpoint(team_id, upcoming, page)
+            return await self._get(
+                url,
+                "team_events_endpoint",
+                lambda data: (
+                    parse_events(data["events"], self.lazy_events)
+                    if "events" in data
+                    else []
+                ),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_tournaments_by_category(
+        self, category_id: Category, raw: bool = False
+    ) -> list[Tournament]:
+        if not isinstance(category_id, Category):
+            raise ValueError("category_id must be an instance of Category Enum")
+        try:
+            url = self.endpoints.tournaments_endpoint(category_id.value)
+            return await self._get(
+                url,
+                "tournaments_endpoint",
+                lambda data: parse_tournaments(
+                    data["groups"][0].get("uniqueTournaments", [])
+                ),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_tournament_seasons(
+        self, tournament_id: int, raw: bool = False
+    ) -> list[Season]:
+        try:
+            url = self.endpoints.tournament_seasons_endpoint(tournament_id)
+            return await self._get(
+                url,
+                "tournament_seasons_endpoint",
+                lambda data: parse_seasons(data["seasons"]),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_tournament_bracket(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> list[Bracket]:
+        try:
+            if isinstance(tournament_id, Tournament):
+                tournament_id = tournament_id.id
+            if isinstance(season_id, Season):
+                season_id = season_id.id
+            url = self.endpoints.tournament_bracket_endpoint(tournament_id, season_id)
+            return await self._get(
+                url,
+                "tournament_bracket_endpoint",
+                lambda data: parse_brackets(data["cupTrees"]),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_tournament_standings(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> list[Standing]:
+        try:
+            if isinstance(tournament_id, Tournament):
+                tournament_id = tournament_id.id
+            if isinstance(season_id, Season):
+                season_id = season_id.id
+            url = self.endpoints.tournament_standings_endpoint(tournament_id, season_id)
+            return await self._get(
+                url,
+                "tournament_standings_endpoint",
+                lambda data: parse_standings(data["standings"]),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_tournament_top_teams(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> TopTournamentTeams:
+        try:
+            if isinstance(tournament_id, Tournament):
+                tournament_id = tournament_id.id
+            if isinstance(season_id, Season):
+                season_id = season_id.id
+            url = self.endpoints.tournament_topteams_endpoint(tournament_id, season_id)
+            return await self._get(
+                url,
+                "tournament_topteams_endpoint",
+                lambda data: (
+                    parse_top_tournament_teams(data["topTeams"])
+                    if "topTeams" in data
+                    else TopTournamentTeams()
+                ),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_tournament_top_players(
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> TopTournamentPlayers:
+        try:
+            if isinstance(tournament_id, Tournament):
+                tournament_id = tournament_id.id
+            if isinstance(season_id, Season):
+                season_id = season_id.id
+            url = self.endpoints.tournament_topplayers_endpoint(
+                tournament_id, season_id
+            )
+            return await self._get(
+                url,
+                "tournament_topplayers_endpoint",
+                lambda data: (
+                    parse_top_tournament_players(data["topPlayers"])
+                    if "topPlayers" in data
+                    else TopTournamentPlayers()
+                ),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def get_tournament_events(
+        self,
+        tournament_id: int,
+        season_id: int,
+        upcoming: bool,
+        page: int,
+        raw: bool = False,
+    ) -> list[Event]:
+        try:
+            url = self.endpoints.tournament_events_endpoint(
+                tournament_id, season_id, upcoming, page
+            )
+            return await self._get(
+                url,
+                "tournament_events_endpoint",
+                lambda data: (
+                    parse_events(data["events"], self.lazy_events)
+                    if "events" in data
+                    else []
+                ),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    async def search(
+        self, query: str, entity: EntityType = EntityType.ALL, raw: bool = False
+    ) -> list[Event | Team | Player | Tournament]:
+        try:
+            entity_type = entity.value
+            url = self.endpoints.search_endpoint(query=query, entity_type=entity_type)
+            return await self._get(
+                url,
+                "search_endpoint",
+                lambda data: _parse_search_results(data, entity),
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
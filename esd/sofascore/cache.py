@@ -0,0 +1,274 @@
+"""
+This module contains the response cache of the Sofascore service.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from ..cache import DiskCache, TTLCache
+from ..utils import normalize_url
+
+FOREVER = float("inf")
+"""
+Time to live of the entries that never expire (they can still be evicted).
+"""
+
+DEFAULT_TTLS: dict[str, float] = {
+    "live_events_endpoint": 5,
+    "events_endpoint": 60,
+    "event_endpoint": 10,
+    "search_endpoint": 300,
+    "player_endpoint": 3600,
+    "player_transfer_history_endpoint": 6 * 3600,
+    "player_attributes_endpoint": 6 * 3600,
+    "player_stats_endpoint": 3600,
+    "team_endpoint": 3600,
+    "team_players_endpoint": 3600,
+    "team_events_endpoint": 300,
+    "match_stats_endpoint": 10,
+    "match_events_endpoint": 10,
+    "match_top_players_endpoint": 10,
+    "match_comments_endpoint": 10,
+    "match_shots_endpoint": 10,
+    "match_probabilities_endpoint": 10,
+    "match_lineups_endpoint": 60,
+    "tournaments_endpoint": 24 * 3600,
+    "tournament_seasons_endpoint": 6 * 3600,
+    "tournament_bracket_endpoint": 300,
+    "tournament_standings_endpoint": 60,
+    "tournament_topteams_endpoint": 600,
+    "tournament_topplayers_endpoint": 600,
+    "tournament_events_endpoint": 300,
+}
+"""
+Default time to live (in seconds) of each `SofascoreEndpoints` endpoint.
+"""
+
+
+def event_status_types(data: dict) -> dict[int, str]:
+    """
+    Get the status type of the events contained in an API response.
+
+    Args:
+        data (dict): The decoded API response.
+
+    Returns:
+        dict[int, str]: The status type (e.g. "finished") keyed by event id.
+    """
+    events = data.get("events")
+    if not isinstance(events, list):
+        events = [data["event"]] if isinstance(data.get("event"), dict) else []
+    return {
+        event["id"]: event["status"].get("type")
+        for event in events
+        if "id" in event and isinstance(event.get("status"), dict)
+    }
+
+
+def finished_event_ids(data: dict) -> list[int]:
+    """
+    Get the ids of the finished events contained in an API response.
+
+    Args:
+        data (dict): The decoded API response.
+
+    Returns:
+        list[int]: The finished event ids.
+    """
+    return [
+        event_id
+        for event_id, status in event_status_types(data).items()
+        if status == "finished"
+    ]
+
+
+class SofascoreCache(TTLCache):
+    """
+    A TTL cache with per-endpoint policies for the Sofascore API.
+
+    The per-match endpoints of an event that has been seen finished
+    are kept with `finished_ttl`, as their payloads no longer change.
+    The cache remembers the `max_size` finished events most recently used.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttls: dict[str, float] | None = None,
+        finished_ttl: float = FOREVER,
+    ) -> None:
+        """
+        Initializes the Sofascore cache.
+
+        Args:
+            max_size (int): The maximum number of entries kept.
+            ttls (dict[str, float] | None): Time to live overrides keyed by
+                endpoint name (e.g. {"live_events_endpoint": 2}). Use 0 to disable
+                the cache for an endpoint.
+            finished_ttl (float): Time to live of the finished events payloads.
+        """
+        super().__init__(max_size=max_size)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.finished_ttl = finished_ttl
+        # least recently used first, bounded like the entries
+        self._finished: OrderedDict[int, None] = OrderedDict()
+        self._finished_lock = threading.Lock()
+
+    def is_finished(self, event_id: int | None) -> bool:
+        """
+        Whether the given event has been seen finished.
+
+        Args:
+            event_id (int | None): The event id.
+
+        Returns:
+            bool: True if the event is finished.
+        """
+        if event_id is None:
+            return False
+        with self._finished_lock:
+            if event_id not in self._finished:
+                return False
+            self._finished.move_to_end(event_id)
+            return True
+
+    def ttl(self, endpoint: str, event_id: int | None = None) -> float:
+        """
+        Get the time to live of an endpoint response.
+
+        Args:
+            endpoint (str): The endpoint name.
+            event_id (int | None): The event id of a per-match endpoint.
+
+        Returns:
+            float: The time to live in seconds.
+        """
+        if self.is_finished(event_id):
+            return self.finished_ttl
+        return self.ttls.get(endpoint, 0)
+
+    def store(
+        self, url: str, data: Any, endpoint: str, event_id: int | None = None
+    ) -> None:
+        """
+        Store an endpoint response following its policy.
+
+        Args:
+            url (str): The request URL.
+            data (Any): The decoded response.
+            endpoint (str): The endpoint name.
+            event_id (int | None): The event id of a per-match endpoint.
+        """
+        finished = finished_event_ids(data) if isinstance(data, dict) else []
+        if finished:
+            with self._finished_lock:
+                for finished_id in finished:
+                    self._finished[finished_id] = None
+                    self._finished.move_to_end(finished_id)
+                while len(self._finished) > self.max_size:
+                    self._finished.popitem(last=False)
+        self.set(url, data, self.ttl(endpoint, event_id))
+
+
+class SofascoreDiskCache(DiskCache):
+    """
+    A persistent cache of the per-match payloads of finished events.
+
+    An event is known finished once an event payload (a single event or a list
+    of events) reports it. Its per-match payloads (lineups, incidents, shotmap,
+    statistics...) are then stored keyed by normalized URL and served from disk,
+    even after a restart. If the event is later seen not finished, its payloads
+    are invalidated.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the Sofascore disk cache.
+
+        Args:
+            path (str): The SQLite database path.
+        """
+        super().__init__(path)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS finished_events "
+                "(event_id INTEGER PRIMARY KEY)"
+            )
+            rows = self._connection.execute("SELECT event_id FROM finished_events")
+            self._finished: set[int] = {row[0] for row in rows}
+
+    def is_finished(self, event_id: int | None) -> bool:
+        """
+        Whether the given event is known finished.
+
+        Args:
+            event_id (int | None): The event id.
+
+        Returns:
+            bool: True if the event is finished.
+        """
+        return event_id is not None and event_id in self._finished
+
+    def observe(self, data: dict) -> None:
+        """
+        Record the status of the events contained in an API response,
+        invalidating the payloads of the events that are no longer finished.
+
+        Args:
+            data (dict): The decoded API response.
+        """
+        finished, reopened = [], []
+        for event_id, status in event_status_types(data).items():
+            if status == "finished" and event_id not in self._finished:
+                finished.append(event_id)
+            elif status != "finished" and event_id in self._finished:
+                reopened.append(event_id)
+        if not finished and not reopened:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO finished_events VALUES (?)",
+                [(event_id,) for event_id in finished],
+            )
+            self._connection.executemany(
+                "DELETE FROM finished_events WHERE event_id = ?",
+                [(event_id,) for event_id in reopened],
+            )
+            self._connection.executemany(
+                "DELETE FROM responses WHERE tag = ?",
+                [(event_id,) for event_id in reopened],
+            )
+            self._finished.update(finished)
+            self._finished.difference_update(reopened)
+
+    def lookup(self, url: str, event_id: int | None = None) -> dict | None:
+        """
+        Get the stored payload of a per-match endpoint.
+
+        Args:
+            url (str): The endpoint URL.
+            event_id (int | None): The event id of the per-match endpoint.
+
+        Returns:
+            dict | None: The payload, or None if the event is not finished
+                or the payload was never stored.
+        """
+        if not self.is_finished(event_id):
+            return None
+        return self.get(normalize_url(url))
+
+    def store(self, url: str, data: dict, event_id: int | None = None) -> None:
+        """
+        Observe an endpoint response and store it if its event is finished.
+
+        Args:
+            url (str): The endpoint URL.
+            data (dict): The decoded response.
+            event_id (int | None): The event id of a per-match endpoint.
+        """
+        self.observe(data)
+        if self.is_finished(event_id):
+            self.set(normalize_url(url), data, tag=event_id)
@@ -4,6 +4,16 @@ This module contains the client class for interacting with the Sofascore API.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from copy import copy
+from functools import partial
+
+from ..breaker import CircuitBreaker, CircuitState
+from ..cache import CacheStats, IdentityMap
+from ..proxy import ProxyPool, ProxyStats
+from ..retry import RetryPolicy, RetryStats
+from ..transport import Transport
+from .cache import SofascoreCache, SofascoreDiskCache
 from .service import SofascoreService
 from .types import (
     Bracket,
@@ -13,6 +23,7 @@ from .types import (
     Event,
     Incident,
     Lineups,
+    MatchBundle,
     MatchStats,
     Player,
     Season,
@@ -32,150 +43,345 @@ class SofascoreClient:
     This class provides methods to access and retrieve data from Sofascore.
     """
 
-    def __init__(self) -> None:
-        self.__service = SofascoreService()
+    def __init__(
+        self,
+        pool_size: int = 10,
+        cache: bool | SofascoreCache = False,
+        disk_cache: str | SofascoreDiskCache | None = None,
+        revalidate: bool = False,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: bool | CircuitBreaker = False,
+        proxy_pool: ProxyPool | Iterable[str] | None = None,
+        lazy_events: bool = False,
+        identity_map: bool = False,
+    ) -> None:
+        """
+        Initializes the Sofascore client.
+
+        Args:
+            pool_size (int): The maximum number of pooled connections.
+            cache (bool | SofascoreCache): Whether to cache the responses, or the
+                cache to use (e.g. to customize the time to live of each endpoint).
+            disk_cache (str | SofascoreDiskCache | None): The SQLite database path
+                (or the disk cache) used to persist the payloads of finished events.
+                A cache created from a path is closed with the client.
+            revalidate (bool): Whether to revalidate repeated requests with their
+                ETag / Last-Modified validators. A 304 Not Modified response reuses
+                the last payload and its parsed result.
+            retry (RetryPolicy | None): The policy used to retry transient failures
+                (timeouts, 5xx, 429...), the default one if None.
+            circuit_breaker (bool | CircuitBreaker): Whether to stop sending requests
+                to a failing source for a while, or the circuit breaker to use
+                (e.g. to tune its thresholds or share it between clients).
+            proxy_pool (ProxyPool | Iterable[str] | None): The proxies (or the proxy
+                pool) every request is rotated through, scored and evicted on their
+                latency and block rates.
+            lazy_events (bool): Whether the events of the lists (daily, live, team
+                and tournament events) parse their nested objects on first access,
+                which is cheaper when only a few attributes are read.
+            identity_map (bool): Whether to share the teams and tournaments parsed
+                again from the same data (e.g. the tournament of every event of a
+                list) instead of rebuilding them. Shared objects must not be
+                modified.
+        """
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        if not isinstance(circuit_breaker, CircuitBreaker):
+            circuit_breaker = None
+        if proxy_pool is not None and not isinstance(proxy_pool, ProxyPool):
+            proxy_pool = ProxyPool(proxy_pool)
+        self.__transport = Transport(
+            pool_size=pool_size,
+            revalidate=revalidate,
+            retry=retry,
+            breaker=circuit_breaker,
+            proxy_pool=proxy_pool,
+        )
+        if cache is True:
+            cache = SofascoreCache()
+        self.__cache = cache if isinstance(cache, SofascoreCache) else None
+        self.__owns_disk_cache = isinstance(disk_cache, str)
+        if self.__owns_disk_cache:
+            disk_cache = SofascoreDiskCache(disk_cache)
+        self.__disk_cache = disk_cache
+        self.__service = SofascoreService(
+            self.__transport,
+            cache=self.__cache,
+            disk_cache=self.__disk_cache,
+            lazy_events=lazy_events,
+            identity_map=IdentityMap() if identity_map else None,
+        )
+
+    def __enter__(self) -> SofascoreClient:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the client and release its pooled connections.
+        """
+        self.__transport.close()
+        if self.__owns_disk_cache:
+            self.__disk_cache.close()
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """
+        Get the response cache counters (hits, misses, evictions and size).
+        None if the cache is disabled.
+        """
+        if self.__cache is None:
+            return None
+        return self.__cache.stats
+
+    @property
+    def disk_cache_stats(self) -> CacheStats | None:
+        """
+        Get the disk cache counters (hits, misses and size).
+        None if the disk cache is disabled.
+        """
+        if self.__disk_cache is None:
+            return None
+        return self.__disk_cache.stats
+
+    @property
+    def identity_map_stats(self) -> CacheStats | None:
+        """
+        Get the identity map counters (hits, misses and size).
+        None if the identity map is disabled.
+        """
+        if self.__service.identity_map is None:
+            return None
+        return self.__service.identity_map.stats
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get the retry counters, to tune the retry policy.
+        """
+        return self.__transport.retry_stats
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Get the state of the circuits (e.g. "api.sofascore.com/event"),
+        empty if the circuit breaker is disabled.
+        """
+        return self.__transport.circuit_states
+
+    @property
+    def proxy_stats(self) -> list[ProxyStats]:
+        """
+        Get the health of every proxy, best first (empty without proxy pool).
+        """
+        return self.__transport.proxy_stats
 
-    def get_events(self, date: str = 'today', live: bool = False) -> list[Event]:
+    def get_events(
+        self, date: str = 'today', live: bool = False, raw: bool = False
+    ) -> list[Event] | dict:
         """
         Get the scheduled events.
 
         Args:
             date (str): The date of the events in the format "YYYY-MM-DD" or "today".
             live (bool): Whether to get the live events (more precise).
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Event]: The scheduled events.
         """
         if live:
-            return self.__service.get_live_events()
-        return self.__service.get_events(date)
+            return self.__service.get_live_events(raw=raw)
+        return self.__service.get_events(date, raw=raw)
 
-    def get_event(self, event_id: int) -> Event:
+    def get_event(self, event_id: int, raw: bool = False) -> Event | dict:
         """
         Get the event information.
 
         Args:
             event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             Event: The event information.
         """
-        return self.__service.get_event(event_id)
+        return self.__service.get_event(event_id, raw=raw)
 
-    def get_player(self, player_id: int) -> Player:
+    def get_player(
+        self,
+        player_id: int,
+        include_attributes: bool = True,
+        include_transfers: bool = True,
+        raw: bool = False,
+    ) -> Player | dict:
         """
         Get the player information.
 
         Args:
             player_id (int): The player id.
+            include_attributes (bool): Whether to also fetch the player attributes.
+            include_transfers (bool): Whether to also fetch the transfer history.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             Player: The player information.
         """
-        return self.__service.get_player(player_id)
+        return self.__service.get_player(
+            player_id, include_attributes, include_transfers, raw=raw
+        )
 
-    def get_match_incidents(self, event_id: int) -> list[Incident]:
+    def get_match_incidents(
+        self, event_id: int, raw: bool = False
+    ) -> list[Incident] | dict:
         """
         Get the events of a match.
 
         Args:
             event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Incident]: The match incidents.
         """
-        return self.__service.get_match_incidents(event_id)
+        return self.__service.get_match_incidents(event_id, raw=raw)
 
-    def get_match_top_players(self, event_id: int) -> TopPlayersMatch:
+    def get_match_top_players(
+        self, event_id: int, raw: bool = False
+    ) -> TopPlayersMatch | dict:
         """
         Get the top players of a match.
 
         Args:
             event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             TopPlayersMatch: The match top players.
         """
-        return self.__service.get_match_top_players(event_id)
+        return self.__service.get_match_top_players(event_id, raw=raw)
 
-    def get_match_comments(self, event_id: int) -> list[Comment]:
+    def get_match_comments(
+        self, event_id: int, raw: bool = False
+    ) -> list[Comment] | dict:
         """
         Get the comments of a match.
 
         Args:
             event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Comment]: The match comments.
         """
-        return self.__service.get_match_comments(event_id)
+        return self.__service.get_match_comments(event_id, raw=raw)
 
-    def get_match_stats(self, event_id: int) -> MatchStats:
+    def get_match_stats(
+        self, event_id: int, win_probability: bool = True, raw: bool = False
+    ) -> MatchStats | dict:
         """
         Get the match statistics by event id.
 
         Args:
             event_id (int): The event id (also known as match id).
+            win_probability (bool): Whether to also fetch the win probability.
+                Skipping it saves one request, leaving `win_probability` as None.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             MatchStats: The match statistics.
         """
-        return self.__service.get_match_stats(event_id)
+        return self.__service.get_match_stats(event_id, win_probability, raw=raw)
 
-    def get_match_lineups(self, event_id: int) -> Lineups:
+    def get_match_lineups(self, event_id: int, raw: bool = False) -> Lineups | dict:
         """
         Get the match lineups.
 
         Args:
             event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             Lineups: The match lineups.
         """
-        return self.__service.get_match_lineups(event_id)
+        return self.__service.get_match_lineups(event_id, raw=raw)
 
-    def get_match_shots(self, event_id: int) -> list[Shot]:
+    def get_match_shots(self, event_id: int, raw: bool = False) -> list[Shot] | dict:
         """
         Get the shots of a match.
 
         Args:
             event_id (int): The event id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Shot]: The match shots.
         """
-        return self.__service.get_match_shots(event_id)
+        return self.__service.get_match_shots(event_id, raw=raw)
+
+    def get_match_bundle(
+        self, event_id: int, include: Iterable[str] | None = None, raw: bool = False
+    ) -> MatchBundle | dict:
+        """
+        Get every per-match resource in one call, fetching them concurrently.
+
+        Args:
+            event_id (int): The event id.
+            include (Iterable[str] | None): The parts to fetch, any of "event",
+                "stats", "lineups", "incidents", "shots", "comments" and
+                "top_players". Defaults to None (all of them).
+            raw (bool): Whether to return the JSON responses by part,
+                skipping the parsing.
+
+        Returns:
+            MatchBundle: The match bundle.
+        """
+        return self.__service.get_match_bundle(event_id, include, raw=raw)
 
-    def get_team(self, team_id: int) -> Team:
+    def get_team(
+        self, team_id: int, include_players: bool = True, raw: bool = False
+    ) -> Team | dict:
         """
         Get detailed information about a team.
 
         Args:
             team_id (int): The team id.
+            include_players (bool): Whether to also fetch the team players.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             TeamEx: The team information.
         """
-        team: Team = self.__service.get_team(team_id)
-        players: list[Player] = self.__service.get_team_players(team_id)
+        if not include_players:
+            return self.__service.get_team(team_id, raw=raw)
+        team, players = self.__transport.gather(
+            partial(self.__service.get_team, team_id, raw=raw),
+            partial(self.__service.get_team_players, team_id, raw=raw),
+        )
+        if raw:
+            return {**team, **players}
+        # the parsed team may be shared with other callers, so fill a copy
+        team = copy(team)
         team.players = players
         return team
 
-    def get_team_players(self, team_id: int) -> list[Player]:
+    def get_team_players(self, team_id: int, raw: bool = False) -> list[Player] | dict:
         """
         Get the players of a team.
 
         Args:
             team_id (int): The team id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Player]: The players of the team.
         """
-        return self.__service.get_team_players(team_id)
+        return self.__service.get_team_players(team_id, raw=raw)
 
     def get_team_events(
-        self, team_id: int, upcoming: bool = False, page: int = 0
-    ) -> list[Event]:
+        self, team_id: int, upcoming: bool = False, page: int = 0, raw: bool = False
+    ) -> list[Event] | dict:
         """
         Get the events (matchs) of a team.
 
@@ -183,96 +389,125 @@ class SofascoreClient:
             team_id (int): The team id.
             upcoming (bool): Whether to get the upcoming events.
             page (int): The page number.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Event]: The events of the team.
         """
-        return self.__service.get_team_events(team_id, upcoming, page)
+        return self.__service.get_team_events(team_id, upcoming, page, raw=raw)
 
-    def get_tournaments(self, category_id: Category) -> list[Tournament]:
+    def get_tournaments(
+        self, category_id: Category, raw: bool = False
+    ) -> list[Tournament] | dict:
         """
         Get the tournaments by category.
         TODO: maybe add a argument to include seasons.
 
         Args:
             category_id (Category): The category id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Tournament]: The tournaments.
         """
-        return self.__service.get_tournaments_by_category(category_id)
+        return self.__service.get_tournaments_by_category(category_id, raw=raw)
 
-    def get_tournament_seasons(self, tournament_id: int) -> list[Season]:
+    def get_tournament_seasons(
+        self, tournament_id: int, raw: bool = False
+    ) -> list[Season] | dict:
         """
         Get the seasons of a tournament.
 
         Args:
             tournament_id (int): The tournament id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Season]: The seasons of the tournament.
         """
-        return self.__service.get_tournament_seasons(tournament_id)
+        return self.__service.get_tournament_seasons(tournament_id, raw=raw)
 
     def get_tournament_brackets(
-        self, tournament_id: int | Tournament, season_id: int | Season
-    ) -> list[Bracket]:
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> list[Bracket] | dict:
         """
         Get the tournament bracket.
 
         Args:
             tournament_id (int, Tournament): The tournament id.
             season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Bracket]: The tournament bracket.
         """
-        return self.__service.get_tournament_bracket(tournament_id, season_id)
+        return self.__service.get_tournament_bracket(tournament_id, season_id, raw=raw)
 
     def get_tournament_standings(
-        self, tournament_id: int | Tournament, season_id: int | Season
-    ) -> list[Standing]:
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> list[Standing] | dict:
         """
         Get the tournament standings.
 
         Args:
             tournament_id (int, Tournament): The tournament id.
             season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Standing]: The tournament standings.
         """
-        return self.__service.get_tournament_standings(tournament_id, season_id)
+        return self.__service.get_tournament_standings(
+            tournament_id, season_id, raw=raw
+        )
 
     def get_tournament_top_teams(
-        self, tournament_id: int | Tournament, season_id: int | Season
-    ) -> TopTournamentTeams:
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> TopTournamentTeams | dict:
         """
         Get the top teams of the tournament.
 
         Args:
             tournament_id (int, Tournament): The tournament id.
             season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             TopTournamentTeams: The top teams of the tournament.
         """
-        return self.__service.get_tournament_top_teams(tournament_id, season_id)
+        return self.__service.get_tournament_top_teams(
+            tournament_id, season_id, raw=raw
+        )
 
     def get_tournament_top_players(
-        self, tournament_id: int | Tournament, season_id: int | Season
-    ) -> TopTournamentPlayers:
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
+    ) -> TopTournamentPlayers | dict:
         """
         Get the top players of the tournament.
 
         Args:
             tournament_id (int, Tournament): The tournament id.
             season_id (int, Season): The season id.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             TopTournamentPlayers: The top players of the tournament.
         """
-        return self.__service.get_tournament_top_players(tournament_id, season_id)
+        return self.__service.get_tournament_top_players(
+            tournament_id, season_id, raw=raw
+        )
 
     def get_tournament_events(
         self,
@@ -280,7 +515,8 @@ class SofascoreClient:
         season_id: int | Season,
         upcoming: bool = False,
         page: int = 0,
-    ) -> list[Event]:
+        raw: bool = False,
+    ) -> list[Event] | dict:
         """
         Get the events of the tournament.
 
@@ -289,27 +525,29 @@ class SofascoreClient:
             season_id (int, Season): The season id.
             upcoming (bool): Whether to get the upcoming events.
             page (int): The page number.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Event]: The events of the tournament.
         """
         return self.__service.get_tournament_events(
-            tournament_id, season_id, upcoming, page
+            tournament_id, season_id, upcoming, page, raw=raw
         )
 
     def search(
-        self, query: str, entity: str | EntityType = EntityType.ALL
-    ) -> list[Event | Team | Player | Tournament]:
+        self, query: str, entity: str | EntityType = EntityType.ALL, raw: bool = False
+    ) -> list[Event | Team | Player | Tournament] | dict:
         """
         Search query for matches, teams, players, and tournaments.
 
         Args:
             query (str): The search query.
             entity (str, EntityType): The entity type to search for.
+            raw (bool): Whether to return the JSON response, skipping the parsing.
 
         Returns:
             list[Event | Team | Player | Tournament]: The search results.
         """
         if isinstance(entity, str):
             entity = EntityType(entity)
-        return self.__service.search(query, entity)
+        return self.__service.search(query, entity, raw=raw)
@@ -0,0 +1,1215 @@
+"""
+This module contains the pollers of the live events, emitting their changes,
+and the incremental streams of the match incidents and comments.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from ..decoder import dumps
+from .async_client import AsyncSofascoreClient
+from .client import SofascoreClient
+from .types import (
+    Comment,
+    Event,
+    Incident,
+    IncidentType,
+    StatusType,
+    parse_comment,
+    parse_event,
+    parse_incident,
+)
+
+logger = logging.getLogger(__name__)
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+WATCHED_FIELDS = {
+    "score": ("homeScore", "awayScore"),
+    "status": ("status",),
+    "period": ("time", "lastPeriod"),
+}
+"""
+The watched aspects of a live event, with the raw event keys they are made of.
+"""
+
+TIMELINE_KEYS = {
+    "incidents": ("incidentType", "incidentClass", "time", "addedTime", "isHome"),
+    "comments": ("time", "type", "isHome", "text"),
+}
+"""
+The raw keys identifying a timeline entry without an "id", by timeline.
+"""
+
+OBSERVER_HOOKS = (
+    "goal",
+    "card",
+    "red_card",
+    "substitution",
+    "incident",
+    "score_change",
+    "status_change",
+    "error",
+)
+"""
+The hooks of a live observer.
+"""
+
+RED_CARDS = ("red", "yellowRed")
+"""
+The incident classes of the cards sending a player off.
+"""
+
+BREAK_DESCRIPTIONS = ("halftime", "pause", "awaiting", "break")
+"""
+The words of the in progress status descriptions meaning the ball is not in play.
+"""
+
+
+@dataclass
+class EventChange:
+    """
+    A change of the live events: an event added, changed or removed.
+    """
+
+    kind: str = field(default=CHANGED)
+    event: Event = field(default=None)
+    previous: Event | None = field(default=None)
+    aspects: tuple[str, ...] = field(default=())
+    """
+    The changed aspects (e.g. "score", "status"), for a changed event.
+    """
+
+
+@dataclass
+class PollingPolicy:
+    """
+    The refresh intervals of a tracked match, in seconds, by match state.
+    """
+
+    live: float = field(default=10.0)
+    stoppage: float = field(default=5.0)
+    """
+    During the added time of a period, once its regular time is over.
+    """
+    halftime: float = field(default=60.0)
+    """
+    During a break: halftime, before extra time or penalties.
+    """
+    pre_kickoff: float = field(default=300.0)
+    """
+    How long before the kickoff a not started match is woken up.
+    """
+    kickoff: float = field(default=30.0)
+    """
+    For a not started match within `pre_kickoff` seconds of (or past) its kickoff.
+    """
+    not_started: float = field(default=3600.0)
+    """
+    The longest sleep of a not started match, to follow kickoff changes.
+    """
+    unknown: float = field(default=60.0)
+    retry: float = field(default=30.0)
+    """
+    After a failed refresh: a transport error or a response without the event.
+    """
+
+    def interval(self, event: Event, now: float | None = None) -> float | None:
+        """
+        Get the seconds until the next refresh of a match.
+
+        Args:
+            event (Event): The match.
+            now (float | None): The current timestamp, time.time() if None.
+
+        Returns:
+            float | None: The refresh interval, None once the match is over.
+        """
+        now = time.time() if now is None else now
+        status = event.status.type
+        if status in (
+            StatusType.FINISHED,
+            StatusType.CANCELLED,
+            StatusType.POSTPONED,
+        ):
+            return None
+        if status == StatusType.NOT_STARTED:
+            wake_up = (event.start_timestamp or 0) - self.pre_kickoff - now
+            return min(wake_up, self.not_started) if wake_up > 0 else self.kickoff
+        if status != StatusType.IN_PROGRESS:
+            return self.unknown
+        description = (event.status.description or "").lower()
+        if any(word in description for word in BREAK_DESCRIPTIONS):
+            return self.halftime
+        status_time = event.status_time
+        if (
+            status_time.timestamp
+            and now - status_time.timestamp + status_time.initial >= status_time.max
+        ):
+            return self.stoppage
+        return self.live
+
+
+class _LiveEvents:
+    """
+    The live events known by a poller, updated from the raw live events.
+    """
+
+    def __init__(self, watch: dict[str, tuple[str, ...]] | None = None) -> None:
+        self.watch = watch or WATCHED_FIELDS
+        self._events: dict[int, tuple[dict[str, int], Event]] = {}
+        self._subscribers: list[Callable[[EventChange], Any]] = []
+
+    @property
+    def events(self) -> list[Event]:
+        """
+        Get the live events seen by the last poll.
+        """
+        return [event for _, event in self._events.values()]
+
+    def subscribe(self, callback: Callable[[EventChange], Any]) -> Callable[[], None]:
+        """
+        Call the given callback with every change of the live events.
+
+        Args:
+            callback (Callable[[EventChange], Any]): The subscriber.
+
+        Returns:
+            Callable[[], None]: A function unsubscribing the callback.
+        """
+        self._subscribers.append(callback)
+        return lambda: self.unsubscribe(callback)
+
+    def unsubscribe(self, callback: Callable[[EventChange], Any]) -> None:
+        """
+        Stop calling the given callback.
+
+        Args:
+            callback (Callable[[EventChange], Any]): The subscriber.
+        """
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _fingerprint(self, data: dict) -> dict[str, int]:
+        return {
+            aspect: hash(dumps([data.get(key) for key in keys]))
+            for aspect, keys in self.watch.items()
+        }
+
+    def _diff(self, data: dict) -> tuple[Event, EventChange | None]:
+        """
+        Update a known event, parsing it only if it is new or changed.
+
+        Args:
+            data (dict): The raw event, with its "id".
+
+        Returns:
+            tuple[Event, EventChange | None]: The event, and its change if any.
+        """
+        fingerprint = self._fingerprint(data)
+        known = self._events.get(data["id"])
+        if known is None:
+            event = parse_event(data)
+            change = EventChange(ADDED, event)
+        elif known[0] != fingerprint:
+            event = parse_event(data)
+            aspects = tuple(
+                aspect
+                for aspect, digest in fingerprint.items()
+                if known[0].get(aspect) != digest
+            )
+            change = EventChange(CHANGED, event, known[1], aspects)
+        else:
+            return known[1], None
+        self._events[event.id] = (fingerprint, event)
+        return event, change
+
+    def _update(self, data: list[dict]) -> list[EventChange]:
+        """
+        Update the live events, parsing only the added and changed ones.
+
+        Args:
+            data (list[dict]): The raw live events.
+
+        Returns:
+            list[EventChange]: The changes since the last update.
+        """
+        changes = []
+        seen = set()
+        for raw_event in data:
+            if raw_event.get("id") is None:
+                continue
+            seen.add(raw_event["id"])
+            _, change = self._diff(raw_event)
+            if change is not None:
+                changes.append(change)
+        for event_id in [event_id for event_id in self._events if event_id not in seen]:
+            _, event = self._events.pop(event_id)
+            changes.append(EventChange(REMOVED, event))
+        return changes
+
+    def _emit(self, changes: list[EventChange]) -> None:
+        for change in changes:
+            for callback in list(self._subscribers):
+                callback(change)
+
+    async def _emit_async(self, changes: list[EventChange]) -> None:
+        for change in changes:
+            for callback in list(self._subscribers):
+                result = callback(change)
+                if inspect.isawaitable(result):
+                    await result
+
+
+class LivePoller(_LiveEvents):
+    """
+    Polls the live events of a Sofascore client, and emits to its subscribers
+    only the events added, removed or changed (score, status, period) since
+    the previous poll.
+    """
+
+    def __init__(
+        self,
+        client: SofascoreClient,
+        interval: float = 10.0,
+        watch: dict[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        """
+        Initializes the live poller.
+
+        Args:
+            client (SofascoreClient): The client fetching the live events.
+            interval (float): Seconds between two polls.
+            watch (dict[str, tuple[str, ...]] | None): The watched aspects with
+                their raw event keys, WATCHED_FIELDS if None.
+        """
+        super().__init__(watch)
+        self.client = client
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def poll(self) -> list[EventChange]:
+        """
+        Poll the live events once and emit their changes. A response without
+        the live events leaves them unchanged.
+
+        Returns:
+            list[EventChange]: The changes since the previous poll.
+        """
+        return self._apply(self._fetch())
+
+    def _fetch(self) -> dict:
+        return self.client.get_events(live=True, raw=True)
+
+    def _apply(self, data: dict) -> list[EventChange]:
+        """
+        Emit the changes of a live events response, apart from its fetch.
+        """
+        if "events" not in data:
+            # a failed poll, not the end of every live match
+            return []
+        changes = self._update(data["events"])
+        self._emit(changes)
+        return changes
+
+    def run(self, iterations: int | None = None) -> None:
+        """
+        Poll the live events every `interval` seconds, until stopped.
+        A failed poll is logged, and the next one is tried on schedule.
+
+        Args:
+            iterations (int | None): The number of polls, unlimited if None.
+        """
+        self._stopped.clear()
+        count = 0
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Polling the live events failed.")
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            self._stopped.wait(self.interval)
+
+    def stop(self) -> None:
+        """
+        Stop running, from another thread or a subscriber.
+        """
+        self._stopped.set()
+
+
+class AsyncLivePoller(_LiveEvents):
+    """
+    Polls the live events of an asyncio Sofascore client, and emits to its
+    subscribers only the events added, removed or changed (score, status,
+    period) since the previous poll. Subscribers may be coroutine functions.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSofascoreClient,
+        interval: float = 10.0,
+        watch: dict[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        """
+        Initializes the live poller.
+
+        Args:
+            client (AsyncSofascoreClient): The client fetching the live events.
+            interval (float): Seconds between two polls.
+            watch (dict[str, tuple[str, ...]] | None): The watched aspects with
+                their raw event keys, WATCHED_FIELDS if None.
+        """
+        super().__init__(watch)
+        self.client = client
+        self.interval = interval
+        # created by run, in the running event loop
+        self._stopped: asyncio.Event | None = None
+
+    async def poll(self) -> list[EventChange]:
+        """
+        Poll the live events once and emit their changes. A response without
+        the live events leaves them unchanged.
+
+        Returns:
+            list[EventChange]: The changes since the previous poll.
+        """
+        data = await self.client.get_events(live=True, raw=True)
+        if "events" not in data:
+            # a failed poll, not the end of every live match
+            return []
+        changes = self._update(data["events"])
+        await self._emit_async(changes)
+        return changes
+
+    async def run(self, iterations: int | None = None) -> None:
+        """
+        Poll the live events every `interval` seconds, until stopped.
+        A failed poll is logged, and the next one is tried on schedule.
+
+        Args:
+            iterations (int | None): The number of polls, unlimited if None.
+        """
+        self._stopped = asyncio.Event()
+        count = 0
+        while not self._stopped.is_set():
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception("Polling the live events failed.")
+            count += 1
+            if iterations is not None and count >= iterations:
+                break
+            try:
+                await asyncio.wait_for(self._stopped.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """
+        Stop running, from a subscriber or another task.
+        """
+        if self._stopped is not None:
+            self._stopped.set()
+
+
+class _MatchSchedule(_LiveEvents):
+    """
+    The tracked matches of a scheduler, with the timestamp of their next refresh.
+    """
+
+    def __init__(
+        self,
+        policy: PollingPolicy | None = None,
+        max_rate: float | None = 2.0,
+        watch: dict[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        super().__init__(watch)
+        self.policy = policy or PollingPolicy()
+        self.max_rate = max_rate
+        self._due: dict[int, float] = {}
+        # track and untrack may be called from other threads while running
+        self._lock = threading.RLock()
+        self._next_request = 0.0
+        self._wakeup: threading.Event | asyncio.Event | None = None
+
+    @property
+    def schedule(self) -> dict[int, float]:
+        """
+        Get the tracked event ids, with the timestamp of their next refresh.
+        """
+        with self._lock:
+            return dict(self._due)
+
+    def track(self, event: Event | int) -> None:
+        """
+        Track a match. An event is scheduled from its status, an event id is
+        refreshed right away. Finished matches are not tracked.
+
+        Args:
+            event (Event | int): The event or the event id.
+        """
+        if isinstance(event, Event):
+            delay = self.policy.interval(event)
+            if delay is None:
+                return
+            event_id, due = event.id, time.time() + delay
+        else:
+            event_id, due = event, time.time()
+        with self._lock:
+            self._due[event_id] = due
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def untrack(self, event_id: int) -> None:
+        """
+        Stop tracking a match.
+
+        Args:
+            event_id (int): The event id.
+        """
+        with self._lock:
+            self._due.pop(event_id, None)
+            self._events.pop(event_id, None)
+
+    def _pending(self, now: float) -> list[int]:
+        with self._lock:
+            return sorted(
+                (event_id for event_id, due in self._due.items() if due <= now),
+                key=self._due.__getitem__,
+            )
+
+    def _next_due(self) -> float | None:
+        """
+        Get the timestamp of the next refresh.
+
+        Returns:
+            float | None: The timestamp, None if no match is tracked.
+        """
+        with self._lock:
+            return min(self._due.values(), default=None)
+
+    def _failed(self, event_id: int) -> None:
+        """
+        Keep a match whose refresh failed, retrying it after `policy.retry`.
+
+        Args:
+            event_id (int): The event id.
+        """
+        with self._lock:
+            if event_id in self._due:
+                self._due[event_id] = time.time() + self.policy.retry
+
+    def _reserve(self) -> float:
+        """
+        Reserve the next request under the rate ceiling.
+
+        Returns:
+            float: The seconds to wait before sending it.
+        """
+        if not self.max_rate:
+            return 0.0
+        now = time.monotonic()
+        slot = max(now, self._next_request)
+        self._next_request = slot + 1.0 / self.max_rate
+        return slot - now
+
+    def _refreshed(self, event_id: int, data: dict) -> list[EventChange]:
+        """
+        Update a refreshed match and schedule its next refresh.
+
+        Args:
+            event_id (int): The event id.
+            data (dict): The event response, empty if the event is not found.
+
+        Returns:
+            list[EventChange]: Its changes, ending with its removal once over
+                or not found.
+        """
+        with self._lock:
+            if event_id not in self._due:
+                # untracked while refreshing
+                return []
+            if not data:
+                known = self._events.get(event_id)
+                self.untrack(event_id)
+                return [EventChange(REMOVED, known[1])] if known else []
+            if not data.get("event"):
+                self._failed(event_id)
+                return []
+            event, change = self._diff(data["event"])
+            changes = [change] if change is not None else []
+            delay = self.policy.interval(event)
+            if delay is None:
+                self.untrack(event_id)
+                changes.append(EventChange(REMOVED, event))
+            else:
+                self._due[event_id] = time.time() + delay
+            return changes
+
+
+class MatchScheduler(_MatchSchedule):
+    """
+    Refreshes the tracked matches of a Sofascore client, each one at the
+    interval of its state (see PollingPolicy) and all under a global request
+    rate ceiling, and emits their changes to its subscribers. A match is
+    dropped, with a removed change, after the final whistle or if it is not
+    found. A failed refresh is retried later, keeping the match tracked.
+    """
+
+    def __init__(
+        self,
+        client: SofascoreClient,
+        policy: PollingPolicy | None = None,
+        max_rate: float | None = 2.0,
+        watch: dict[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        """
+        Initializes the match scheduler.
+
+        Args:
+            client (SofascoreClient): The client fetching the events.
+            policy (PollingPolicy | None): The refresh intervals, defaults if None.
+            max_rate (float | None): The most requests per second, unlimited if None.
+            watch (dict[str, tuple[str, ...]] | None): The watched aspects with
+                their raw event keys, WATCHED_FIELDS if None.
+        """
+        super().__init__(policy, max_rate, watch)
+        self.client = client
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+
+    def tick(self) -> list[EventChange]:
+        """
+        Refresh the matches which are due, and emit their changes. A failed
+        refresh is logged, and retried after `policy.retry` seconds.
+
+        Returns:
+            list[EventChange]: The changes of the refreshed matches.
+        """
+        changes = []
+        for event_id in self._pending(time.time()):
+            if self._stopped.is_set():
+                break
+            wait = self._reserve()
+            if wait > 0:
+                self._stopped.wait(wait)
+            try:
+                data = self.client.get_event(event_id, raw=True)
+            except Exception:
+                logger.exception("Refreshing the event %s failed.", event_id)
+                self._failed(event_id)
+                continue
+            refreshed = self._refreshed(event_id, data)
+            self._emit(refreshed)
+            changes.extend(refreshed)
+        return changes
+
+    def run(self, stop_when_idle: bool = True) -> None:
+        """
+        Refresh the tracked matches when they are due, until stopped.
+
+        Args:
+            stop_when_idle (bool): Whether to return once no match is tracked,
+                otherwise wait for new ones.
+        """
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            self.tick()
+            due = self._next_due()
+            if due is None and stop_when_idle:
+                break
+            self._wakeup.clear()
+            self._wakeup.wait(None if due is None else max(0.0, due - time.time()))
+
+    def stop(self) -> None:
+        """
+        Stop running, from another thread or a subscriber.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+
+
+class AsyncMatchScheduler(_MatchSchedule):
+    """
+    Refreshes the tracked matches of an asyncio Sofascore client, each one at
+    the interval of its state (see PollingPolicy) and all under a global
+    request rate ceiling, and emits their changes to its subscribers, which
+    may be coroutine functions. A match is dropped, with a removed change,
+    after the final whistle or if it is not found. A failed refresh is
+    retried later, keeping the match tracked.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSofascoreClient,
+        policy: PollingPolicy | None = None,
+        max_rate: float | None = 2.0,
+        watch: dict[str, tuple[str, ...]] | None = None,
+    ) -> None:
+        """
+        Initializes the match scheduler.
+
+        Args:
+            client (AsyncSofascoreClient): The client fetching the events.
+            policy (PollingPolicy | None): The refresh intervals, defaults if None.
+            max_rate (float | None): The most requests per second, unlimited if None.
+            watch (dict[str, tuple[str, ...]] | None): The watched aspects with
+                their raw event keys, WATCHED_FIELDS if None.
+        """
+        super().__init__(policy, max_rate, watch)
+        self.client = client
+        # created by run, in the running event loop
+        self._stopped: asyncio.Event | None = None
+
+    async def tick(self) -> list[EventChange]:
+        """
+        Refresh the matches which are due, and emit their changes. A failed
+        refresh is logged, and retried after `policy.retry` seconds.
+
+        Returns:
+            list[EventChange]: The changes of the refreshed matches.
+        """
+        changes = []
+        for event_id in self._pending(time.time()):
+            if self._stopped is not None and self._stopped.is_set():
+                break
+            wait = self._reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                data = await self.client.get_event(event_id, raw=True)
+            except Exception:
+                logger.exception("Refreshing the event %s failed.", event_id)
+                self._failed(event_id)
+                continue
+            refreshed = self._refreshed(event_id, data)
+            await self._emit_async(refreshed)
+            changes.extend(refreshed)
+        return changes
+
+    async def run(self, stop_when_idle: bool = True) -> None:
+        """
+        Refresh the tracked matches when they are due, until stopped.
+
+        Args:
+            stop_when_idle (bool): Whether to return once no match is tracked,
+                otherwise wait for new ones.
+        """
+        self._stopped = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        while not self._stopped.is_set():
+            await self.tick()
+            due = self._next_due()
+            if due is None and stop_when_idle:
+                break
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    None if due is None else max(0.0, due - time.time()),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """
+        Stop running, from a subscriber or another task.
+        """
+        if self._stopped is not None:
+            self._stopped.set()
+            self._wakeup.set()
+
+
+class _Timelines:
+    """
+    The entries of the match timelines (incidents, comments) already seen,
+    by timeline and event id.
+    """
+
+    def __init__(self) -> None:
+        self._seen: dict[tuple[str, int], dict[tuple, int]] = {}
+        self._seen_lock = threading.Lock()
+
+    def forget(self, event_id: int | None = None) -> None:
+        """
+        Forget the seen entries of a match, so they are all new again.
+
+        Args:
+            event_id (int | None): The event id, every match if None.
+        """
+        with self._seen_lock:
+            if event_id is None:
+                self._seen.clear()
+                return
+            for timeline in TIMELINE_KEYS:
+                self._seen.pop((timeline, event_id), None)
+
+    def _fresh(
+        self,
+        timeline: str,
+        event_id: int,
+        data: list[dict],
+        parse: Callable[[dict], Any],
+    ) -> list:
+        """
+        Parse only the new or amended entries of a timeline.
+
+        Args:
+            timeline (str): The timeline, a key of TIMELINE_KEYS.
+            event_id (int): The event id.
+            data (list[dict]): The raw entries.
+            parse (Callable[[dict], Any]): The parser of an entry.
+
+        Returns:
+            list: The parsed new or amended entries, in the response order.
+        """
+        with self._seen_lock:
+            seen = self._seen.get((timeline, event_id), {})
+        current = {}
+        fresh = []
+        for item in data:
+            base = item.get("id")
+            if base is None:
+                base = dumps([item.get(key) for key in TIMELINE_KEYS[timeline]])
+            key = (base, 0)
+            while key in current:
+                key = (base, key[1] + 1)
+            digest = hash(dumps(item))
+            current[key] = digest
+            if seen.get(key) != digest:
+                fresh.append(parse(item))
+        with self._seen_lock:
+            self._seen[(timeline, event_id)] = current
+        return fresh
+
+
+class MatchTimeline(_Timelines):
+    """
+    Fetches the incidents and comments of matches with a Sofascore client,
+    and returns only the entries added or amended since the previous fetch
+    of the same match. Only those entries are parsed.
+    """
+
+    def __init__(self, client: SofascoreClient) -> None:
+        """
+        Initializes the match timeline.
+
+        Args:
+            client (SofascoreClient): The client fetching the timelines.
+        """
+        super().__init__()
+        self.client = client
+        self._stopped = threading.Event()
+
+    def new_incidents(self, event_id: int) -> list[Incident]:
+        """
+        Get the incidents of a match added or amended since the previous call.
+
+        Args:
+            event_id (int): The event id.
+
+        Returns:
+            list[Incident]: The new or amended incidents.
+        """
+        data = self.client.get_match_incidents(event_id, raw=True)
+        return self._fresh(
+            "incidents", event_id, data.get("incidents", []), parse_incident
+        )
+
+    def new_comments(self, event_id: int) -> list[Comment]:
+        """
+        Get the comments of a match added or amended since the previous call.
+
+        Args:
+            event_id (int): The event id.
+
+        Returns:
+            list[Comment]: The new or amended comments.
+        """
+        data = self.client.get_match_comments(event_id, raw=True)
+        return self._fresh(
+            "comments", event_id, data.get("comments", []), parse_comment
+        )
+
+    def stream_incidents(
+        self, event_id: int, interval: float = 10.0
+    ) -> Iterator[Incident]:
+        """
+        Yield the new or amended incidents of a match, polling every
+        `interval` seconds until stopped.
+
+        Args:
+            event_id (int): The event id.
+            interval (float): Seconds between two polls.
+
+        Returns:
+            Iterator[Incident]: The new or amended incidents.
+        """
+        return self._stream(self.new_incidents, event_id, interval)
+
+    def stream_comments(
+        self, event_id: int, interval: float = 10.0
+    ) -> Iterator[Comment]:
+        """
+        Yield the new or amended comments of a match, polling every
+        `interval` seconds until stopped.
+
+        Args:
+            event_id (int): The event id.
+            interval (float): Seconds between two polls.
+
+        Returns:
+            Iterator[Comment]: The new or amended comments.
+        """
+        return self._stream(self.new_comments, event_id, interval)
+
+    def _stream(
+        self, fetch: Callable[[int], list], event_id: int, interval: float
+    ) -> Iterator:
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            yield from fetch(event_id)
+            self._stopped.wait(interval)
+
+    def stop(self) -> None:
+        """
+        Stop the streams, from another thread or while iterating.
+        """
+        self._stopped.set()
+
+
+class AsyncMatchTimeline(_Timelines):
+    """
+    Fetches the incidents and comments of matches with an asyncio Sofascore
+    client, and returns only the entries added or amended since the previous
+    fetch of the same match. Only those entries are parsed.
+    """
+
+    def __init__(self, client: AsyncSofascoreClient) -> None:
+        """
+        Initializes the match timeline.
+
+        Args:
+            client (AsyncSofascoreClient): The client fetching the timelines.
+        """
+        super().__init__()
+        self.client = client
+        # created by the streams, in the running event loop
+        self._stopped: asyncio.Event | None = None
+
+    async def new_incidents(self, event_id: int) -> list[Incident]:
+        """
+        Get the incidents of a match added or amended since the previous call.
+
+        Args:
+            event_id (int): The event id.
+
+        Returns:
+            list[Incident]: The new or amended incidents.
+        """
+        data = await self.client.get_match_incidents(event_id, raw=True)
+        return self._fresh(
+            "incidents", event_id, data.get("incidents", []), parse_incident
+        )
+
+    async def new_comments(self, event_id: int) -> list[Comment]:
+        """
+        Get the comments of a match added or amended since the previous call.
+
+        Args:
+            event_id (int): The event id.
+
+        Returns:
+            list[Comment]: The new or amended comments.
+        """
+        data = await self.client.get_match_comments(event_id, raw=True)
+        return self._fresh(
+            "comments", event_id, data.get("comments", []), parse_comment
+        )
+
+    def stream_incidents(
+        self, event_id: int, interval: float = 10.0
+    ) -> AsyncIterator[Incident]:
+        """
+        Yield the new or amended incidents of a match, polling every
+        `interval` seconds until stopped.
+
+        Args:
+            event_id (int): The event id.
+            interval (float): Seconds between two polls.
+
+        Returns:
+            AsyncIterator[Incident]: The new or amended incidents.
+        """
+        return self._stream(self.new_incidents, event_id, interval)
+
+    def stream_comments(
+        self, event_id: int, interval: float = 10.0
+    ) -> AsyncIterator[Comment]:
+        """
+        Yield the new or amended comments of a match, polling every
+        `interval` seconds until stopped.
+
+        Args:
+            event_id (int): The event id.
+            interval (float): Seconds between two polls.
+
+        Returns:
+            AsyncIterator[Comment]: The new or amended comments.
+        """
+        return self._stream(self.new_comments, event_id, interval)
+
+    async def _stream(
+        self, fetch: Callable[[int], Any], event_id: int, interval: float
+    ) -> AsyncIterator:
+        if self._stopped is None:
+            self._stopped = asyncio.Event()
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            for entry in await fetch(event_id):
+                yield entry
+            try:
+                await asyncio.wait_for(self._stopped.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """
+        Stop the streams, from another task or while iterating.
+        """
+        if self._stopped is not None:
+            self._stopped.set()
+
+
+class LiveObserver:
+    """
+    Calls the handlers of goals, cards, substitutions, score and status
+    changes from the changes of a live poller or scheduler, and from the new
+    incidents of a timeline. The handlers run in a pool of worker threads, so
+    slow handlers don't stall the polling; handlers of the same match may run
+    concurrently.
+    """
+
+    def __init__(
+        self, timeline: MatchTimeline | None = None, max_workers: int = 4
+    ) -> None:
+        """
+        Initializes the live observer.
+
+        Args:
+            timeline (MatchTimeline | None): The timeline fetching the new
+                incidents of the changed matches. Without one, the incident
+                handlers are only fed by notify_incidents.
+            max_workers (int): The number of worker threads.
+        """
+        self.timeline = timeline
+        self._handlers: dict[str, list[Callable]] = {
+            hook: [] for hook in OBSERVER_HOOKS
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="esd-observer"
+        )
+        # one refresh at a time per match, the matches refresh concurrently
+        self._lock = threading.Lock()
+        self._event_locks: dict[int, threading.Lock] = {}
+        self._active: set[int] = set()
+
+    def __enter__(self) -> LiveObserver:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def on(self, hook: str, handler: Callable) -> Callable:
+        """
+        Register a handler of a hook.
+
+        Args:
+            hook (str): The hook, one of OBSERVER_HOOKS.
+            handler (Callable): The handler.
+
+        Returns:
+            Callable: The handler, so this can be used as a decorator.
+        """
+        if hook not in self._handlers:
+            raise ValueError(f"Unknown hook: {hook}")
+        self._handlers[hook].append(handler)
+        return handler
+
+    def on_goal(self, handler: Callable[[int, Incident], Any]) -> Callable:
+        """
+        Call the handler with the event id and every new or amended goal.
+        """
+        return self.on("goal", handler)
+
+    def on_card(self, handler: Callable[[int, Incident], Any]) -> Callable:
+        """
+        Call the handler with the event id and every new or amended card.
+        """
+        return self.on("card", handler)
+
+    def on_red_card(self, handler: Callable[[int, Incident], Any]) -> Callable:
+        """
+        Call the handler with the event id and every new or amended red card,
+        including second yellow cards.
+        """
+        return self.on("red_card", handler)
+
+    def on_substitution(self, handler: Callable[[int, Incident], Any]) -> Callable:
+        """
+        Call the handler with the event id and every new substitution.
+        """
+        return self.on("substitution", handler)
+
+    def on_incident(self, handler: Callable[[int, Incident], Any]) -> Callable:
+        """
+        Call the handler with the event id and every new or amended incident.
+        """
+        return self.on("incident", handler)
+
+    def on_score_change(self, handler: Callable[[EventChange], Any]) -> Callable:
+        """
+        Call the handler with every score change of an event.
+        """
+        return self.on("score_change", handler)
+
+    def on_status_change(self, handler: Callable[[EventChange], Any]) -> Callable:
+        """
+        Call the handler with every status change of an event.
+        """
+        return self.on("status_change", handler)
+
+    def on_error(self, handler: Callable[[Exception], Any]) -> Callable:
+        """
+        Call the handler with the exceptions raised by the other handlers,
+        logged when there is none.
+        """
+        return self.on("error", handler)
+
+    def attach(self, source: _LiveEvents) -> Callable[[], None]:
+        """
+        Observe the changes of a live poller or match scheduler.
+
+        Args:
+            source (_LiveEvents): The poller or scheduler.
+
+        Returns:
+            Callable[[], None]: A function detaching the observer.
+        """
+        return source.subscribe(self.notify_change)
+
+    def notify_change(self, change: EventChange) -> None:
+        """
+        Dispatch an event change, and the new incidents of the changed match
+        when the observer has a timeline. The timeline of a removed match is
+        forgotten.
+
+        Args:
+            change (EventChange): The event change.
+        """
+        if change.kind == CHANGED:
+            if "score" in change.aspects:
+                self._dispatch("score_change", change)
+            if "status" in change.aspects:
+                self._dispatch("status_change", change)
+        if self.timeline is None:
+            return
+        event_id = change.event.id
+        with self._lock:
+            if change.kind == REMOVED:
+                # nothing more to follow, a refresh in flight forgets it too
+                self._active.discard(event_id)
+                self._event_locks.pop(event_id, None)
+                self.timeline.forget(event_id)
+                return
+            self._active.add(event_id)
+        # the incidents of a match seen for the first time are not new
+        self._executor.submit(self._refresh, event_id, change.kind == CHANGED)
+
+    def notify_incidents(self, event_id: int, incidents: list[Incident]) -> None:
+        """
+        Dispatch the new or amended incidents of a match.
+
+        Args:
+            event_id (int): The event id.
+            incidents (list[Incident]): The incidents.
+        """
+        for incident in incidents:
+            for hook in self._incident_hooks(incident):
+                self._dispatch(hook, event_id, incident)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads.
+
+        Args:
+            wait (bool): Whether to wait for the pending handlers.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _refresh(self, event_id: int, dispatch: bool) -> None:
+        with self._lock:
+            event_lock = self._event_locks.setdefault(event_id, threading.Lock())
+        try:
+            # the fetches of other matches don't wait for this one
+            with event_lock:
+                incidents = self.timeline.new_incidents(event_id)
+                with self._lock:
+                    if event_id not in self._active:
+                        # removed while refreshing
+                        self.timeline.forget(event_id)
+        except Exception as exc:
+            self._failed(exc)
+            return
+        if not dispatch:
+            return
+        # already in a worker, which also lets close wait for these handlers
+        for incident in incidents:
+            for hook in self._incident_hooks(incident):
+                for handler in list(self._handlers[hook]):
+                    self._call(handler, (event_id, incident))
+
+    def _incident_hooks(self, incident: Incident) -> list[str]:
+        hooks = ["incident"]
+        if incident.type == IncidentType.GOAL:
+            hooks.append("goal")
+        elif incident.type == IncidentType.CARD:
+            hooks.append("card")
+            if incident.details in RED_CARDS:
+                hooks.append("red_card")
+        elif incident.type == IncidentType.SUBSTITUTION:
+            hooks.append("substitution")
+        return hooks
+
+    def _dispatch(self, hook: str, *args: Any) -> None:
+        for handler in list(self._handlers[hook]):
+            self._executor.submit(self._call, handler, args)
+
+    def _call(self, handler: Callable, args: tuple) -> None:
+        try:
+            handler(*args)
+        except Exception as exc:
+            self._failed(exc)
+
+    def _failed(self, exc: Exception) -> None:
+        if not self._handlers["error"]:
+            logger.error("A live observer handler failed.", exc_info=exc)
+            return
+        for handler in list(self._handlers["error"]):
+            try:
+                handler(exc)
+            except Exception:
+                logger.exception("A live observer error handler failed.")
@@ -0,0 +1,308 @@
+"""
+This module contains a local server fanning out the live events to many
+subscribers over Server-Sent Events, from a single upstream poller.
+
+The upstream load stays the same whatever the number of subscribers:
+one live poll every `interval` seconds, plus the incidents of the changed
+matches. Run it with:
+
+python -m esd.sofascore --port 8765
+
+Then subscribe to http://127.0.0.1:8765/events (e.g. `new EventSource(...)`
+in a browser, or `curl -N`). The stream starts with a "snapshot" message
+holding the current live events, followed by "added", "changed", "removed"
+and "incident" messages. http://127.0.0.1:8765/snapshot returns the current
+live events as JSON.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from ..decoder import dumps
+from .client import SofascoreClient
+from .live import EventChange, LiveObserver, LivePoller, MatchTimeline
+from .types import Incident
+
+logger = logging.getLogger(__name__)
+
+
+def to_json(value: Any) -> Any:
+    """
+    Convert parsed objects (data classes, enums) to JSON serializable values.
+
+    Args:
+        value (Any): The value, e.g. an Event.
+
+    Returns:
+        Any: The JSON serializable value.
+    """
+    if is_dataclass(value):
+        return {item.name: to_json(getattr(value, item.name)) for item in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    return value
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    live: LiveServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _HTTPServer
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        if path == "/events":
+            self._stream()
+        elif path == "/snapshot":
+            body = dumps(self.server.live.snapshot())
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_error(404)
+
+    def _stream(self) -> None:
+        live = self.server.live
+        subscriber = live._subscribe()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "keep-alive")
+            self.end_headers()
+            while True:
+                try:
+                    message = subscriber.get(timeout=live.keep_alive)
+                except queue.Empty:
+                    message = b": keep-alive\n\n"
+                if message is None or not live._subscribed(subscriber):
+                    break
+                self.wfile.write(message)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            live._unsubscribe(subscriber)
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # keep the console for the poller errors
+        pass
+
+
+class LiveServer:
+    """
+    A local server running one live poller, and pushing the live event
+    changes and the new incidents to its subscribers over Server-Sent Events.
+    Each message is encoded once, whatever the number of subscribers.
+    """
+
+    def __init__(
+        self,
+        client: SofascoreClient | None = None,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        interval: float = 10.0,
+        incidents: bool = True,
+        keep_alive: float = 15.0,
+        queue_size: int = 1000,
+    ) -> None:
+        """
+        Initializes the live server.
+
+        Args:
+            client (SofascoreClient | None): The client polling the live events.
+                A client created when None is closed with the server.
+            host (str): The listening host.
+            port (int): The listening port, any free port if 0.
+            interval (float): Seconds between two live polls.
+            incidents (bool): Whether to also push the new incidents of the
+                changed matches.
+            keep_alive (float): Seconds between two keep-alive comments of an
+                idle stream.
+            queue_size (int): The pending messages of a subscriber before it
+                is dropped, so a slow subscriber can't hold the memory.
+        """
+        self.__owns_client = client is None
+        self.client = client or SofascoreClient()
+        self.interval = interval
+        self.keep_alive = keep_alive
+        self.queue_size = queue_size
+        self.poller = LivePoller(self.client, interval=interval)
+        self.poller.subscribe(self._on_change)
+        self.observer: LiveObserver | None = None
+        if incidents:
+            self.observer = LiveObserver(MatchTimeline(self.client))
+            self.observer.attach(self.poller)
+            self.observer.on_incident(self._on_incident)
+        # held while applying a poll, so the snapshots and the changes are
+        # queued in order
+        self._lock = threading.RLock()
+        self._subscribers: set[queue.Queue] = set()
+        self._snapshot: list[dict] = []
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.live = self
+
+    def __enter__(self) -> LiveServer:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        Get the listening host and port.
+        """
+        host, port = self._httpd.server_address[:2]
+        return host, port
+
+    @property
+    def subscribers(self) -> int:
+        """
+        Get the number of connected subscribers.
+        """
+        return len(self._subscribers)
+
+    def snapshot(self) -> list[dict]:
+        """
+        Get the live events of the last poll. The list is replaced, never
+        changed, by the next polls.
+
+        Returns:
+            list[dict]: The live events, as JSON serializable values.
+        """
+        return self._snapshot
+
+    def start(self) -> None:
+        """
+        Start serving and polling, in background threads.
+        """
+        if self._closed:
+            raise RuntimeError("Live server is closed.")
+        self._stopped.clear()
+        self._threads = [
+            threading.Thread(target=self._httpd.serve_forever, daemon=True),
+            threading.Thread(target=self._poll_forever, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def serve_forever(self) -> None:
+        """
+        Start serving and polling, until interrupted or stopped.
+        """
+        self.start()
+        try:
+            self._stopped.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """
+        Stop polling, disconnect the subscribers and close the server,
+        which can't be started again.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._stopped.set()
+        if self._threads:
+            self._httpd.shutdown()
+        self._httpd.server_close()
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, set()
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(None)
+            except queue.Full:
+                pass
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self.observer is not None:
+            self.observer.close()
+        if self.__owns_client:
+            self.client.close()
+
+    def _poll_forever(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self._poll()
+            except Exception:
+                # keep serving, the next poll may succeed
+                logger.exception("Polling the live events failed.")
+            self._stopped.wait(self.interval)
+
+    def _poll(self) -> None:
+        """
+        Poll the live events, broadcast their changes and publish the new
+        snapshot, without any subscriber joining in between. The request
+        runs outside the lock, so it never holds up the subscribers.
+        """
+        data = self.poller._fetch()
+        with self._lock:
+            if self.poller._apply(data):
+                self._snapshot = to_json(self.poller.events)
+
+    def _on_change(self, change: EventChange) -> None:
+        self._broadcast(
+            change.kind,
+            {
+                "kind": change.kind,
+                "aspects": list(change.aspects),
+                "event": to_json(change.event),
+            },
+        )
+
+    def _on_incident(self, event_id: int, incident: Incident) -> None:
+        self._broadcast(
+            "incident", {"event_id": event_id, "incident": to_json(incident)}
+        )
+
+    def _broadcast(self, name: str, data: Any) -> None:
+        message = b"event: " + name.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+        with self._lock:
+            for subscriber in list(self._subscribers):
+                try:
+                    subscriber.put_nowait(message)
+                except queue.Full:
+                    self._subscribers.discard(subscriber)
+
+    def _subscribe(self) -> queue.Queue:
+        subscriber = queue.Queue(self.queue_size)
+        with self._lock:
+            # between two polls: the later changes apply to this snapshot
+            subscriber.put_nowait(
+                b"event: snapshot\ndata: " + dumps(self._snapshot) + b"\n\n"
+            )
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def _subscribed(self, subscriber: queue.Queue) -> bool:
+        return subscriber in self._subscribers
+
+    def _unsubscribe(self, subscriber: queue.Queue) -> None:
+        with self._lock:
+            self._subscribers.discard(subscriber)
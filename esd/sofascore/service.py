@@ -4,7 +4,17 @@ Sofascore service module
 
 from __future__ import annotations
 
-from ..utils import get_api_json, get_today
+from collections.abc import Iterable
+from contextlib import nullcontext
+from copy import copy
+from functools import partial
+from typing import Any, Callable
+
+from ..breaker import CircuitOpenError
+from ..cache import IdentityMap, ParseMemo
+from ..transport import SingleFlight, Transport
+from ..utils import get_today
+from .cache import SofascoreCache, SofascoreDiskCache
 from .endpoints import SofascoreEndpoints
 from .types import (
     Bracket,
@@ -14,6 +24,7 @@ from .types import (
     Event,
     Incident,
     Lineups,
+    MatchBundle,
     MatchStats,
     Player,
     PlayerAttributes,
@@ -27,6 +38,7 @@ from .types import (
     Tournament,
     TransferHistory,
     parse_brackets,
+    parse_bundle_parts,
     parse_comments,
     parse_event,
     parse_events,
@@ -48,176 +60,510 @@ from .types import (
 )
 
 
+def _parse_search_results(
+    data: dict, entity: EntityType = EntityType.ALL
+) -> list[Event | Team | Player | Tournament]:
+    """
+    Parse the results of a search.
+
+    Args:
+        data (dict): The search response.
+        entity (EntityType): The entity type searched.
+
+    Returns:
+        list[Event | Team | Player | Tournament]: The parsed results.
+    """
+    results = data["results"]
+
+    specific_parsers = {
+        EntityType.TEAM: parse_team,
+        EntityType.PLAYER: parse_player,
+        EntityType.EVENT: parse_event,
+        EntityType.TOURNAMENT: parse_tournament,
+    }
+
+    if entity == EntityType.ALL:
+        type_parsers = {
+            "team": parse_team,
+            "player": parse_player,
+            "event": parse_events,
+            "uniqueTournament": parse_tournament,
+        }
+        entities = []
+        for result in results:
+            result_type = result.get("type")
+            entity_data = result.get("entity")
+            parser = type_parsers.get(result_type, lambda x: x)
+            entities.append(parser(entity_data))
+        return entities
+    parser = specific_parsers.get(entity, lambda x: x)
+    return [parser(result.get("entity")) for result in results]
+
+
+def _merge_payloads(*payloads: dict | None) -> dict:
+    """
+    Merge the JSON responses of the endpoints behind one method
+    (e.g. a player, their attributes and transfer history).
+
+    Args:
+        *payloads (dict | None): The JSON responses, whose keys do not overlap.
+
+    Returns:
+        dict: The merged JSON response.
+    """
+    merged = {}
+    for payload in payloads:
+        merged.update(payload or {})
+    return merged
+
+
 class SofascoreService:
     """
     A class to represent the SofaScore service.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        transport: Transport | None = None,
+        cache: SofascoreCache | None = None,
+        disk_cache: SofascoreDiskCache | None = None,
+        lazy_events: bool = False,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
         self.endpoints = SofascoreEndpoints()
+        self.transport = transport or Transport()
+        self.cache = cache
+        self.disk_cache = disk_cache
+        self.lazy_events = lazy_events
+        self.identity_map = identity_map
+        self.memo = ParseMemo() if self.transport.revalidate else None
+        self.flights = SingleFlight() if self.transport.coalesce else None
+
+    def _get_api_json(
+        self, url: str, endpoint: str, event_id: int | None = None
+    ) -> dict:
+        """
+        Get the JSON response of an endpoint, using the caches if enabled.
+        The memory cache is consulted first, then the disk cache. While the
+        circuit of the endpoint is open, an expired cached response is served.
 
-    def get_event(self, event_id: int) -> Event:
+        Args:
+            url (str): The endpoint URL.
+            endpoint (str): The endpoint name, used to pick the cache policy.
+            event_id (int | None): The event id of a per-match endpoint.
+
+        Returns:
+            dict: The JSON response.
+        """
+        if self.cache is not None:
+            data = self.cache.get(url)
+            if data is not None:
+                return data
+        data = None
+        if self.disk_cache is not None:
+            data = self.disk_cache.lookup(url, event_id)
+        if data is None:
+            try:
+                data = self.transport.get_api_json(url)
+            except CircuitOpenError:
+                # the source is failing: serve the expired response if any
+                stale = self.cache.get_stale(url) if self.cache is not None else None
+                if stale is None:
+                    raise
+                return stale
+            if data and self.disk_cache is not None:
+                self.disk_cache.store(url, data, event_id)
+        if data and self.cache is not None:
+            self.cache.store(url, data, endpoint, event_id)
+        return data
+
+    def _parse(self, key: str, parse: Callable[..., Any], *payloads: Any) -> Any:
+        """
+        Parse the given payloads, reusing the last result of the same payloads
+        when the transport revalidates its requests, and sharing the repeated
+        entities through the identity map if enabled.
+
+        Args:
+            key (str): The memo key (e.g. the endpoint URL).
+            parse (Callable[..., Any]): The parser, called with the payloads.
+            *payloads (Any): The JSON responses.
+
+        Returns:
+            Any: The parsed result.
+        """
+        scope = (
+            nullcontext() if self.identity_map is None else self.identity_map.activate()
+        )
+        with scope:
+            if self.memo is None:
+                return parse(*payloads)
+            return self.memo.parse(key, parse, *payloads)
+
+    def _get(
+        self,
+        url: str,
+        endpoint: str,
+        parse: Callable[[dict], Any],
+        event_id: int | None = None,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Get and parse the JSON response of an endpoint.
+        Concurrent calls for the same URL share one request and parsed result.
+
+        Args:
+            url (str): The endpoint URL.
+            endpoint (str): The endpoint name, used to pick the cache policy.
+            parse (Callable[[dict], Any]): The parser of the JSON response.
+            event_id (int | None): The event id of a per-match endpoint.
+            raw (bool): Whether to return the JSON response without parsing it.
+
+        Returns:
+            Any: The parsed response, or the JSON response if raw.
+        """
+
+        def fetch() -> Any:
+            data = self._get_api_json(url, endpoint, event_id)
+            return data if raw else self._parse(url, parse, data)
+
+        if self.flights is None:
+            return fetch()
+        return self.flights.do((url, raw), fetch)
+
+    def get_event(self, event_id: int, raw: bool = False) -> Event:
         try:
             url = self.endpoints.event_endpoint(event_id)
-            data = get_api_json(url)["event"]
-            return parse_event(data)
+            return self._get(
+                url,
+                "event_endpoint",
+                lambda data: parse_event(data["event"]),
+                event_id,
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_events(self, date: str = "today") -> list[Event]:
+    def get_events(self, date: str = "today", raw: bool = False) -> list[Event]:
         if date == "today":
             date = get_today()
         try:
             url = self.endpoints.events_endpoint.format(date=date)
-            return parse_events(get_api_json(url)["events"])
+            return self._get(
+                url,
+                "events_endpoint",
+                lambda data: parse_events(data["events"], self.lazy_events),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_live_events(self) -> list[Event]:
+    def get_live_events(self, raw: bool = False) -> list[Event]:
         try:
             url = self.endpoints.live_events_endpoint
-            return parse_events(get_api_json(url)["events"])
+            return self._get(
+                url,
+                "live_events_endpoint",
+                lambda data: parse_events(data["events"], self.lazy_events),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_player(self, player_id: int) -> Player:
+    def get_player(
+        self,
+        player_id: int,
+        include_attributes: bool = True,
+        include_transfers: bool = True,
+        raw: bool = False,
+    ) -> Player:
         try:
             url = self.endpoints.player_endpoint(player_id)
-            data = get_api_json(url)
+            calls = [partial(self._get_api_json, url, "player_endpoint")]
+            if include_attributes:
+                calls.append(partial(self.get_player_attributes, player_id, raw=raw))
+            if include_transfers:
+                calls.append(
+                    partial(self.get_player_transfer_history, player_id, raw=raw)
+                )
+            data, *extras = self.transport.gather(*calls)
+            if raw:
+                return _merge_payloads(data, *extras)
             if "player" in data:
-                player = parse_player(data["player"])
-                player.attributes = self.get_player_attributes(player_id)
-                player.transfer_history = self.get_player_transfer_history(player_id)
+                # the parsed player may be shared, so the extras go on a copy
+                player = copy(
+                    self._parse(url, lambda data: parse_player(data["player"]), data)
+                )
+                if include_attributes:
+                    player.attributes = extras.pop(0)
+                if include_transfers:
+                    player.transfer_history = extras.pop(0)
                 return player
             return Player()
         except Exception as exc:
             raise exc
 
-    def get_player_attributes(self, player_id: int) -> PlayerAttributes:
+    def get_player_attributes(
+        self, player_id: int, raw: bool = False
+    ) -> PlayerAttributes:
         try:
             url = self.endpoints.player_attributes_endpoint(player_id)
-            data = get_api_json(url)
-            if "playerAttributes" in data:
-                return parse_player_attributes(data["playerAttributes"])
-            return PlayerAttributes()
+            return self._get(
+                url,
+                "player_attributes_endpoint",
+                lambda data: (
+                    parse_player_attributes(data["playerAttributes"])
+                    if "playerAttributes" in data
+                    else PlayerAttributes()
+                ),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_player_transfer_history(self, player_id: int) -> TransferHistory:
+    def get_player_transfer_history(
+        self, player_id: int, raw: bool = False
+    ) -> TransferHistory:
         try:
             url = self.endpoints.player_transfer_history_endpoint(player_id)
-            data = get_api_json(url)
-            if data is not None:
-                return parse_transfer_history(data)
-            return TransferHistory()
+            return self._get(
+                url,
+                "player_transfer_history_endpoint",
+                lambda data: (
+                    parse_transfer_history(data)
+                    if data is not None
+                    else TransferHistory()
+                ),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
     def get_player_stats(self, player_id: int) -> dict:
         try:
             url = self.endpoints.player_stats_endpoint(player_id)
-            return get_api_json(url)
+            return self._get_api_json(url, "player_stats_endpoint")
         except Exception as exc:
             raise exc
 
-    def get_match_lineups(self, event_id: int) -> Lineups:
+    def get_match_lineups(self, event_id: int, raw: bool = False) -> Lineups:
         try:
             url = self.endpoints.match_lineups_endpoint(event_id)
-            return parse_lineups(get_api_json(url))
+            return self._get(
+                url, "match_lineups_endpoint", parse_lineups, event_id, raw=raw
+            )
         except Exception as exc:
             raise exc
 
-    def get_match_incidents(self, event_id: int) -> list[Incident]:
+    def get_match_incidents(self, event_id: int, raw: bool = False) -> list[Incident]:
         try:
             url = self.endpoints.match_events_endpoint(event_id)
-            data = get_api_json(url)["incidents"]
-            return parse_incidents(data)
+            return self._get(
+                url,
+                "match_events_endpoint",
+                lambda data: parse_incidents(data["incidents"]),
+                event_id,
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_match_top_players(self, event_id: int) -> TopPlayersMatch:
+    def get_match_top_players(
+        self, event_id: int, raw: bool = False
+    ) -> TopPlayersMatch:
         try:
             url = self.endpoints.match_top_players_endpoint(event_id)
-            return parse_top_players_match(get_api_json(url))
+            return self._get(
+                url,
+                "match_top_players_endpoint",
+                parse_top_players_match,
+                event_id,
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_match_comments(self, event_id: int) -> list[Comment]:
+    def get_match_comments(self, event_id: int, raw: bool = False) -> list[Comment]:
         try:
             url = self.endpoints.match_comments_endpoint(event_id)
-            data = get_api_json(url)["comments"]
-            return parse_comments(data)
+            return self._get(
+                url,
+                "match_comments_endpoint",
+                lambda data: parse_comments(data["comments"]),
+                event_id,
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_match_stats(self, event_id: int) -> MatchStats:
+    def get_match_stats(
+        self, event_id: int, win_probability: bool = True, raw: bool = False
+    ) -> MatchStats:
         try:
-            url = self.endpoints.match_stats_endpoint(event_id)
-            data = get_api_json(url).get("statistics", {})
-            url = self.endpoints.match_probabilities_endpoint(event_id)
-            win_probabilities = get_api_json(url).get("winProbability", {})
-            return parse_match_stats(data, win_probabilities)
+            stats_url = self.endpoints.match_stats_endpoint(event_id)
+            if not win_probability:
+                return self._get(
+                    stats_url,
+                    "match_stats_endpoint",
+                    lambda data: parse_match_stats(data.get("statistics", {})),
+                    event_id,
+                    raw=raw,
+                )
+            probabilities_url = self.endpoints.match_probabilities_endpoint(event_id)
+            data, probabilities = self.transport.gather(
+                partial(
+                    self._get_api_json, stats_url, "match_stats_endpoint", event_id
+                ),
+                partial(
+                    self._get_api_json,
+                    probabilities_url,
+                    "match_probabilities_endpoint",
+                    event_id,
+                ),
+            )
+            if raw:
+                return _merge_payloads(data, probabilities)
+            return self._parse(
+                probabilities_url,
+                lambda data, probabilities: parse_match_stats(
+                    data.get("statistics", {}), probabilities.get("winProbability", {})
+                ),
+                data,
+                probabilities,
+            )
         except Exception as exc:
             raise exc
 
-    def get_match_shots(self, event_id: int) -> dict:
+    def get_match_shots(self, event_id: int, raw: bool = False) -> dict:
         try:
             url = self.endpoints.match_shots_endpoint(event_id)
-            data = get_api_json(url)
-            if "shotmap" in data:
-                return parse_shots(data["shotmap"])
-            return Shot()
+            return self._get(
+                url,
+                "match_shots_endpoint",
+                lambda data: (
+                    parse_shots(data["shotmap"]) if "shotmap" in data else Shot()
+                ),
+                event_id,
+                raw=raw,
+            )
+        except Exception as exc:
+            raise exc
+
+    def get_match_bundle(
+        self, event_id: int, include: Iterable[str] | None = None, raw: bool = False
+    ) -> MatchBundle:
+        try:
+            parts = parse_bundle_parts(include)
+            fetchers = {
+                "event": self.get_event,
+                "stats": self.get_match_stats,
+                "lineups": self.get_match_lineups,
+                "incidents": self.get_match_incidents,
+                "shots": self.get_match_shots,
+                "comments": self.get_match_comments,
+                "top_players": self.get_match_top_players,
+            }
+            results = {}
+            if (
+                "event" in parts
+                and self.disk_cache is not None
+                and not self.disk_cache.is_finished(event_id)
+            ):
+                # the event status decides whether the other parts are persisted
+                results["event"] = self.get_event(event_id, raw=raw)
+            rest = [part for part in parts if part not in results]
+            results.update(
+                zip(
+                    rest,
+                    self.transport.gather(
+                        *(partial(fetchers[part], event_id, raw=raw) for part in rest)
+                    ),
+                )
+            )
+            results = {part: results[part] for part in parts}
+            if raw:
+                return results
+            return MatchBundle(**results)
         except Exception as exc:
             raise exc
 
-    def get_team(self, team_id: int) -> Team:
+    def get_team(self, team_id: int, raw: bool = False) -> Team:
         try:
             url = self.endpoints.team_endpoint(team_id)
-            data = get_api_json(url)["team"]
-            return parse_team(data)
+            return self._get(
+                url, "team_endpoint", lambda data: parse_team(data["team"]), raw=raw
+            )
         except Exception as exc:
             raise exc
 
-    def get_team_players(self, team_id: int) -> list[Player]:
+    def get_team_players(self, team_id: int, raw: bool = False) -> list[Player]:
         try:
             url = self.endpoints.team_players_endpoint(team_id)
-            return [
-                parse_player(player["player"])
-                for player in get_api_json(url)["players"]
-            ]
+            return self._get(
+                url,
+                "team_players_endpoint",
+                lambda data: [
+                    parse_player(player["player"]) for player in data["players"]
+                ],
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_team_events(self, team_id: int, upcoming: bool, page: int) -> list[Event]:
+    def get_team_events(
+        self, team_id: int, upcoming: bool, page: int, raw: bool = False
+    ) -> list[Event]:
         try:
             url = self.endpoints.team_events_endpoint(team_id, upcoming, page)
-            data = get_api_json(url)
-            if "events" in data:
-                return parse_events(data["events"])
-            return []
+            return self._get(
+                url,
+                "team_events_endpoint",
+                lambda data: (
+                    parse_events(data["events"], self.lazy_events)
+                    if "events" in data
+                    else []
+                ),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_tournaments_by_category(self, category_id: Category) -> list[Tournament]:
+    def get_tournaments_by_category(
+        self, category_id: Category, raw: bool = False
+    ) -> list[Tournament]:
         if not isinstance(category_id, Category):
             raise ValueError("category_id must be an instance of Category Enum")
         try:
             url = self.endpoints.tournaments_endpoint(category_id.value)
-            data = get_api_json(url)["groups"][0].get("uniqueTournaments", [])
-            return parse_tournaments(data)
+            return self._get(
+                url,
+                "tournaments_endpoint",
+                lambda data: parse_tournaments(
+                    data["groups"][0].get("uniqueTournaments", [])
+                ),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
-    def get_tournament_seasons(self, tournament_id: int) -> list[Season]:
+    def get_tournament_seasons(
+        self, tournament_id: int, raw: bool = False
+    ) -> list[Season]:
         try:
             url = self.endpoints.tournament_seasons_endpoint(tournament_id)
-            data = get_api_json(url)["seasons"]
-            return parse_seasons(data)
+            return self._get(
+                url,
+                "tournament_seasons_endpoint",
+                lambda data: parse_seasons(data["seasons"]),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
     def get_tournament_bracket(
-        self, tournament_id: int | Tournament, season_id: int | Season
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
     ) -> list[Bracket]:
         try:
             if isinstance(tournament_id, Tournament):
@@ -225,13 +571,20 @@ class SofascoreService:
             if isinstance(season_id, Season):
                 season_id = season_id.id
             url = self.endpoints.tournament_bracket_endpoint(tournament_id, season_id)
-            data = get_api_json(url)["cupTrees"]
-            return parse_brackets(data)
+            return self._get(
+                url,
+                "tournament_bracket_endpoint",
+                lambda data: parse_brackets(data["cupTrees"]),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
     def get_tournament_standings(
-        self, tournament_id: int | Tournament, season_id: int | Season
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
     ) -> list[Standing]:
         try:
             if isinstance(tournament_id, Tournament):
@@ -239,13 +592,20 @@ class SofascoreService:
             if isinstance(season_id, Season):
                 season_id = season_id.id
             url = self.endpoints.tournament_standings_endpoint(tournament_id, season_id)
-            data = get_api_json(url)["standings"]
-            return parse_standings(data)
+            return self._get(
+                url,
+                "tournament_standings_endpoint",
+                lambda data: parse_standings(data["standings"]),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
     def get_tournament_top_teams(
-        self, tournament_id: int | Tournament, season_id: int | Season
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
     ) -> TopTournamentTeams:
         try:
             if isinstance(tournament_id, Tournament):
@@ -253,15 +613,24 @@ class SofascoreService:
             if isinstance(season_id, Season):
                 season_id = season_id.id
             url = self.endpoints.tournament_topteams_endpoint(tournament_id, season_id)
-            response = get_api_json(url)
-            if "topTeams" in response:
-                return parse_top_tournament_teams(response["topTeams"])
-            return TopTournamentTeams()
+            return self._get(
+                url,
+                "tournament_topteams_endpoint",
+                lambda data: (
+                    parse_top_tournament_teams(data["topTeams"])
+                    if "topTeams" in data
+                    else TopTournamentTeams()
+                ),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
     def get_tournament_top_players(
-        self, tournament_id: int | Tournament, season_id: int | Season
+        self,
+        tournament_id: int | Tournament,
+        season_id: int | Season,
+        raw: bool = False,
     ) -> TopTournamentPlayers:
         try:
             if isinstance(tournament_id, Tournament):
@@ -271,57 +640,55 @@ class SofascoreService:
             url = self.endpoints.tournament_topplayers_endpoint(
                 tournament_id, season_id
             )
-            data = get_api_json(url)
-            if "topPlayers" in data:
-                return parse_top_tournament_players(data["topPlayers"])
-            return TopTournamentPlayers()
+            return self._get(
+                url,
+                "tournament_topplayers_endpoint",
+                lambda data: (
+                    parse_top_tournament_players(data["topPlayers"])
+                    if "topPlayers" in data
+                    else TopTournamentPlayers()
+                ),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
     def get_tournament_events(
-        self, tournament_id: int, season_id: int, upcoming: bool, page: int
+        self,
+        tournament_id: int,
+        season_id: int,
+        upcoming: bool,
+        page: int,
+        raw: bool = False,
     ) -> list[Event]:
         try:
             url = self.endpoints.tournament_events_endpoint(
                 tournament_id, season_id, upcoming, page
             )
-            data = get_api_json(url)
-            if "events" in data:
-                return parse_events(data["events"])
-            return []
+            return self._get(
+                url,
+                "tournament_events_endpoint",
+                lambda data: (
+                    parse_events(data["events"], self.lazy_events)
+                    if "events" in data
+                    else []
+                ),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
 
     def search(
-        self, query: str, entity: EntityType = EntityType.ALL
+        self, query: str, entity: EntityType = EntityType.ALL, raw: bool = False
     ) -> list[Event | Team | Player | Tournament]:
         try:
             entity_type = entity.value
             url = self.endpoints.search_endpoint(query=query, entity_type=entity_type)
-            results = get_api_json(url)["results"]
-
-            specific_parsers = {
-                EntityType.TEAM: parse_team,
-                EntityType.PLAYER: parse_player,
-                EntityType.EVENT: parse_event,
-                EntityType.TOURNAMENT: parse_tournament,
-            }
-
-            if entity == EntityType.ALL:
-                type_parsers = {
-                    "team": parse_team,
-                    "player": parse_player,
-                    "event": parse_events,
-                    "uniqueTournament": parse_tournament,
-                }
-                entities = []
-                for result in results:
-                    result_type = result.get("type")
-                    entity_data = result.get("entity")
-                    parser = type_parsers.get(result_type, lambda x: x)
-                    entities.append(parser(entity_data))
-                return entities
-            parser = specific_parsers.get(entity, lambda x: x)
-            return [parser(result.get("entity")) for result in results]
+            return self._get(
+                url,
+                "search_endpoint",
+                partial(_parse_search_results, entity=entity),
+                raw=raw,
+            )
         except Exception as exc:
             raise exc
@@ -4,12 +4,19 @@ Contains the types for the Sofascore service.
 
 from .bracket import Bracket, parse_bracket, parse_brackets
 from .categories import Category
-from .comment import Comment, CommentType, parse_comments
+from .comment import Comment, CommentType, parse_comment, parse_comments
 from .entity import EntityType
-from .event import Event, parse_event, parse_events
+from .event import Event, LazyEvent, parse_event, parse_events
 from .incident import Incident, IncidentType, parse_incident, parse_incidents
 from .lineup import Lineups, PlayerLineup, TeamColor, TeamLineup, parse_lineups
-from .match_stats import MatchStats, parse_match_stats
+from .match_bundle import MATCH_BUNDLE_PARTS, MatchBundle, parse_bundle_parts
+from .match_stats import (
+    MatchStats,
+    match_stats_arrays,
+    match_stats_columns,
+    match_stats_dataframe,
+    parse_match_stats,
+)
 from .player import Player, parse_player
 from .player_attributes import PlayerAttributes, parse_player_attributes
 from .season import Season, parse_season, parse_seasons
@@ -25,6 +32,7 @@ from .transfer import TransferHistory, parse_transfer_history
 
 __all__ = [
     "Event",
+    "LazyEvent",
     "parse_events",
     "parse_event",
     "Tournament",
@@ -38,6 +46,7 @@ __all__ = [
     "parse_shots",
     "Comment",
     "CommentType",
+    "parse_comment",
     "parse_comments",
     "TopPlayersMatch",
     "parse_top_players_match",
@@ -64,6 +73,12 @@ __all__ = [
     "parse_player_attributes",
     "MatchStats",
     "parse_match_stats",
+    "match_stats_columns",
+    "match_stats_arrays",
+    "match_stats_dataframe",
+    "MatchBundle",
+    "MATCH_BUNDLE_PARTS",
+    "parse_bundle_parts",
     "Lineups",
     "PlayerLineup",
     "TeamColor",
@@ -5,10 +5,12 @@ This module contains the dataclasses for the UEFA Champions League cupTree.
 from dataclasses import dataclass, field
 from typing import Optional
 
+from ...utils import add_slots
 from .team import Team, parse_team
 from .tournament import Tournament, parse_tournament
 
 
+@add_slots
 @dataclass
 class Participant:
     """
@@ -41,6 +43,7 @@ def parse_participant(data: dict) -> Participant:
     )
 
 
+@add_slots
 @dataclass
 class Block:
     """
@@ -84,6 +87,7 @@ def parse_block(data: dict) -> Block:
     )
 
 
+@add_slots
 @dataclass
 class Round:
     """
@@ -114,6 +118,7 @@ def parse_round(data: dict) -> Round:
     )
 
 
+@add_slots
 @dataclass
 class Bracket:
     """
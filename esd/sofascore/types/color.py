@@ -4,7 +4,10 @@ Represents a color object.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 
+
+@add_slots
 @dataclass
 class Color:
     """
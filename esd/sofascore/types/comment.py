@@ -5,6 +5,7 @@ This module contains the dataclass for the comment object.
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ...utils import add_slots
 from .player import Player, parse_player
 
 
@@ -40,6 +41,7 @@ class CommentType(Enum):
     UNKNOWN = "unknown"
 
 
+@add_slots
 @dataclass
 class Comment:
     """
@@ -4,7 +4,10 @@ Contains the country dataclass and the function to parse the country data.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 
+
+@add_slots
 @dataclass
 class Country:
     """
@@ -3,15 +3,19 @@ Contains the event data types and parsers (also known as matches).
 """
 
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from typing import Any, Optional
 
+from ...cache import active_identity_map
+from ...utils import add_slots
 from .status import Status, parse_status
 from .team import Team, parse_team
 from .team_score import TeamScore, parse_team_score
 from .tournament import Tournament, parse_tournament
 
 
+@add_slots
 @dataclass
 class Season:
     """
@@ -25,6 +29,7 @@ class Season:
     id: int
 
 
+@add_slots
 @dataclass
 class RoundInfo:
     """
@@ -36,6 +41,7 @@ class RoundInfo:
     cup_round_type: int
 
 
+@add_slots
 @dataclass
 class TimeEvent:
     """
@@ -49,6 +55,7 @@ class TimeEvent:
     current_period_start: int = 0
 
 
+@add_slots
 @dataclass
 class StatusTime:
     """
@@ -61,6 +68,7 @@ class StatusTime:
     extra: int = 0
 
 
+@add_slots
 @dataclass
 class Event:
     """
@@ -180,6 +188,81 @@ def parse_round_info(data: dict) -> RoundInfo:
     )
 
 
+class LazyEvent(Event):
+    """
+    Event that keeps the raw event data and parses its nested objects
+    (tournament, teams, scores, status...) on first access.
+    It has the same attributes as Event, so reading only a few of them
+    (e.g. the id and the status) of a large list of events is cheap.
+    """
+
+    __slots__ = ("_data", "_identity_map")
+
+    _nested = {
+        "status": ("status", parse_status),
+        "home_team": ("homeTeam", parse_team),
+        "home_score": ("homeScore", parse_team_score),
+        "away_team": ("awayTeam", parse_team),
+        "away_score": ("awayScore", parse_team_score),
+        "time": ("time", parse_time_event),
+        "tournament": ("tournament", parse_tournament),
+        "status_time": ("statusTime", parse_status_time),
+        "round_info": ("roundInfo", parse_round_info),
+    }
+
+    def __new__(cls, data: Optional[dict] = None, /, **values: Any) -> Event:
+        # dataclasses.replace (and copy.replace) call the class with every
+        # field as a keyword, which builds a plain, fully parsed Event
+        if data is None:
+            return Event(**values)
+        return super().__new__(cls)
+
+    def __init__(self, data: dict) -> None:
+        """
+        Initializes the event, parsing only the scalar fields.
+
+        Args:
+            data (dict): The event data.
+        """
+        self._data = data
+        # the nested objects are parsed later, in the same identity map
+        self._identity_map = active_identity_map()
+        self.id = data.get("id")
+        self.start_timestamp = data.get("startTimestamp")
+        self.slug = data.get("slug")
+
+    def __getattr__(self, name: str) -> Any:
+        # only called while the slot of a nested object is empty
+        if name not in self._nested:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        key, parse = self._nested[name]
+        if self._identity_map is None:
+            value = parse(self._data.get(key, {}))
+        else:
+            with self._identity_map.activate():
+                value = parse(self._data.get(key, {}))
+        setattr(self, name, value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyEvent):
+            other = other.materialize()
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.materialize() == other
+
+    def materialize(self) -> Event:
+        """
+        Parse the remaining nested objects into a plain Event.
+
+        Returns:
+            Event: The fully parsed event, equal to `parse_event` of the data.
+        """
+        return Event(**{item.name: getattr(self, item.name) for item in fields(Event)})
+
+
 def parse_event(data: dict) -> Event:
     """
     Parse the event data.
@@ -210,14 +293,18 @@ def parse_event(data: dict) -> Event:
     )
 
 
-def parse_events(events: list[dict]) -> list[Event]:
+def parse_events(events: list[dict], lazy: bool = False) -> list[Event]:
     """
     Parse the events data.
 
     Args:
         events (list): The events data.
+        lazy (bool): Whether to parse the nested objects of each event
+            on first access (see LazyEvent).
 
     Returns:
         list[Event]: The parsed events data.
     """
+    if lazy:
+        return [LazyEvent(event) for event in events]
     return [parse_event(event) for event in events]
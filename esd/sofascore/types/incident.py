@@ -5,6 +5,7 @@ This module contains the dataclass for the incident object.
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ...utils import add_slots
 from .player import Player, parse_player
 
 
@@ -24,6 +25,7 @@ class IncidentType(Enum):
     UNKNOWN = "unknown"
 
 
+@add_slots
 @dataclass
 class Incident:
     """
@@ -5,9 +5,11 @@ This module contains the dataclasses for the Lineups object.
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from ...utils import add_slots
 from .player import Player, parse_player
 
 
+@add_slots
 @dataclass
 class Statistics:
     """
@@ -37,6 +39,7 @@ class Statistics:
     aerial_lost: Optional[int] = field(default=None)
 
 
+@add_slots
 @dataclass
 class PlayerLineup:
     """
@@ -52,6 +55,7 @@ class PlayerLineup:
     statistics: Optional[Statistics] = field(default=None)
 
 
+@add_slots
 @dataclass
 class MissingPlayer:
     """
@@ -62,6 +66,7 @@ class MissingPlayer:
     reason: int = field(default=0)
 
 
+@add_slots
 @dataclass
 class TeamColor:
     """
@@ -74,6 +79,7 @@ class TeamColor:
     fancy_number: str = field(default="")
 
 
+@add_slots
 @dataclass
 class TeamLineup:
     """
@@ -88,6 +94,7 @@ class TeamLineup:
     goalkeeper_color: TeamColor = field(default=None)
 
 
+@add_slots
 @dataclass
 class Lineups:
     """
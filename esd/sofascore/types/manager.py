@@ -4,9 +4,11 @@ The manager type. Used in the team type.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .country import Country, parse_country
 
 
+@add_slots
 @dataclass
 class Manager:
     """
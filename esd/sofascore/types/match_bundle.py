@@ -0,0 +1,73 @@
+"""
+This module contains the match bundle dataclass.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ...utils import add_slots
+from .comment import Comment
+from .event import Event
+from .incident import Incident
+from .lineup import Lineups
+from .match_stats import MatchStats
+from .shot import Shot
+from .top import TopPlayersMatch
+
+MATCH_BUNDLE_PARTS = (
+    "event",
+    "stats",
+    "lineups",
+    "incidents",
+    "shots",
+    "comments",
+    "top_players",
+)
+"""
+The parts of a match that can be included in a bundle.
+"""
+
+
+@add_slots
+@dataclass
+class MatchBundle:
+    """
+    Every per-match resource fetched in one call.
+    Parts that were not included are left as None.
+    """
+
+    event: Optional[Event] = field(default=None)
+    stats: Optional[MatchStats] = field(default=None)
+    lineups: Optional[Lineups] = field(default=None)
+    incidents: Optional[list[Incident]] = field(default=None)
+    shots: Optional[list[Shot]] = field(default=None)
+    comments: Optional[list[Comment]] = field(default=None)
+    top_players: Optional[TopPlayersMatch] = field(default=None)
+
+
+def parse_bundle_parts(include: Optional[Iterable[str]]) -> list[str]:
+    """
+    Validate the parts to include in a match bundle.
+
+    Args:
+        include (Iterable[str] | None): The parts to include, None for all of them.
+
+    Returns:
+        list[str]: The parts to include, in bundle order.
+
+    Raises:
+        ValueError: If a part is unknown.
+    """
+    if include is None:
+        return list(MATCH_BUNDLE_PARTS)
+    if isinstance(include, str):
+        include = [include]
+    include = set(include)
+    unknown = include.difference(MATCH_BUNDLE_PARTS)
+    if unknown:
+        raise ValueError(
+            f"Unknown match bundle parts: {', '.join(sorted(unknown))}. "
+            f"Available parts: {', '.join(MATCH_BUNDLE_PARTS)}."
+        )
+    return [part for part in MATCH_BUNDLE_PARTS if part in include]
@@ -3,11 +3,18 @@ This module contains functions to parse match statistics data.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from operator import attrgetter, methodcaller
+from typing import TYPE_CHECKING, Optional
 
+from ...utils import add_slots, import_optional
 from .lineup import Lineups
 
+if TYPE_CHECKING:
+    import numpy
+    import pandas
 
+
+@add_slots
 @dataclass
 class StatisticItem:
     """
@@ -29,6 +36,24 @@ class StatisticItem:
     # key: str = field(default="")
 
 
+class MissingStatistic(StatisticItem):
+    """
+    A statistic missing from the response, with the default values.
+    The table exports write None for it instead of a zero.
+    """
+
+    __slots__ = ()
+
+    _home_cell = None
+    _away_cell = None
+
+
+# the values read by the table exports: the value slots under a second name,
+# which MissingStatistic overrides with None (no per-cell Python check)
+StatisticItem._home_cell = StatisticItem.home_value
+StatisticItem._away_cell = StatisticItem.away_value
+
+
 def parse_statistic_item(item: dict[str, any]) -> StatisticItem:
     """
     Parse a statistic item.
@@ -39,12 +64,14 @@ def parse_statistic_item(item: dict[str, any]) -> StatisticItem:
     Returns:
         StatisticItem: The parsed statistic item.
     """
+    # positional arguments, as it is called for every statistic of a match
+    get = item.get
     return StatisticItem(
-        stat_type=item.get("statisticsType", ""),
-        home_value=item.get("homeValue", 0.0),
-        away_value=item.get("awayValue", 0.0),
-        home_total=item.get("homeTotal"),
-        away_total=item.get("awayTotal"),
+        get("homeValue", 0.0),
+        get("awayValue", 0.0),
+        get("statisticsType", ""),
+        get("homeTotal"),
+        get("awayTotal"),
         # Unused fields
         # name=item.get("name", ""),
         # home=item.get("home", ""),
@@ -56,23 +83,24 @@ def parse_statistic_item(item: dict[str, any]) -> StatisticItem:
     )
 
 
+@add_slots
 @dataclass
 class MatchOverviewStats:
     """
     The match overview statistics class.
     """
 
-    ball_possession: StatisticItem = field(default_factory=StatisticItem)
-    expected_goals: StatisticItem = field(default_factory=StatisticItem)
-    big_chance_created: StatisticItem = field(default_factory=StatisticItem)
-    total_shots_on_goal: StatisticItem = field(default_factory=StatisticItem)
-    goalkeeper_saves: StatisticItem = field(default_factory=StatisticItem)
-    corner_kicks: StatisticItem = field(default_factory=StatisticItem)
-    fouls: StatisticItem = field(default_factory=StatisticItem)
-    passes: StatisticItem = field(default_factory=StatisticItem)
-    total_tackle: StatisticItem = field(default_factory=StatisticItem)
-    free_kicks: StatisticItem = field(default_factory=StatisticItem)
-    yellow_cards: StatisticItem = field(default_factory=StatisticItem)
+    ball_possession: StatisticItem = field(default_factory=MissingStatistic)
+    expected_goals: StatisticItem = field(default_factory=MissingStatistic)
+    big_chance_created: StatisticItem = field(default_factory=MissingStatistic)
+    total_shots_on_goal: StatisticItem = field(default_factory=MissingStatistic)
+    goalkeeper_saves: StatisticItem = field(default_factory=MissingStatistic)
+    corner_kicks: StatisticItem = field(default_factory=MissingStatistic)
+    fouls: StatisticItem = field(default_factory=MissingStatistic)
+    passes: StatisticItem = field(default_factory=MissingStatistic)
+    total_tackle: StatisticItem = field(default_factory=MissingStatistic)
+    free_kicks: StatisticItem = field(default_factory=MissingStatistic)
+    yellow_cards: StatisticItem = field(default_factory=MissingStatistic)
 
 
 def parse_match_overview_stats(items: list[dict[str, any]]) -> MatchOverviewStats:
@@ -85,35 +113,23 @@ def parse_match_overview_stats(items: list[dict[str, any]]) -> MatchOverviewStat
     Returns:
         MatchOverviewStats: The parsed match overview statistics.
     """
-    mapping = {item["key"]: parse_statistic_item(item) for item in items}
-    return MatchOverviewStats(
-        ball_possession=mapping.get("ballPossession", StatisticItem()),
-        expected_goals=mapping.get("expectedGoals", StatisticItem()),
-        big_chance_created=mapping.get("bigChanceCreated", StatisticItem()),
-        total_shots_on_goal=mapping.get("totalShotsOnGoal", StatisticItem()),
-        goalkeeper_saves=mapping.get("goalkeeperSaves", StatisticItem()),
-        corner_kicks=mapping.get("cornerKicks", StatisticItem()),
-        fouls=mapping.get("fouls", StatisticItem()),
-        passes=mapping.get("passes", StatisticItem()),
-        total_tackle=mapping.get("totalTackle", StatisticItem()),
-        free_kicks=mapping.get("freeKicks", StatisticItem()),
-        yellow_cards=mapping.get("yellowCards", StatisticItem()),
-    )
+    return _parse_group("match overview", items)
 
 
+@add_slots
 @dataclass
 class ShotsStats:
     """
     The shots statistics class.
     """
 
-    total_shots_on_goal: StatisticItem = field(default_factory=StatisticItem)
-    shots_on_goal: StatisticItem = field(default_factory=StatisticItem)
-    hit_woodwork: StatisticItem = field(default_factory=StatisticItem)
-    shots_off_goal: StatisticItem = field(default_factory=StatisticItem)
-    blocked_scoring_attempt: StatisticItem = field(default_factory=StatisticItem)
-    total_shots_inside_box: StatisticItem = field(default_factory=StatisticItem)
-    total_shots_outside_box: StatisticItem = field(default_factory=StatisticItem)
+    total_shots_on_goal: StatisticItem = field(default_factory=MissingStatistic)
+    shots_on_goal: StatisticItem = field(default_factory=MissingStatistic)
+    hit_woodwork: StatisticItem = field(default_factory=MissingStatistic)
+    shots_off_goal: StatisticItem = field(default_factory=MissingStatistic)
+    blocked_scoring_attempt: StatisticItem = field(default_factory=MissingStatistic)
+    total_shots_inside_box: StatisticItem = field(default_factory=MissingStatistic)
+    total_shots_outside_box: StatisticItem = field(default_factory=MissingStatistic)
 
 
 def parse_shots_stats(items: list[dict[str, any]]) -> ShotsStats:
@@ -126,29 +142,21 @@ def parse_shots_stats(items: list[dict[str, any]]) -> ShotsStats:
     Returns:
         ShotsStats: The parsed shots statistics.
     """
-    mapping = {item["key"]: parse_statistic_item(item) for item in items}
-    return ShotsStats(
-        total_shots_on_goal=mapping.get("totalShotsOnGoal", StatisticItem()),
-        shots_on_goal=mapping.get("shotsOnGoal", StatisticItem()),
-        hit_woodwork=mapping.get("hitWoodwork", StatisticItem()),
-        shots_off_goal=mapping.get("shotsOffGoal", StatisticItem()),
-        blocked_scoring_attempt=mapping.get("blockedScoringAttempt", StatisticItem()),
-        total_shots_inside_box=mapping.get("totalShotsInsideBox", StatisticItem()),
-        total_shots_outside_box=mapping.get("totalShotsOutsideBox", StatisticItem()),
-    )
+    return _parse_group("shots", items)
 
 
+@add_slots
 @dataclass
 class AttackStats:
     """
     The attack statistics class.
     """
 
-    big_chance_scored: StatisticItem = field(default_factory=StatisticItem)
-    big_chance_missed: StatisticItem = field(default_factory=StatisticItem)
-    touches_in_opp_box: StatisticItem = field(default_factory=StatisticItem)
-    fouled_final_third: StatisticItem = field(default_factory=StatisticItem)
-    offsides: StatisticItem = field(default_factory=StatisticItem)
+    big_chance_scored: StatisticItem = field(default_factory=MissingStatistic)
+    big_chance_missed: StatisticItem = field(default_factory=MissingStatistic)
+    touches_in_opp_box: StatisticItem = field(default_factory=MissingStatistic)
+    fouled_final_third: StatisticItem = field(default_factory=MissingStatistic)
+    offsides: StatisticItem = field(default_factory=MissingStatistic)
 
 
 def parse_attack_stats(items: list[dict[str, any]]) -> AttackStats:
@@ -161,28 +169,22 @@ def parse_attack_stats(items: list[dict[str, any]]) -> AttackStats:
     Returns:
         AttackStats: The parsed attack
     """
-    mapping = {item["key"]: parse_statistic_item(item) for item in items}
-    return AttackStats(
-        big_chance_scored=mapping.get("bigChanceScored", StatisticItem()),
-        big_chance_missed=mapping.get("bigChanceMissed", StatisticItem()),
-        touches_in_opp_box=mapping.get("touchesInOppBox", StatisticItem()),
-        fouled_final_third=mapping.get("fouledFinalThird", StatisticItem()),
-        offsides=mapping.get("offsides", StatisticItem()),
-    )
+    return _parse_group("attack", items)
 
 
+@add_slots
 @dataclass
 class PassesStats:
     """
     The passes statistics class.
     """
 
-    accurate_passes: StatisticItem = field(default_factory=StatisticItem)
-    throw_ins: StatisticItem = field(default_factory=StatisticItem)
-    final_third_entries: StatisticItem = field(default_factory=StatisticItem)
-    final_third_phase_statistic: StatisticItem = field(default_factory=StatisticItem)
-    accurate_long_balls: StatisticItem = field(default_factory=StatisticItem)
-    accurate_cross: StatisticItem = field(default_factory=StatisticItem)
+    accurate_passes: StatisticItem = field(default_factory=MissingStatistic)
+    throw_ins: StatisticItem = field(default_factory=MissingStatistic)
+    final_third_entries: StatisticItem = field(default_factory=MissingStatistic)
+    final_third_phase_statistic: StatisticItem = field(default_factory=MissingStatistic)
+    accurate_long_balls: StatisticItem = field(default_factory=MissingStatistic)
+    accurate_cross: StatisticItem = field(default_factory=MissingStatistic)
 
 
 def parse_passes_stats(items: list[dict[str, any]]) -> PassesStats:
@@ -195,30 +197,21 @@ def parse_passes_stats(items: list[dict[str, any]]) -> PassesStats:
     Returns:
         PassesStats: The parsed passes statistics.
     """
-    mapping = {item["key"]: parse_statistic_item(item) for item in items}
-    return PassesStats(
-        accurate_passes=mapping.get("accuratePasses", StatisticItem()),
-        throw_ins=mapping.get("throwIns", StatisticItem()),
-        final_third_entries=mapping.get("finalThirdEntries", StatisticItem()),
-        final_third_phase_statistic=mapping.get(
-            "finalThirdPhaseStatistic", StatisticItem()
-        ),
-        accurate_long_balls=mapping.get("accurateLongBalls", StatisticItem()),
-        accurate_cross=mapping.get("accurateCross", StatisticItem()),
-    )
+    return _parse_group("passes", items)
 
 
+@add_slots
 @dataclass
 class DuelsStats:
     """
     The duels statistics class.
     """
 
-    duel_won_percent: StatisticItem = field(default_factory=StatisticItem)
-    dispossessed: StatisticItem = field(default_factory=StatisticItem)
-    ground_duels_percentage: StatisticItem = field(default_factory=StatisticItem)
-    aerial_duels_percentage: StatisticItem = field(default_factory=StatisticItem)
-    dribbles_percentage: StatisticItem = field(default_factory=StatisticItem)
+    duel_won_percent: StatisticItem = field(default_factory=MissingStatistic)
+    dispossessed: StatisticItem = field(default_factory=MissingStatistic)
+    ground_duels_percentage: StatisticItem = field(default_factory=MissingStatistic)
+    aerial_duels_percentage: StatisticItem = field(default_factory=MissingStatistic)
+    dribbles_percentage: StatisticItem = field(default_factory=MissingStatistic)
 
 
 def parse_duels_stats(items: list[dict[str, any]]) -> DuelsStats:
@@ -231,27 +224,21 @@ def parse_duels_stats(items: list[dict[str, any]]) -> DuelsStats:
     Returns:
         DuelsStats: The parsed duels statistics.
     """
-    mapping = {item["key"]: parse_statistic_item(item) for item in items}
-    return DuelsStats(
-        duel_won_percent=mapping.get("duelWonPercent", StatisticItem()),
-        dispossessed=mapping.get("dispossessed", StatisticItem()),
-        ground_duels_percentage=mapping.get("groundDuelsPercentage", StatisticItem()),
-        aerial_duels_percentage=mapping.get("aerialDuelsPercentage", StatisticItem()),
-        dribbles_percentage=mapping.get("dribblesPercentage", StatisticItem()),
-    )
+    return _parse_group("duels", items)
 
 
+@add_slots
 @dataclass
 class DefendingStats:
     """
     The defending statistics class.
     """
 
-    won_tackle_percent: StatisticItem = field(default_factory=StatisticItem)
-    total_tackle: StatisticItem = field(default_factory=StatisticItem)
-    interception_won: StatisticItem = field(default_factory=StatisticItem)
-    ball_recovery: StatisticItem = field(default_factory=StatisticItem)
-    total_clearance: StatisticItem = field(default_factory=StatisticItem)
+    won_tackle_percent: StatisticItem = field(default_factory=MissingStatistic)
+    total_tackle: StatisticItem = field(default_factory=MissingStatistic)
+    interception_won: StatisticItem = field(default_factory=MissingStatistic)
+    ball_recovery: StatisticItem = field(default_factory=MissingStatistic)
+    total_clearance: StatisticItem = field(default_factory=MissingStatistic)
 
 
 def parse_defending_stats(items: list[dict[str, any]]) -> DefendingStats:
@@ -264,25 +251,19 @@ def parse_defending_stats(items: list[dict[str, any]]) -> DefendingStats:
     Returns:
         DefendingStats: The parsed defending statistics.
     """
-    mapping = {item["key"]: parse_statistic_item(item) for item in items}
-    return DefendingStats(
-        won_tackle_percent=mapping.get("wonTacklePercent", StatisticItem()),
-        total_tackle=mapping.get("totalTackle", StatisticItem()),
-        interception_won=mapping.get("interceptionWon", StatisticItem()),
-        ball_recovery=mapping.get("ballRecovery", StatisticItem()),
-        total_clearance=mapping.get("totalClearance", StatisticItem()),
-    )
+    return _parse_group("defending", items)
 
 
+@add_slots
 @dataclass
 class GoalkeepingStats:
     """
     The goalkeeping statistics class.
     """
 
-    goalkeeper_saves: StatisticItem = field(default_factory=StatisticItem)
-    goals_prevented: StatisticItem = field(default_factory=StatisticItem)
-    goal_kicks: StatisticItem = field(default_factory=StatisticItem)
+    goalkeeper_saves: StatisticItem = field(default_factory=MissingStatistic)
+    goals_prevented: StatisticItem = field(default_factory=MissingStatistic)
+    goal_kicks: StatisticItem = field(default_factory=MissingStatistic)
 
 
 def parse_goalkeeping_stats(items: list[dict[str, any]]) -> GoalkeepingStats:
@@ -295,14 +276,10 @@ def parse_goalkeeping_stats(items: list[dict[str, any]]) -> GoalkeepingStats:
     Returns:
         GoalkeepingStats: The parsed goalkeeping statistics.
     """
-    mapping = {item["key"]: parse_statistic_item(item) for item in items}
-    return GoalkeepingStats(
-        goalkeeper_saves=mapping.get("goalkeeperSaves", StatisticItem()),
-        goals_prevented=mapping.get("goalsPrevented", StatisticItem()),
-        goal_kicks=mapping.get("goalKicks", StatisticItem()),
-    )
+    return _parse_group("goalkeeping", items)
 
 
+@add_slots
 @dataclass
 class PeriodStats:
     """
@@ -316,11 +293,129 @@ class PeriodStats:
     duels: DuelsStats = field(default_factory=DuelsStats)
     defending: DefendingStats = field(default_factory=DefendingStats)
     goalkeeping: GoalkeepingStats = field(default_factory=GoalkeepingStats)
+    extras: dict[str, StatisticItem] = field(default_factory=dict)
+    """
+    The statistics not mapped to a field, by key (e.g. "errorsLeadToShot").
+    """
+
+
+STATISTICS_FIELDS: dict[str, tuple[str, type, dict[str, str]]] = {
+    "match overview": (
+        "match_overview",
+        MatchOverviewStats,
+        {
+            "ballPossession": "ball_possession",
+            "expectedGoals": "expected_goals",
+            "bigChanceCreated": "big_chance_created",
+            "totalShotsOnGoal": "total_shots_on_goal",
+            "goalkeeperSaves": "goalkeeper_saves",
+            "cornerKicks": "corner_kicks",
+            "fouls": "fouls",
+            "passes": "passes",
+            "totalTackle": "total_tackle",
+            "freeKicks": "free_kicks",
+            "yellowCards": "yellow_cards",
+        },
+    ),
+    "shots": (
+        "shots",
+        ShotsStats,
+        {
+            "totalShotsOnGoal": "total_shots_on_goal",
+            "shotsOnGoal": "shots_on_goal",
+            "hitWoodwork": "hit_woodwork",
+            "shotsOffGoal": "shots_off_goal",
+            "blockedScoringAttempt": "blocked_scoring_attempt",
+            "totalShotsInsideBox": "total_shots_inside_box",
+            "totalShotsOutsideBox": "total_shots_outside_box",
+        },
+    ),
+    "attack": (
+        "attack",
+        AttackStats,
+        {
+            "bigChanceScored": "big_chance_scored",
+            "bigChanceMissed": "big_chance_missed",
+            "touchesInOppBox": "touches_in_opp_box",
+            "fouledFinalThird": "fouled_final_third",
+            "offsides": "offsides",
+        },
+    ),
+    "passes": (
+        "passes",
+        PassesStats,
+        {
+            "accuratePasses": "accurate_passes",
+            "throwIns": "throw_ins",
+            "finalThirdEntries": "final_third_entries",
+            "finalThirdPhaseStatistic": "final_third_phase_statistic",
+            "accurateLongBalls": "accurate_long_balls",
+            "accurateCross": "accurate_cross",
+        },
+    ),
+    "duels": (
+        "duels",
+        DuelsStats,
+        {
+            "duelWonPercent": "duel_won_percent",
+            "dispossessed": "dispossessed",
+            "groundDuelsPercentage": "ground_duels_percentage",
+            "aerialDuelsPercentage": "aerial_duels_percentage",
+            "dribblesPercentage": "dribbles_percentage",
+        },
+    ),
+    "defending": (
+        "defending",
+        DefendingStats,
+        {
+            "wonTacklePercent": "won_tackle_percent",
+            "totalTackle": "total_tackle",
+            "interceptionWon": "interception_won",
+            "ballRecovery": "ball_recovery",
+            "totalClearance": "total_clearance",
+        },
+    ),
+    "goalkeeping": (
+        "goalkeeping",
+        GoalkeepingStats,
+        {
+            "goalkeeperSaves": "goalkeeper_saves",
+            "goalsPrevented": "goals_prevented",
+            "goalKicks": "goal_kicks",
+        },
+    ),
+}
+"""
+The statistics of each group (by lowercase group name): the PeriodStats
+field of the group, its class and the class field of each statistic key.
+"""
+
+
+def _parse_group(group: str, items: list[dict[str, any]]) -> object:
+    """
+    Parse the statistics items of a group, dropping the unknown ones.
+
+    Args:
+        group (str): The lowercase group name.
+        items (List[Dict[str, Any]]): The statistics items.
+
+    Returns:
+        object: The parsed group statistics.
+    """
+    _, group_class, fields = STATISTICS_FIELDS[group]
+    return group_class(
+        **{
+            fields[item["key"]]: parse_statistic_item(item)
+            for item in items
+            if item["key"] in fields
+        }
+    )
 
 
 def parse_period_stats(groups: list[dict[str, any]]) -> PeriodStats:
     """
-    Parse period statistics.
+    Parse period statistics, in a single pass over the statistics items.
+    The statistics missing from STATISTICS_FIELDS are kept in `extras`.
 
     Args:
         groups (List[Dict[str, Any]]): The statistics groups.
@@ -328,32 +423,28 @@ def parse_period_stats(groups: list[dict[str, any]]) -> PeriodStats:
     Returns:
         PeriodStats: The parsed period statistics.
     """
-    group_mapping = {group["groupName"].lower(): group for group in groups}
+    values = {section: {} for section, _, _ in STATISTICS_FIELDS.values()}
+    extras = {}
+    for group in groups:
+        section, _, fields = STATISTICS_FIELDS.get(
+            group["groupName"].lower(), (None, None, {})
+        )
+        for item in group.get("statisticsItems", []):
+            name = fields.get(item["key"])
+            if name is None:
+                extras[item["key"]] = parse_statistic_item(item)
+            else:
+                values[section][name] = parse_statistic_item(item)
     return PeriodStats(
-        match_overview=parse_match_overview_stats(
-            group_mapping.get("match overview", {}).get("statisticsItems", [])
-        ),
-        shots=parse_shots_stats(
-            group_mapping.get("shots", {}).get("statisticsItems", [])
-        ),
-        attack=parse_attack_stats(
-            group_mapping.get("attack", {}).get("statisticsItems", [])
-        ),
-        passes=parse_passes_stats(
-            group_mapping.get("passes", {}).get("statisticsItems", [])
-        ),
-        duels=parse_duels_stats(
-            group_mapping.get("duels", {}).get("statisticsItems", [])
-        ),
-        defending=parse_defending_stats(
-            group_mapping.get("defending", {}).get("statisticsItems", [])
-        ),
-        goalkeeping=parse_goalkeeping_stats(
-            group_mapping.get("goalkeeping", {}).get("statisticsItems", [])
-        ),
+        **{
+            section: group_class(**values[section])
+            for section, group_class, _ in STATISTICS_FIELDS.values()
+        },
+        extras=extras,
     )
 
 
+@add_slots
 @dataclass
 class WinProbability:
     """
@@ -365,6 +456,7 @@ class WinProbability:
     away: float = field(default=0.0)
 
 
+@add_slots
 @dataclass
 class MatchStats:
     """
@@ -396,20 +488,22 @@ def parse_match_probabilities(data: dict[str, any]) -> WinProbability:
 
 
 def parse_match_stats(
-    data: list[dict[str, any]], win_probabilities: dict[str, any]
+    data: list[dict[str, any]], win_probabilities: Optional[dict[str, any]] = None
 ) -> MatchStats:
     """
     Parse match statistics.
 
     Args:
         data (List[Dict[str, Any]]): The match statistics data.
-        win_probabilities (Dict[str, Any]): The win probabilities data.
+        win_probabilities (Dict[str, Any], optional): The win probabilities data.
+            If None, the win probability is not parsed.
 
     Returns:
         MatchStats: The parsed match
     """
     match_stats = MatchStats()
-    match_stats.win_probability = parse_match_probabilities(win_probabilities)
+    if win_probabilities is not None:
+        match_stats.win_probability = parse_match_probabilities(win_probabilities)
     if not data:
         # No data available
         return match_stats
@@ -424,3 +518,103 @@ def parse_match_stats(
         elif period == "2ND":
             match_stats.second_half = period_stats
     return match_stats
+
+
+PERIODS = ("all", "first_half", "second_half")
+"""
+The periods of the match statistics.
+"""
+
+_MISSING_PERIOD = PeriodStats()
+
+
+def match_stats_columns(
+    matches: list[MatchStats], period: str = "all", extras: bool = False
+) -> dict[str, list]:
+    """
+    Convert the statistics of many matches into columns, with one row per match
+    and one home / away column pair per statistic (e.g. "shots.shots_on_goal.home").
+    Each column is read with a single attribute getter mapped over the matches,
+    so no Python loop visits the cells.
+
+    Args:
+        matches (List[MatchStats]): The match statistics.
+        period (str): The period, "all", "first_half" or "second_half".
+        extras (bool): Whether to add a column pair per statistic kept in the
+            extras of any match (e.g. "extras.redCards.home").
+
+    Returns:
+        Dict[str, List]: The columns, with None where a match lacks the
+            period or the statistic.
+    """
+    if period not in PERIODS:
+        raise ValueError(f"period must be one of {', '.join(PERIODS)}")
+    periods = [
+        stats if stats is not None else _MISSING_PERIOD
+        for stats in map(attrgetter(period), matches)
+    ]
+    home, away = attrgetter("_home_cell"), attrgetter("_away_cell")
+    columns = {}
+    for section, _, fields in STATISTICS_FIELDS.values():
+        for name in fields.values():
+            path = f"{section}.{name}"
+            columns[f"{path}.home"] = list(
+                map(attrgetter(f"{path}._home_cell"), periods)
+            )
+            columns[f"{path}.away"] = list(
+                map(attrgetter(f"{path}._away_cell"), periods)
+            )
+    if extras:
+        extra_items = list(map(attrgetter("extras"), periods))
+        keys = dict.fromkeys(key for items in extra_items for key in items)
+        missing = MissingStatistic()
+        for key in keys:
+            items = list(map(methodcaller("get", key, missing), extra_items))
+            columns[f"extras.{key}.home"] = list(map(home, items))
+            columns[f"extras.{key}.away"] = list(map(away, items))
+    return columns
+
+
+def match_stats_arrays(
+    matches: list[MatchStats], period: str = "all", extras: bool = False
+) -> "dict[str, numpy.ndarray]":
+    """
+    Convert the statistics of many matches into NumPy arrays, one per column
+    of `match_stats_columns`. Requires numpy.
+
+    Args:
+        matches (List[MatchStats]): The match statistics.
+        period (str): The period, "all", "first_half" or "second_half".
+        extras (bool): Whether to add the extra statistics.
+
+    Returns:
+        Dict[str, numpy.ndarray]: The float arrays, with NaN for missing values.
+    """
+    np = import_optional("numpy", "table")
+    return {
+        name: np.array(column, dtype=float)
+        for name, column in match_stats_columns(matches, period, extras).items()
+    }
+
+
+def match_stats_dataframe(
+    matches: list[MatchStats],
+    period: str = "all",
+    extras: bool = False,
+    index: Optional[list] = None,
+) -> "pandas.DataFrame":
+    """
+    Convert the statistics of many matches into a pandas DataFrame, with one
+    row per match and the columns of `match_stats_columns`. Requires pandas.
+
+    Args:
+        matches (List[MatchStats]): The match statistics.
+        period (str): The period, "all", "first_half" or "second_half".
+        extras (bool): Whether to add the extra statistics.
+        index (List, optional): The row labels (e.g. the event ids).
+
+    Returns:
+        pandas.DataFrame: The statistics table, with NaN for missing values.
+    """
+    pd = import_optional("pandas", "table")
+    return pd.DataFrame(match_stats_arrays(matches, period, extras), index=index)
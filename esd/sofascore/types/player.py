@@ -4,12 +4,14 @@ Player dataclass and parser.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .country import Country, parse_country
 from .player_attributes import PlayerAttributes
 from .team import Team, parse_team
 from .transfer import TransferHistory
 
 
+@add_slots
 @dataclass
 class Player:
     """
@@ -4,9 +4,10 @@ Player attributes dataclass and parser.
 
 from dataclasses import dataclass, field
 
-from ...utils import current_year
+from ...utils import add_slots, current_year
 
 
+@add_slots
 @dataclass
 class Attributes:
     """
@@ -22,6 +23,7 @@ class Attributes:
     position: str = field(default=None)
 
 
+@add_slots
 @dataclass
 class PlayerAttributes:
     """
@@ -4,7 +4,10 @@ This module contains the season tournament dataclasses.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 
+
+@add_slots
 @dataclass
 class Season:
     """
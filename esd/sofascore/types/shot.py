@@ -4,9 +4,11 @@ Shot dataclass and parser.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .player import Player, parse_player
 
 
+@add_slots
 @dataclass
 class Shot:
     """
@@ -4,10 +4,12 @@ SofaScore Standing dataclass.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .team import Team, parse_team
 from .tournament import Tournament, parse_tournament
 
 
+@add_slots
 @dataclass
 class StandingItem:
     """
@@ -69,6 +71,7 @@ def parse_standing_items(data: dict) -> list[StandingItem]:
     return [parse_standing_item(standing_item) for standing_item in data]
 
 
+@add_slots
 @dataclass
 class Standing:
     """Standing dataclass"""
@@ -5,6 +5,8 @@ Status types for SofaScore.
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ...utils import add_slots
+
 
 class StatusType(Enum):
     """
@@ -19,6 +21,7 @@ class StatusType(Enum):
     FINISHED = "finished"
 
 
+@add_slots
 @dataclass
 class Status:
     """
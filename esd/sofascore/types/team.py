@@ -5,11 +5,14 @@ This module contains the Team related data classes.
 from dataclasses import dataclass, field
 from typing import Optional
 
+from ...cache import interned
+from ...utils import add_slots
 from .color import Color, parse_color
 from .country import Country, parse_country
 from .manager import Manager, parse_manager
 
 
+@add_slots
 @dataclass
 class Team:
     """
@@ -64,8 +67,13 @@ def parse_team(data: dict) -> Team:
         data (dict): Team data.
 
     Returns:
-        Team: Team dataclass.
+        Team: Team dataclass, shared with the other teams of the same data
+            while an identity map is active.
     """
+    return interned("team", data, _parse_team)
+
+
+def _parse_team(data: dict) -> Team:
     common = parse_common_team_fields(data)
     team = Team(**common)
     if "manager" in data:
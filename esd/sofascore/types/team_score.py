@@ -4,7 +4,10 @@ The module for parsing the team score data.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 
+
+@add_slots
 @dataclass
 class TeamScore:
     """
@@ -4,9 +4,11 @@ SofaScore top players types.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .player import Player, parse_player
 
 
+@add_slots
 @dataclass
 class TopPlayersMatch:
     """
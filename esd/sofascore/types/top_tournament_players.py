@@ -4,10 +4,12 @@ SofaScore top tournament players data types.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .player import Player, parse_player
 from .team import Team, parse_team
 
 
+@add_slots
 @dataclass
 class TopPlayerStat:
     """
@@ -20,6 +22,7 @@ class TopPlayerStat:
     appearances: int = field(default=0)
 
 
+@add_slots
 @dataclass
 class TopPlayerItem:
     """
@@ -32,6 +35,7 @@ class TopPlayerItem:
     team: Team = field(default_factory=Team)
 
 
+@add_slots
 @dataclass
 class TopTournamentPlayers:
     """
@@ -4,9 +4,11 @@ Contains top tournament teams data.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .team import Team, parse_team
 
 
+@add_slots
 @dataclass
 class TopTeamStat:
     """
@@ -17,6 +19,7 @@ class TopTeamStat:
     matches: int = field(default=0)
 
 
+@add_slots
 @dataclass
 class TopTeamItem:
     """
@@ -27,6 +30,7 @@ class TopTeamItem:
     stats: TopTeamStat = field(default_factory=TopTeamStat)
 
 
+@add_slots
 @dataclass
 class TopTournamentTeams:
     """
@@ -4,7 +4,11 @@ This module contains the dataclasses for the tournament data.
 
 from dataclasses import dataclass, field
 
+from ...cache import interned
+from ...utils import add_slots
 
+
+@add_slots
 @dataclass
 class Tournament:
     """
@@ -29,8 +33,13 @@ def parse_tournament(data: dict) -> Tournament:
         data (dict): Tournament data.
 
     Returns:
-        Tournament: Tournament dataclass
+        Tournament: Tournament dataclass, shared with the other tournaments
+            of the same data while an identity map is active.
     """
+    return interned("tournament", data, _parse_tournament)
+
+
+def _parse_tournament(data: dict) -> Tournament:
     return Tournament(
         id=data.get("id", None),
         name=data.get("name", None),
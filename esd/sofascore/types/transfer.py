@@ -4,9 +4,11 @@ Transfer history data classes.
 
 from dataclasses import dataclass, field
 
+from ...utils import add_slots
 from .team import Team, parse_team
 
 
+@add_slots
 @dataclass
 class TransferFeeRaw:
     """
@@ -17,6 +19,7 @@ class TransferFeeRaw:
     currency: str = field(default=None)
 
 
+@add_slots
 @dataclass
 class TransferHistoryEntry:
     """
@@ -35,6 +38,7 @@ class TransferHistoryEntry:
     transfer_to: Team = field(default=None)
 
 
+@add_slots
 @dataclass
 class TransferHistory:
     """
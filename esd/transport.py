@@ -0,0 +1,1071 @@
+"""
+This module contains the HTTP transport shared by the clients.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
+from typing import Any, Callable
+
+import httpx
+from curl_cffi import requests
+from curl_cffi.const import CurlOpt
+from lxml import html
+
+from .breaker import CircuitBreaker, CircuitState
+from .decoder import loads
+from .proxy import ProxyPool, ProxyStats
+from .retry import RETRYABLE_ERRORS, Retrier, RetryPolicy, RetryStats
+
+
+def _proxy_key(proxy: str | dict | None) -> str | tuple | None:
+    """
+    Get a hashable key for the given proxy settings.
+
+    Args:
+        proxy (str | dict | None): The proxy settings.
+
+    Returns:
+        str | tuple | None: The proxy key.
+    """
+    if isinstance(proxy, dict):
+        return tuple(sorted(proxy.items()))
+    return proxy
+
+
+def _request_key(url: str, impersonate: str | None, headers: dict | None) -> tuple:
+    """
+    Get the key identifying identical JSON requests.
+
+    Args:
+        url (str): The request URL.
+        impersonate (str | None): Browser impersonation profile.
+        headers (dict | None): Extra headers of the request.
+
+    Returns:
+        tuple: The request key.
+    """
+    return (url, impersonate, tuple(sorted(headers.items())) if headers else None)
+
+
+def _circuit(
+    breaker: CircuitBreaker | None, url: str
+) -> AbstractContextManager[Callable[[int | None], None]]:
+    """
+    Get the circuit breaker guard of a request.
+
+    Args:
+        breaker (CircuitBreaker | None): The circuit breaker, if enabled.
+        url (str): The request URL.
+
+    Returns:
+        AbstractContextManager[Callable[[int | None], None]]: The guard,
+            yielding the callback receiving the response status.
+    """
+    if breaker is None:
+        return nullcontext(lambda status: None)
+    return breaker.guard(url)
+
+
+def _error_code(data: Any) -> int | None:
+    """
+    Get the error code embedded in an API response.
+
+    Args:
+        data (Any): The decoded API response.
+
+    Returns:
+        int | None: The error code, or None if the response is not an error.
+    """
+    if isinstance(data, dict) and isinstance(data.get("error"), dict):
+        return data["error"].get("code")
+    return None
+
+
+class APIError(Exception):
+    """
+    Exception raised when an API response embeds an error (e.g. Sofascore's
+    403 when access is denied) that is still there after the retries.
+    """
+
+    def __init__(self, url: str, code: int) -> None:
+        message = f"{url} answered with the error code {code}."
+        if code == 403:
+            message += " Access denied, use a proxy or renew your IP address."
+        super().__init__(message)
+        self.url = url
+        self.code = code
+
+
+def _api_data(url: str, data: dict) -> dict:
+    """
+    Check the embedded error of an API response.
+
+    Args:
+        url (str): The request URL.
+        data (dict): The decoded API response.
+
+    Returns:
+        dict: The response, or an empty dict if the resource is not found.
+
+    Raises:
+        APIError: If the response embeds any other error.
+    """
+    code = _error_code(data)
+    if code == 404:
+        return {}
+    if code is not None:
+        raise APIError(url, code)
+    return data
+
+
+def _httpx_limits(pool_size: int, keepalive_expiry: float) -> httpx.Limits:
+    """
+    Get the httpx connection limits for the given pool size.
+
+    Args:
+        pool_size (int): The maximum number of connections.
+        keepalive_expiry (float): Seconds an idle connection is kept alive.
+
+    Returns:
+        httpx.Limits: The connection limits.
+    """
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _session_options(impersonate: str, proxy: str | dict | None) -> dict:
+    """
+    Get the curl_cffi session options for the given profile and proxy.
+
+    Args:
+        impersonate (str): Browser impersonation profile (e.g. "chrome").
+        proxy (str | dict | None): The proxy settings.
+
+    Returns:
+        dict: The session keyword arguments.
+    """
+    options = {"impersonate": impersonate}
+    if isinstance(proxy, dict):
+        options["proxies"] = proxy
+    elif proxy:
+        options["proxy"] = proxy
+    return options
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls: while a call is in flight, the threads
+    asking for the same key wait for it and share its result (or exception).
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the single flight group.
+        """
+        self._lock = threading.Lock()
+        self._flights: dict[Hashable, Future] = {}
+        self._shared = 0
+
+    @property
+    def shared(self) -> int:
+        """
+        The number of calls served by another call in flight.
+        """
+        return self._shared
+
+    def do(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """
+        Run the call, or wait for the identical call in flight.
+
+        Args:
+            key (Hashable): The key identifying identical calls (e.g. the URL).
+            call (Callable[[], Any]): The call to run.
+
+        Returns:
+            Any: The result of the call.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = Future()
+            else:
+                self._shared += 1
+        if not leader:
+            return flight.result()
+        try:
+            result = call()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(result)
+        finally:
+            with self._lock:
+                del self._flights[key]
+        return result
+
+
+class AsyncSingleFlight:
+    """
+    The asyncio twin of `SingleFlight`: concurrent identical coroutines
+    share one task.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the single flight group.
+        """
+        self._flights: dict[Hashable, asyncio.Task] = {}
+        self._shared = 0
+
+    @property
+    def shared(self) -> int:
+        """
+        The number of calls served by another call in flight.
+        """
+        return self._shared
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run the coroutine, or wait for the identical coroutine in flight.
+
+        Args:
+            key (Hashable): The key identifying identical calls (e.g. the URL).
+            call (Callable[[], Awaitable[Any]]): The coroutine function to run.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        task = self._flights.get(key)
+        if task is not None:
+            self._shared += 1
+        else:
+            task = asyncio.ensure_future(call())
+            self._flights[key] = task
+            task.add_done_callback(partial(self._done, key))
+        # shielded so a cancelled caller does not cancel the shared task
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        self._flights.pop(key, None)
+        # mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+
+class ValidatorStore:
+    """
+    A thread-safe LRU store of the validators (ETag / Last-Modified) and the
+    payload of the last response of each URL, used to revalidate repeated requests.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        Initializes the validator store.
+
+        Args:
+            max_size (int): The maximum number of URLs kept.
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[dict, Any]] = OrderedDict()
+        self._not_modified = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def not_modified(self) -> int:
+        """
+        The number of requests answered with 304 Not Modified.
+        """
+        return self._not_modified
+
+    def get(self, url: str) -> tuple[dict, Any] | None:
+        """
+        Get the conditional headers and the last payload of a URL.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            tuple[dict, Any] | None: The conditional headers and the payload,
+                or None if the URL has no validators.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def revalidated(self, entry: tuple[dict, Any]) -> Any:
+        """
+        Count a 304 Not Modified response and get the payload it refers to.
+
+        Args:
+            entry (tuple[dict, Any]): The entry used to build the request.
+
+        Returns:
+            Any: The last payload of the URL.
+        """
+        with self._lock:
+            self._not_modified += 1
+        return entry[1]
+
+    def store(self, url: str, headers: Any, data: Any) -> None:
+        """
+        Store the validators of a response along with its payload.
+        Responses without validators (or without payload) drop the URL.
+
+        Args:
+            url (str): The request URL.
+            headers (Any): The response headers.
+            data (Any): The decoded response.
+        """
+        conditions = {}
+        if headers.get("etag"):
+            conditions["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            conditions["If-Modified-Since"] = headers["last-modified"]
+        with self._lock:
+            if not conditions or not data:
+                self._entries.pop(url, None)
+                return
+            self._entries[url] = (conditions, data)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove every stored validator.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+class Transport:
+    """
+    A long-lived and thread-safe pool of HTTP sessions.
+
+    Sessions are created on first use, one per impersonation profile and proxy,
+    and reused by every request so connections (and TLS handshakes) are kept alive.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        keepalive_expiry: float = 30.0,
+        revalidate: bool = False,
+        coalesce: bool = True,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        proxy_pool: ProxyPool | None = None,
+    ) -> None:
+        """
+        Initializes the transport.
+
+        Args:
+            pool_size (int): The maximum number of connections kept per session.
+            keepalive_expiry (float): Seconds an idle connection is kept alive.
+            revalidate (bool): Whether to send conditional JSON requests
+                (If-None-Match / If-Modified-Since) and reuse the last payload
+                when the server answers 304 Not Modified.
+            coalesce (bool): Whether concurrent identical JSON requests share
+                one network request and its payload.
+            retry (RetryPolicy | None): The policy used to retry transient
+                failures, the default one if None.
+            breaker (CircuitBreaker | None): The circuit breaker refusing the
+                requests to a failing source, if any.
+            proxy_pool (ProxyPool | None): The proxies the requests are rotated
+                through, if any.
+        """
+        self.pool_size = pool_size
+        self.keepalive_expiry = keepalive_expiry
+        self.validators = ValidatorStore() if revalidate else None
+        self.flights = SingleFlight() if coalesce else None
+        self.retrier = Retrier(retry)
+        self.breaker = breaker
+        self.proxy_pool = proxy_pool
+        self._lock = threading.Lock()
+        self._sessions: dict[tuple, requests.Session] = {}
+        self._clients: dict[str | tuple | None, httpx.Client] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def __enter__(self) -> Transport:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the transport has been closed.
+        """
+        return self._closed
+
+    @property
+    def revalidate(self) -> bool:
+        """
+        Whether the JSON requests are revalidated with their last validators.
+        """
+        return self.validators is not None
+
+    @property
+    def coalesce(self) -> bool:
+        """
+        Whether concurrent identical JSON requests are coalesced.
+        """
+        return self.flights is not None
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get a snapshot of the retry counters.
+        """
+        return self.retrier.stats
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Get the state of every circuit, empty if the breaker is disabled.
+        """
+        return self.breaker.states if self.breaker is not None else {}
+
+    @property
+    def proxy_stats(self) -> list[ProxyStats]:
+        """
+        Get the health of every proxy, empty if there is no proxy pool.
+        """
+        return self.proxy_pool.stats if self.proxy_pool is not None else []
+
+    def session(
+        self, impersonate: str, proxy: str | dict | None = None
+    ) -> requests.Session:
+        """
+        Get the curl_cffi session for the given impersonation profile and proxy.
+
+        Args:
+            impersonate (str): Browser impersonation profile (e.g. "chrome").
+            proxy (str | dict | None): The proxy settings.
+
+        Returns:
+            requests.Session: The pooled session.
+        """
+        key = (impersonate, _proxy_key(proxy))
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Transport is closed.")
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session(
+                    curl_options={CurlOpt.MAXCONNECTS: self.pool_size},
+                    **_session_options(impersonate, proxy),
+                )
+                self._sessions[key] = session
+            return session
+
+    def client(self, proxy: str | dict | None = None) -> httpx.Client:
+        """
+        Get the httpx client for the given proxy.
+
+        Args:
+            proxy (str | dict | None): The proxy settings.
+
+        Returns:
+            httpx.Client: The pooled client.
+        """
+        key = _proxy_key(proxy)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Transport is closed.")
+            client = self._clients.get(key)
+            if client is None:
+                client = httpx.Client(
+                    proxy=proxy,
+                    limits=_httpx_limits(self.pool_size, self.keepalive_expiry),
+                )
+                self._clients[key] = client
+            return client
+
+    def gather(self, *calls: Callable[[], Any]) -> list[Any]:
+        """
+        Run the given calls concurrently on the transport thread pool.
+
+        Calls that have not started yet when their result is needed are run
+        in the calling thread, so nested gathers never exhaust the pool.
+
+        Args:
+            *calls (Callable[[], Any]): The calls to run.
+
+        Returns:
+            list[Any]: The results, in the same order as the calls.
+        """
+        if len(calls) < 2:
+            return [call() for call in calls]
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Transport is closed.")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.pool_size, thread_name_prefix="esd"
+                )
+            futures = [self._executor.submit(call) for call in calls[1:]]
+        results = [calls[0]()]
+        for call, future in zip(calls[1:], futures):
+            results.append(call() if future.cancel() else future.result())
+        return results
+
+    def get_json(
+        self,
+        url: str,
+        impersonate: str | None = None,
+        headers: dict | None = None,
+    ) -> dict:
+        """
+        Get the JSON response from the given URL.
+
+        Args:
+            url (str): The URL to get the JSON response.
+            impersonate (str | None): Browser impersonation for curl_cffi.
+                Use "chrome" for Sofascore/Promiedos APIs. Defaults to None (uses httpx).
+            headers (dict | None): Extra headers to include in the request.
+
+        Returns:
+            dict: The JSON response, empty if the resource is not found.
+
+        Raises:
+            APIError: If the API response embeds an error.
+        """
+        if self.flights is None:
+            return self._get_json(url, impersonate, headers)
+        return self.flights.do(
+            _request_key(url, impersonate, headers),
+            partial(self._get_json, url, impersonate, headers),
+        )
+
+    def _get_json(
+        self, url: str, impersonate: str | None, headers: dict | None
+    ) -> dict:
+        entry = self.validators.get(url) if self.validators is not None else None
+        if entry is not None:
+            headers = {**(headers or {}), **entry[0]}
+
+        def request(proxy: str | None) -> Any:
+            if impersonate:
+                return self.session(impersonate, proxy).get(url, headers=headers)
+            return self.client(proxy).get(url, headers=headers)
+
+        try:
+            response, data = self._send(url, request, decode=True)
+            if entry is not None and response.status_code == 304:
+                return self.validators.revalidated(entry)
+            response.raise_for_status()
+            data = _api_data(url, data) if impersonate else data
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return {}
+            raise exc
+        if self.validators is not None:
+            self.validators.store(url, response.headers, data)
+        return data
+
+    def _send(
+        self,
+        url: str,
+        request: Callable[[str | None], Any],
+        decode: bool = False,
+        rotate: bool = True,
+        before_retry: Callable[[], Any] | None = None,
+    ) -> tuple[Any, Any]:
+        """
+        Send a request through the circuit breaker, retrying its transient failures.
+
+        Args:
+            url (str): The request URL.
+            request (Callable[[str | None], Any]): The call sending the request
+                through the given proxy.
+            decode (bool): Whether to decode the JSON of successful responses,
+                so the error codes embedded in them can be retried too.
+            rotate (bool): Whether to send each attempt through the proxy pool.
+            before_retry (Callable[[], Any] | None): Called before every retry,
+                once the backoff is over (e.g. to take a rate limiter token).
+                Its exceptions end the retries, leaving the circuit as is.
+
+        Returns:
+            tuple[Any, Any]: The last response, and its JSON if decoded.
+
+        Raises:
+            CircuitOpenError: If the circuit of the URL is open.
+        """
+        pool = rotate and self.proxy_pool is not None
+        throttled = None
+        with _circuit(self.breaker, url) as record:
+            attempt = 1
+            while True:
+                data = None
+                proxy = self.proxy_pool.acquire() if pool else None
+                started = time.monotonic()
+                try:
+                    response = request(proxy)
+                except RETRYABLE_ERRORS as exc:
+                    if pool:
+                        self.proxy_pool.report(proxy, time.monotonic() - started)
+                    delay = self.retrier.delay(attempt, type(exc).__name__)
+                    if delay is None:
+                        raise
+                else:
+                    reason = response.status_code
+                    if decode and 200 <= reason < 300:
+                        # decoded from the bytes, skipping the text copy
+                        data = loads(response.content)
+                        reason = _error_code(data) or reason
+                    if pool:
+                        self.proxy_pool.report(
+                            proxy, time.monotonic() - started, reason
+                        )
+                    delay = self.retrier.delay(
+                        attempt, reason, response.headers.get("retry-after")
+                    )
+                    if delay is None:
+                        break
+                time.sleep(delay)
+                if before_retry is not None:
+                    try:
+                        before_retry()
+                    except Exception as exc:
+                        # e.g. a local rate limit, not an outcome of the source
+                        throttled = exc
+                        break
+                attempt += 1
+            if throttled is not None:
+                record(None)
+            else:
+                record(_error_code(data) or response.status_code)
+        if throttled is not None:
+            raise throttled
+        return response, data
+
+    def get_api_json(self, url: str, headers: dict | None = None) -> dict:
+        """
+        Get JSON from an API endpoint using Chrome impersonation via curl_cffi.
+
+        Args:
+            url (str): The API URL.
+            headers (dict | None): Extra headers for the request.
+
+        Returns:
+            dict: The JSON response.
+        """
+        return self.get_json(url, impersonate="chrome", headers=headers)
+
+    def get_document(
+        self,
+        url: str,
+        proxies: dict = None,
+        before_retry: Callable[[], Any] | None = None,
+    ) -> html.HtmlElement:
+        """
+        Get the HTML document from the given URL.
+
+        Args:
+            url (str): The URL to get the HTML document.
+            proxies (dict): The proxy settings.
+            before_retry (Callable[[], Any] | None): Called before every retry
+                of the request (e.g. to take a rate limiter token).
+
+        Returns:
+            html.HtmlElement: The HTML document.
+        """
+        try:
+            response, _ = self._send(
+                url,
+                lambda proxy: self.client(proxies or proxy).get(url),
+                rotate=not proxies,
+                before_retry=before_retry,
+            )
+            response.raise_for_status()
+            return html.fromstring(response.content)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return html.fromstring("")
+            raise exc
+
+    def close(self) -> None:
+        """
+        Close every pooled session and release its connections.
+        """
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            sessions = list(self._sessions.values())
+            clients = list(self._clients.values())
+            self._sessions.clear()
+            self._clients.clear()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for session in sessions:
+            session.close()
+        for client in clients:
+            client.close()
+
+
+class AsyncTransport:
+    """
+    The asyncio twin of `Transport`.
+
+    Sessions are pooled the same way, and a semaphore caps the number of
+    requests in flight so a single event loop can drive hundreds of them.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_concurrency: int = 50,
+        keepalive_expiry: float = 30.0,
+        revalidate: bool = False,
+        coalesce: bool = True,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        proxy_pool: ProxyPool | None = None,
+    ) -> None:
+        """
+        Initializes the async transport.
+
+        Args:
+            pool_size (int): The maximum number of connections kept per session.
+            max_concurrency (int): The maximum number of requests in flight.
+            keepalive_expiry (float): Seconds an idle connection is kept alive.
+            revalidate (bool): Whether to send conditional JSON requests
+                (If-None-Match / If-Modified-Since) and reuse the last payload
+                when the server answers 304 Not Modified.
+            coalesce (bool): Whether concurrent identical JSON requests share
+                one network request and its payload.
+            retry (RetryPolicy | None): The policy used to retry transient
+                failures, the default one if None.
+            breaker (CircuitBreaker | None): The circuit breaker refusing the
+                requests to a failing source, if any.
+            proxy_pool (ProxyPool | None): The proxies the requests are rotated
+                through, if any.
+        """
+        self.pool_size = pool_size
+        self.max_concurrency = max_concurrency
+        self.keepalive_expiry = keepalive_expiry
+        self.validators = ValidatorStore() if revalidate else None
+        self.flights = AsyncSingleFlight() if coalesce else None
+        self.retrier = Retrier(retry)
+        self.breaker = breaker
+        self.proxy_pool = proxy_pool
+        self._semaphore: asyncio.Semaphore | None = None
+        self._sessions: dict[tuple, requests.AsyncSession] = {}
+        self._clients: dict[str | tuple | None, httpx.AsyncClient] = {}
+        self._closed = False
+
+    async def __aenter__(self) -> AsyncTransport:
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether the transport has been closed.
+        """
+        return self._closed
+
+    @property
+    def revalidate(self) -> bool:
+        """
+        Whether the JSON requests are revalidated with their last validators.
+        """
+        return self.validators is not None
+
+    @property
+    def coalesce(self) -> bool:
+        """
+        Whether concurrent identical JSON requests are coalesced.
+        """
+        return self.flights is not None
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """
+        Get a snapshot of the retry counters.
+        """
+        return self.retrier.stats
+
+    @property
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Get the state of every circuit, empty if the breaker is disabled.
+        """
+        return self.breaker.states if self.breaker is not None else {}
+
+    @property
+    def proxy_stats(self) -> list[ProxyStats]:
+        """
+        Get the health of every proxy, empty if there is no proxy pool.
+        """
+        return self.proxy_pool.stats if self.proxy_pool is not None else []
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        The semaphore limiting the requests in flight.
+        """
+        # created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def session(
+        self, impersonate: str, proxy: str | dict | None = None
+    ) -> requests.AsyncSession:
+        """
+        Get the curl_cffi async session for the given impersonation profile and proxy.
+
+        Args:
+            impersonate (str): Browser impersonation profile (e.g. "chrome").
+            proxy (str | dict | None): The proxy settings.
+
+        Returns:
+            requests.AsyncSession: The pooled session.
+        """
+        if self._closed:
+            raise RuntimeError("Transport is closed.")
+        key = (impersonate, _proxy_key(proxy))
+        session = self._sessions.get(key)
+        if session is None:
+            session = requests.AsyncSession(
+                max_clients=self.pool_size, **_session_options(impersonate, proxy)
+            )
+            self._sessions[key] = session
+        return session
+
+    def client(self, proxy: str | dict | None = None) -> httpx.AsyncClient:
+        """
+        Get the httpx async client for the given proxy.
+
+        Args:
+            proxy (str | dict | None): The proxy settings.
+
+        Returns:
+            httpx.AsyncClient: The pooled client.
+        """
+        if self._closed:
+            raise RuntimeError("Transport is closed.")
+        key = _proxy_key(proxy)
+        client = self._clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy,
+                limits=_httpx_limits(self.pool_size, self.keepalive_expiry),
+            )
+            self._clients[key] = client
+        return client
+
+    async def get_json(
+        self,
+        url: str,
+        impersonate: str | None = None,
+        headers: dict | None = None,
+    ) -> dict:
+        """
+        Get the JSON response from the given URL.
+
+        Args:
+            url (str): The URL to get the JSON response.
+            impersonate (str | None): Browser impersonation for curl_cffi.
+                Use "chrome" for Sofascore/Promiedos APIs. Defaults to None (uses httpx).
+            headers (dict | None): Extra headers to include in the request.
+
+        Returns:
+            dict: The JSON response, empty if the resource is not found.
+
+        Raises:
+            APIError: If the API response embeds an error.
+        """
+        if self.flights is None:
+            return await self._get_json(url, impersonate, headers)
+        return await self.flights.do(
+            _request_key(url, impersonate, headers),
+            partial(self._get_json, url, impersonate, headers),
+        )
+
+    async def _get_json(
+        self, url: str, impersonate: str | None, headers: dict | None
+    ) -> dict:
+        entry = self.validators.get(url) if self.validators is not None else None
+        if entry is not None:
+            headers = {**(headers or {}), **entry[0]}
+
+        def request(proxy: str | None) -> Any:
+            if impersonate:
+                return self.session(impersonate, proxy).get(url, headers=headers)
+            return self.client(proxy).get(url, headers=headers)
+
+        try:
+            response, data = await self._send(url, request, decode=True)
+            if entry is not None and response.status_code == 304:
+                return self.validators.revalidated(entry)
+            response.raise_for_status()
+            data = _api_data(url, data) if impersonate else data
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return {}
+            raise exc
+        if self.validators is not None:
+            self.validators.store(url, response.headers, data)
+        return data
+
+    async def _send(
+        self,
+        url: str,
+        request: Callable[[str | None], Awaitable[Any]],
+        decode: bool = False,
+        rotate: bool = True,
+        before_retry: Callable[[], Any] | None = None,
+    ) -> tuple[Any, Any]:
+        """
+        Send a request through the circuit breaker, retrying its transient failures.
+
+        Args:
+            url (str): The request URL.
+            request (Callable[[str | None], Awaitable[Any]]): The call sending the request
+                through the given proxy.
+            decode (bool): Whether to decode the JSON of successful responses,
+                so the error codes embedded in them can be retried too.
+            rotate (bool): Whether to send each attempt through the proxy pool.
+            before_retry (Callable[[], Any] | None): Called, and awaited, before
+                every retry, once the backoff is over (e.g. to take a rate
+                limiter token). Its exceptions end the retries, leaving the
+                circuit as is.
+
+        Returns:
+            tuple[Any, Any]: The last response, and its JSON if decoded.
+
+        Raises:
+            CircuitOpenError: If the circuit of the URL is open.
+        """
+        pool = rotate and self.proxy_pool is not None
+        throttled = None
+        with _circuit(self.breaker, url) as record:
+            attempt = 1
+            while True:
+                data = None
+                proxy = self.proxy_pool.acquire() if pool else None
+                started = time.monotonic()
+                try:
+                    async with self.semaphore:
+                        response = await request(proxy)
+                except RETRYABLE_ERRORS as exc:
+                    if pool:
+                        self.proxy_pool.report(proxy, time.monotonic() - started)
+                    delay = self.retrier.delay(attempt, type(exc).__name__)
+                    if delay is None:
+                        raise
+                else:
+                    reason = response.status_code
+                    if decode and 200 <= reason < 300:
+                        # decoded from the bytes, skipping the text copy
+                        data = loads(response.content)
+                        reason = _error_code(data) or reason
+                    if pool:
+                        self.proxy_pool.report(
+                            proxy, time.monotonic() - started, reason
+                        )
+                    delay = self.retrier.delay(
+                        attempt, reason, response.headers.get("retry-after")
+                    )
+                    if delay is None:
+                        break
+                await asyncio.sleep(delay)
+                if before_retry is not None:
+                    try:
+                        await before_retry()
+                    except Exception as exc:
+                        # e.g. a local rate limit, not an outcome of the source
+                        throttled = exc
+                        break
+                attempt += 1
+            if throttled is not None:
+                record(None)
+            else:
+                record(_error_code(data) or response.status_code)
+        if throttled is not None:
+            raise throttled
+        return response, data
+
+    async def get_api_json(self, url: str, headers: dict | None = None) -> dict:
+        """
+        Get JSON from an API endpoint using Chrome impersonation via curl_cffi.
+
+        Args:
+            url (str): The API URL.
+            headers (dict | None): Extra headers for the request.
+
+        Returns:
+            dict: The JSON response.
+        """
+        return await self.get_json(url, impersonate="chrome", headers=headers)
+
+    async def get_document(
+        self,
+        url: str,
+        proxies: dict = None,
+        before_retry: Callable[[], Any] | None = None,
+    ) -> html.HtmlElement:
+        """
+        Get the HTML document from the given URL.
+
+        Args:
+            url (str): The URL to get the HTML document.
+            proxies (dict): The proxy settings.
+            before_retry (Callable[[], Any] | None): Called before every retry
+                of the request (e.g. to take a rate limiter token).
+
+        Returns:
+            html.HtmlElement: The HTML document.
+        """
+        try:
+            response, _ = await self._send(
+                url,
+                lambda proxy: self.client(proxies or proxy).get(url),
+                rotate=not proxies,
+                before_retry=before_retry,
+            )
+            response.raise_for_status()
+            return html.fromstring(response.content)
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return html.fromstring("")
+            raise exc
+
+    async def close(self) -> None:
+        """
+        Close every pooled session and release its connections.
+        """
+        self._closed = True
+        sessions = list(self._sessions.values())
+        clients = list(self._clients.values())
+        self._sessions.clear()
+        self._clients.clear()
+        for session in sessions:
+            await session.close()
+        for client in clients:
+            await client.aclose()
@@ -2,14 +2,73 @@
 This module contains utility functions that are used in the project.
 """
 
+from __future__ import annotations
+
+import importlib
 import re
 import time
+from dataclasses import fields
 from datetime import datetime
+from types import ModuleType
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-import httpx
-from curl_cffi import requests
 from lxml import html
 
+from .transport import Transport
+
+
+def add_slots(cls: type) -> type:
+    """
+    Recreate a dataclass with __slots__, so its instances have no __dict__
+    (the equivalent of `dataclass(slots=True)`, which requires Python 3.10).
+    Apply it above the `@dataclass` decorator.
+
+    Args:
+        cls (type): The dataclass.
+
+    Returns:
+        type: The slotted dataclass, with the same fields and defaults.
+    """
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+    inherited = {
+        name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+    }
+    names = tuple(item.name for item in fields(cls) if item.name not in inherited)
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = names
+    # the class attributes holding the defaults would shadow the slots,
+    # the generated __init__ keeps its own copy of them
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def import_optional(name: str, extra: str) -> ModuleType:
+    """
+    Import an optional dependency.
+
+    Args:
+        name (str): The module name.
+        extra (str): The package extra installing it.
+
+    Returns:
+        ModuleType: The module.
+
+    Raises:
+        ImportError: If the module is not installed.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(
+            f"{name} is required, install it with `pip install EasySoccerData[{extra}]`."
+        ) from None
+
 
 def get_today() -> str:
     """
@@ -49,7 +108,29 @@ def camel_to_snake(name: str) -> str:
     ).lower()
 
 
-def get_json(url: str, impersonate: str | None = None, headers: dict | None = None) -> dict:
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so equivalent URLs share the same cache key.
+
+    Args:
+        url (str): The URL.
+
+    Returns:
+        str: The URL with lowercase scheme and host, no trailing slash
+            and sorted query parameters.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def get_json(
+    url: str,
+    impersonate: str | None = None,
+    headers: dict | None = None,
+    transport: Transport | None = None,
+) -> dict:
     """
     Get the JSON response from the given URL.
 
@@ -58,56 +139,37 @@ def get_json(url: str, impersonate: str | None = None, headers: dict | None = No
         impersonate (str | None): Browser impersonation for curl_cffi.
             Use "chrome" for Sofascore/Promiedos APIs. Defaults to None (uses httpx).
         headers (dict | None): Extra headers to include in the request.
+        transport (Transport | None): The pooled transport to use.
+            Defaults to None (opens and closes a new connection).
 
     Returns:
         dict: The JSON response.
     """
+    if transport is not None:
+        return transport.get_json(url, impersonate=impersonate, headers=headers)
+    with Transport() as one_shot:
+        return one_shot.get_json(url, impersonate=impersonate, headers=headers)
 
-    try:
-        if impersonate:
-            response = requests.get(url, impersonate=impersonate, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            if "error" in data and "code" in data["error"]:
-                code = data["error"]["code"]
-                if code == 403:
-                    print(
-                        "Access denied. Please use a proxy, VPN or renew your ip address."
-                    )
-                if code == 404:
-                    print("No found.")
-                return {}
-            return data
-        with httpx.Client() as client:
-            response = client.get(url, headers=headers)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as exc:
-        if exc.response.status_code == 404:
-            return {}
-        raise exc
-
-
-def get_document(proxies: dict = None, url: str = None) -> html.HtmlElement:
+
+def get_document(
+    proxies: dict = None, url: str = None, transport: Transport | None = None
+) -> html.HtmlElement:
     """
     Get the HTML document from the given URL.
 
     Args:
         proxies (dict): The proxy settings.
         url (str): The URL to get the HTML document.
+        transport (Transport | None): The pooled transport to use.
+            Defaults to None (opens and closes a new connection).
 
     Returns:
         html.HtmlElement: The HTML document.
     """
-    try:
-        with httpx.Client(proxy=proxies) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            return html.fromstring(response.content)
-    except httpx.HTTPStatusError as exc:
-        if exc.response.status_code == 404:
-            return html.fromstring("")
-        raise exc
+    if transport is not None:
+        return transport.get_document(url, proxies)
+    with Transport() as one_shot:
+        return one_shot.get_document(url, proxies)
 
 
 def is_available_date(date: str, pattern: str) -> None:
@@ -128,15 +190,18 @@ def is_available_date(date: str, pattern: str) -> None:
         raise ValueError("Invalid date.") from None
 
 
-def get_api_json(url: str, headers: dict | None = None) -> dict:
+def get_api_json(
+    url: str, headers: dict | None = None, transport: Transport | None = None
+) -> dict:
     """
     Get JSON from an API endpoint using Chrome impersonation via curl_cffi.
 
     Args:
         url (str): The API URL.
         headers (dict | None): Extra headers for the request.
+        transport (Transport | None): The pooled transport to use.
 
     Returns:
         dict: The JSON response.
     """
-    return get_json(url, impersonate="chrome", headers=headers)
+    return get_json(url, impersonate="chrome", headers=headers, transport=transport)
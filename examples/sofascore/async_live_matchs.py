@@ -0,0 +1,39 @@
+"""
+This example shows how to use the asyncio client.
+In this case, we get all the live matches and then fetch their statistics
+concurrently from a single event loop.
+
+The output will be something like:
+
+Adelaide United 0 - 0 Brisbane Roar | Possession: 68% - 32%
+Atlanta United 1 - 0 Inter Miami | Possession: 45% - 55%
+and more...
+"""
+
+import asyncio
+
+import esd
+
+
+async def main() -> None:
+    async with esd.AsyncSofascoreClient(max_concurrency=20) as client:
+        events = await client.get_events(live=True)
+        stats = await asyncio.gather(
+            *(client.get_match_stats(event.id) for event in events)
+        )
+        for event, details in zip(events, stats):
+            board = (
+                f"{event.home_team.name} {event.home_score.current} - "
+                f"{event.away_score.current} {event.away_team.name}"
+            )
+            if details.all is None:
+                print(board)
+                continue
+            possession = details.all.match_overview.ball_possession
+            print(
+                f"{board} | Possession: {possession.home_value}% - {possession.away_value}%"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+"""
+This example shows how to follow the live matches with the live poller.
+Instead of re-rendering every live match, only the matches that started,
+ended or changed (score, status, period) since the last poll are printed.
+
+The output will be something like:
+
++ Arsenal 0 - 0 Chelsea (1st half)
+~ Arsenal 1 - 0 Chelsea (1st half) [score]
+- Arsenal 2 - 1 Chelsea (Ended)
+"""
+
+import esd
+
+SYMBOLS = {"added": "+", "changed": "~", "removed": "-"}
+
+
+def show_change(change: esd.sofascore.EventChange) -> None:
+    event = change.event
+    line = (
+        f"{SYMBOLS[change.kind]} {event.home_team.name} {event.home_score.current} - "
+        f"{event.away_score.current} {event.away_team.name} ({event.status.description})"
+    )
+    if change.aspects:
+        line += f" [{', '.join(change.aspects)}]"
+    print(line)
+
+
+if __name__ == "__main__":
+    with esd.SofascoreClient() as client:
+        poller = esd.LivePoller(client, interval=15)
+        poller.subscribe(show_change)
+        try:
+            poller.run()
+        except KeyboardInterrupt:
+            poller.stop()
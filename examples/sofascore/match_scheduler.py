@@ -0,0 +1,30 @@
+"""
+This example shows how to follow today's matches with the match scheduler.
+Each match is refreshed at the pace of its state: every few seconds during
+play, every minute at halftime, hourly until shortly before kickoff, and
+never again after the final whistle. The whole scheduler stays under one
+request per second.
+"""
+
+import esd
+
+
+def show_change(change: esd.sofascore.EventChange) -> None:
+    event = change.event
+    print(
+        f"[{change.kind}] {event.home_team.name} {event.home_score.current} - "
+        f"{event.away_score.current} {event.away_team.name} "
+        f"({event.status.description})"
+    )
+
+
+if __name__ == "__main__":
+    with esd.SofascoreClient() as client:
+        scheduler = esd.MatchScheduler(client, max_rate=1.0)
+        scheduler.subscribe(show_change)
+        for event in client.get_events():
+            scheduler.track(event)
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            scheduler.stop()
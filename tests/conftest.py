@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class Server:
+    """
+    A local HTTP server answering with the queued responses, then with the
+    default one. Each response is a (status, headers, body) tuple.
+    """
+
+    def __init__(self) -> None:
+        self.responses: deque[tuple[int, dict, object]] = deque()
+        self.default: tuple[int, dict, object] = (200, {}, {"ok": True})
+        self.delay = 0.0
+        self.requests: list[dict] = []
+        self.ports: list[int] = []
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        threading.Thread(
+            target=self._httpd.serve_forever, args=(0.05,), daemon=True
+        ).start()
+
+    def url(self, path: str = "/data") -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}{path}"
+
+    def respond(self, headers: dict, port: int) -> tuple[int, dict, object]:
+        with self._lock:
+            self.requests.append(headers)
+            self.ports.append(port)
+            if self.responses:
+                return self.responses.popleft()
+            return self.default
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                status, headers, body = server.respond(
+                    dict(self.headers), self.client_address[1]
+                )
+                time.sleep(server.delay)
+                content = b"" if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def server():
+    server = Server()
+    yield server
+    server.close()
@@ -0,0 +1,111 @@
+import time
+
+import httpx
+import pytest
+
+from esd.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from esd.retry import RetryPolicy
+from esd.transport import Transport
+
+URL = "https://api.sofascore.com/api/v1/event/1"
+
+
+def fail(breaker: CircuitBreaker, url: str = URL, status: int = 503) -> None:
+    with breaker.guard(url) as record:
+        record(status)
+
+
+def state(breaker: CircuitBreaker, key: str = "api.sofascore.com/event") -> str:
+    return breaker.states[key].state
+
+
+def test_circuit_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    fail(breaker)
+    fail(breaker)
+    assert state(breaker) == CLOSED
+    fail(breaker)
+    assert state(breaker) == OPEN
+    with pytest.raises(CircuitOpenError):
+        fail(breaker)
+
+
+def test_success_resets_the_failures():
+    breaker = CircuitBreaker(failure_threshold=2)
+    fail(breaker)
+    fail(breaker, status=200)
+    fail(breaker)
+    assert state(breaker) == CLOSED
+
+
+def test_failure_statuses_and_exceptions_count():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    fail(breaker, status=429)
+    fail(breaker, status=403)
+    with pytest.raises(ConnectionError):
+        with breaker.guard(URL):
+            raise ConnectionError()
+    assert state(breaker) == OPEN
+
+
+def test_half_open_probe_closes_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    fail(breaker)
+    time.sleep(0.06)
+    assert state(breaker) == HALF_OPEN
+    fail(breaker, status=200)
+    assert state(breaker) == CLOSED
+    assert breaker.states["api.sofascore.com/event"].failures == 0
+
+
+def test_half_open_probe_failure_reopens_the_circuit():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    fail(breaker)
+    time.sleep(0.06)
+    fail(breaker)
+    assert state(breaker) == OPEN
+    with pytest.raises(CircuitOpenError):
+        fail(breaker)
+
+
+def test_half_open_lets_only_the_probes_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    fail(breaker)
+    time.sleep(0.06)
+    with breaker.guard(URL) as record:
+        # the probe is in flight, the next request is refused
+        with pytest.raises(CircuitOpenError):
+            fail(breaker)
+        record(200)
+    assert state(breaker) == CLOSED
+
+
+def test_request_without_outcome_gives_the_probe_back():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    fail(breaker)
+    time.sleep(0.06)
+    with breaker.guard(URL) as record:
+        record(None)
+    # another probe is let through
+    fail(breaker, status=200)
+    assert state(breaker) == CLOSED
+
+
+def test_circuits_are_per_endpoint_family():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    fail(breaker)
+    fail(breaker, "https://api.sofascore.com/api/v1/player/2", status=200)
+    assert state(breaker) == OPEN
+    assert state(breaker, "api.sofascore.com/player") == CLOSED
+
+
+def test_transport_refuses_requests_while_open(server):
+    server.default = (500, {}, {})
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    retry = RetryPolicy(statuses={})
+    with Transport(retry=retry, breaker=breaker) as transport:
+        with pytest.raises(httpx.HTTPStatusError):
+            transport.get_json(server.url())
+        with pytest.raises(CircuitOpenError):
+            transport.get_json(server.url())
+    assert len(server.requests) == 1
@@ -0,0 +1,42 @@
+import dataclasses
+
+from esd.sofascore.types import Event, LazyEvent, parse_event
+
+
+def event_payload(event_id: int) -> dict:
+    return {
+        "id": event_id,
+        "slug": "home-away",
+        "startTimestamp": 1700000000,
+        "tournament": {"id": 17, "name": "Premier League", "slug": "premier-league"},
+        "homeTeam": {"id": 1, "name": "Home", "slug": "home"},
+        "awayTeam": {"id": 2, "name": "Away", "slug": "away"},
+        "homeScore": {"current": 2, "display": 2},
+        "awayScore": {"current": 1, "display": 1},
+        "status": {"code": 100, "description": "Ended", "type": "finished"},
+        "roundInfo": {"round": 3},
+    }
+
+
+def test_lazy_event_equals_parsed_event():
+    raw = event_payload(1)
+    assert LazyEvent(raw) == parse_event(raw)
+    assert parse_event(raw) == LazyEvent(raw)
+    assert LazyEvent(raw) == LazyEvent(raw)
+    assert LazyEvent(raw) != parse_event(event_payload(2))
+
+
+def test_lazy_event_materialize():
+    raw = event_payload(1)
+    event = LazyEvent(raw).materialize()
+    assert type(event) is Event
+    assert event == parse_event(raw)
+
+
+def test_replace_lazy_event():
+    raw = event_payload(1)
+    event = dataclasses.replace(LazyEvent(raw), id=2)
+    assert type(event) is Event
+    assert event.id == 2
+    assert event.home_team.name == "Home"
+    assert event == dataclasses.replace(parse_event(raw), id=2)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from esd.sofascore.live import ADDED, REMOVED, EventChange, LiveObserver
+from esd.sofascore.types import parse_event
+
+
+class SlowTimeline:
+    """
+    A timeline whose fetches take a while, counting the concurrent ones.
+    """
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.running = 0
+        self.most = 0
+        self.forgotten = []
+        self._lock = threading.Lock()
+
+    def new_incidents(self, event_id: int) -> list:
+        with self._lock:
+            self.running += 1
+            self.most = max(self.most, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return []
+
+    def forget(self, event_id: int | None = None) -> None:
+        self.forgotten.append(event_id)
+
+
+def test_matches_refresh_concurrently():
+    timeline = SlowTimeline(0.2)
+    with LiveObserver(timeline, max_workers=4) as observer:
+        for event_id in range(4):
+            observer.notify_change(EventChange(ADDED, parse_event({"id": event_id})))
+    assert timeline.most == 4
+
+
+def test_refreshes_of_a_match_run_one_at_a_time():
+    timeline = SlowTimeline(0.05)
+    with LiveObserver(timeline, max_workers=4) as observer:
+        for _ in range(4):
+            observer.notify_change(EventChange(ADDED, parse_event({"id": 1})))
+    assert timeline.most == 1
+
+
+def test_removed_match_is_forgotten():
+    timeline = SlowTimeline(0.0)
+    with LiveObserver(timeline) as observer:
+        observer.notify_change(EventChange(REMOVED, parse_event({"id": 1})))
+    assert timeline.forgotten == [1]
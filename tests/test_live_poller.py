@@ -0,0 +1,106 @@
+import asyncio
+
+from esd.sofascore.live import (
+    ADDED,
+    CHANGED,
+    REMOVED,
+    AsyncLivePoller,
+    LivePoller,
+)
+
+
+def live_event(event_id: int, home: int = 0, status: str = "1st half") -> dict:
+    return {
+        "id": event_id,
+        "homeScore": {"current": home},
+        "awayScore": {"current": 0},
+        "status": {"code": 6, "description": status, "type": "inprogress"},
+        "time": {"currentPeriodStartTimestamp": 1700000000},
+    }
+
+
+class FakeClient:
+    """
+    A client answering the live events polls with the queued responses.
+    """
+
+    def __init__(self, *responses: dict) -> None:
+        self.responses = list(responses)
+
+    def get_events(self, live: bool = False, raw: bool = False) -> dict:
+        return self.responses.pop(0)
+
+
+class AsyncFakeClient(FakeClient):
+    async def get_events(self, live: bool = False, raw: bool = False) -> dict:
+        return self.responses.pop(0)
+
+
+def kinds(changes: list) -> list[tuple[str, int, tuple]]:
+    return [(change.kind, change.event.id, change.aspects) for change in changes]
+
+
+def test_poll_emits_added_changed_and_removed_events():
+    client = FakeClient(
+        {"events": [live_event(1), live_event(2)]},
+        {"events": [live_event(1, home=1), live_event(2)]},
+        {"events": [live_event(1, home=1, status="Halftime")]},
+    )
+    poller = LivePoller(client)
+    emitted = []
+    poller.subscribe(emitted.append)
+
+    assert kinds(poller.poll()) == [(ADDED, 1, ()), (ADDED, 2, ())]
+    changes = poller.poll()
+    assert kinds(changes) == [(CHANGED, 1, ("score",))]
+    assert changes[0].previous.home_score.current == 0
+    assert changes[0].event.home_score.current == 1
+    assert kinds(poller.poll()) == [(CHANGED, 1, ("status",)), (REMOVED, 2, ())]
+    assert len(emitted) == 5
+    assert [event.id for event in poller.events] == [1]
+
+
+def test_unchanged_events_are_not_parsed_again():
+    client = FakeClient({"events": [live_event(1)]}, {"events": [live_event(1)]})
+    poller = LivePoller(client)
+    poller.poll()
+    event = poller.events[0]
+    assert poller.poll() == []
+    assert poller.events[0] is event
+
+
+def test_failed_poll_keeps_the_events():
+    client = FakeClient({"events": [live_event(1)]}, {}, {"events": [live_event(1)]})
+    poller = LivePoller(client)
+    poller.poll()
+    assert poller.poll() == []
+    assert [event.id for event in poller.events] == [1]
+    assert poller.poll() == []
+
+
+def test_unsubscribed_callback_is_not_called():
+    client = FakeClient({"events": [live_event(1)]})
+    poller = LivePoller(client)
+    emitted = []
+    unsubscribe = poller.subscribe(emitted.append)
+    unsubscribe()
+    poller.poll()
+    assert emitted == []
+
+
+def test_async_poll_awaits_coroutine_subscribers():
+    client = AsyncFakeClient({"events": [live_event(1)]}, {"events": []})
+    poller = AsyncLivePoller(client)
+    emitted = []
+
+    async def on_change(change):
+        emitted.append(change)
+
+    poller.subscribe(on_change)
+
+    async def main():
+        await poller.poll()
+        await poller.poll()
+
+    asyncio.run(main())
+    assert kinds(emitted) == [(ADDED, 1, ()), (REMOVED, 1, ())]
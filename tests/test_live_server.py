@@ -0,0 +1,41 @@
+import threading
+import time
+
+from esd.sofascore.server import LiveServer
+
+
+class SlowClient:
+    """
+    A client whose live events request blocks until released.
+    """
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.events = [{"id": 1, "status": {"type": "inprogress"}}]
+
+    def get_events(self, live: bool = False, raw: bool = False) -> dict:
+        self.release.wait(5)
+        return {"events": self.events}
+
+    def close(self) -> None:
+        pass
+
+
+def test_subscribe_during_a_slow_poll():
+    client = SlowClient()
+    server = LiveServer(client, port=0, incidents=False)
+    try:
+        poll = threading.Thread(target=server._poll)
+        poll.start()
+        time.sleep(0.05)
+        start = time.perf_counter()
+        subscriber = server._subscribe()
+        assert time.perf_counter() - start < 1
+        client.release.set()
+        poll.join()
+        assert subscriber.get_nowait().startswith(b"event: snapshot")
+        assert subscriber.get_nowait().startswith(b"event: added")
+        assert [event["id"] for event in server.snapshot()] == [1]
+    finally:
+        client.release.set()
+        server.stop()
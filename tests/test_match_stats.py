@@ -0,0 +1,33 @@
+from esd.sofascore.types import parse_match_stats
+from esd.sofascore.types.match_stats import match_stats_columns
+
+
+def statistics(items: list[dict]) -> list[dict]:
+    return [
+        {
+            "period": "ALL",
+            "groups": [{"groupName": "Match overview", "statisticsItems": items}],
+        }
+    ]
+
+
+def test_columns_have_none_for_missing_statistics():
+    played = parse_match_stats(
+        statistics(
+            [
+                {"key": "fouls", "homeValue": 12, "awayValue": 9},
+                {"key": "unknownStat", "homeValue": 1, "awayValue": 2},
+            ]
+        )
+    )
+    empty = parse_match_stats(statistics([]))
+    columns = match_stats_columns([played, empty], extras=True)
+    assert columns["match_overview.fouls.home"] == [12, None]
+    assert columns["match_overview.fouls.away"] == [9, None]
+    assert columns["match_overview.corner_kicks.home"] == [None, None]
+    assert columns["extras.unknownStat.home"] == [1, None]
+
+
+def test_missing_statistic_keeps_its_default_values():
+    stats = parse_match_stats(statistics([]))
+    assert stats.all.match_overview.fouls.home_value == 0.0
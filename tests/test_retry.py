@@ -0,0 +1,72 @@
+import time
+
+import httpx
+import pytest
+
+from esd.retry import RetryPolicy, parse_retry_after
+from esd.transport import APIError, Transport
+
+FAST_RETRY = RetryPolicy(backoff_factor=0.01, jitter=0)
+
+
+def test_retry_on_503_waits_for_retry_after(server):
+    server.responses.append((503, {"Retry-After": "0.3"}, {}))
+    with Transport(retry=FAST_RETRY) as transport:
+        started = time.monotonic()
+        assert transport.get_json(server.url()) == {"ok": True}
+        elapsed = time.monotonic() - started
+        stats = transport.retrier.stats
+    assert len(server.requests) == 2
+    assert elapsed >= 0.3
+    assert stats.retries == 1
+    assert stats.reasons == {503: 1}
+
+
+def test_retry_after_beyond_the_limit_is_not_retried(server):
+    server.default = (503, {"Retry-After": "3600"}, {})
+    with Transport(retry=FAST_RETRY) as transport:
+        with pytest.raises(httpx.HTTPStatusError):
+            transport.get_json(server.url())
+        assert transport.retrier.stats.give_ups == 1
+    assert len(server.requests) == 1
+
+
+def test_retries_give_up_after_the_attempts_of_the_status(server):
+    server.default = (503, {}, {})
+    with Transport(retry=FAST_RETRY) as transport:
+        with pytest.raises(httpx.HTTPStatusError):
+            transport.get_json(server.url())
+    assert len(server.requests) == FAST_RETRY.statuses[503]
+
+
+def test_other_statuses_are_not_retried(server):
+    server.default = (400, {}, {})
+    with Transport(retry=FAST_RETRY) as transport:
+        with pytest.raises(httpx.HTTPStatusError):
+            transport.get_json(server.url())
+    assert len(server.requests) == 1
+
+
+def test_embedded_error_codes(server):
+    server.responses.extend(
+        [
+            (200, {}, {"error": {"code": 503}}),
+            (200, {}, {"error": {"code": 403}}),
+            (200, {}, {"error": {"code": 404}}),
+        ]
+    )
+    with Transport(retry=FAST_RETRY) as transport:
+        # the embedded 503 is retried like the status, then raised as 403
+        with pytest.raises(APIError) as info:
+            transport.get_api_json(server.url())
+        assert info.value.code == 403
+        assert transport.get_api_json(server.url()) == {}
+    assert len(server.requests) == 3
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from esd.transport import AsyncSingleFlight, SingleFlight, Transport
+
+
+def wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_concurrent_calls_share_one_flight():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"n": 1}
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(flights.do, "key", call)
+        started.wait(5)
+        followers = [pool.submit(flights.do, "key", call) for _ in range(3)]
+        wait_until(lambda: flights.shared == 3)
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_followers_share_the_exception():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def call():
+        started.set()
+        release.wait(5)
+        raise ValueError("failed")
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flights.do, "key", call)
+        started.wait(5)
+        follower = pool.submit(flights.do, "key", call)
+        wait_until(lambda: flights.shared == 1)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_sequential_calls_are_not_coalesced():
+    flights = SingleFlight()
+    assert flights.do("key", lambda: 1) == 1
+    assert flights.do("key", lambda: 2) == 2
+    assert flights.shared == 0
+
+
+def test_identical_requests_share_one_response(server):
+    server.delay = 0.2
+    with Transport() as transport:
+        with ThreadPoolExecutor(5) as pool:
+            results = list(
+                pool.map(lambda _: transport.get_json(server.url()), range(5))
+            )
+    assert len(server.requests) == 1
+    assert results == [{"ok": True}] * 5
+
+
+def test_async_identical_calls_share_one_task():
+    flights = AsyncSingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"n": 1}
+
+    async def main():
+        return await asyncio.gather(*(flights.do("key", call) for _ in range(4)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert results == [{"n": 1}] * 4
+    assert flights.shared == 3
@@ -0,0 +1,31 @@
+from esd.sofascore.cache import FOREVER, SofascoreCache
+
+
+def finished_events(*event_ids: int) -> dict:
+    return {
+        "events": [
+            {"id": event_id, "status": {"type": "finished"}} for event_id in event_ids
+        ]
+    }
+
+
+def test_finished_event_keeps_its_payloads():
+    cache = SofascoreCache()
+    cache.store("/events", finished_events(1), "events_endpoint")
+    assert cache.is_finished(1)
+    assert cache.ttl("match_stats_endpoint", 1) == FOREVER
+    assert cache.ttl("match_stats_endpoint", 2) == 10
+
+
+def test_finished_events_are_bounded():
+    cache = SofascoreCache(max_size=3)
+    cache.store("/events/1", finished_events(1, 2, 3), "events_endpoint")
+    # the most recently used finished events are kept
+    assert cache.is_finished(1)
+    cache.store("/events/2", finished_events(4), "events_endpoint")
+    assert [cache.is_finished(event_id) for event_id in (1, 2, 3, 4)] == [
+        True,
+        False,
+        True,
+        True,
+    ]
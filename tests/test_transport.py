@@ -0,0 +1,69 @@
+import pytest
+
+from esd.breaker import CLOSED, CircuitBreaker
+from esd.fbref.exceptions import RateLimitExceeded
+from esd.retry import RetryPolicy
+from esd.transport import Transport
+
+FAST_RETRY = RetryPolicy(backoff_factor=0.01, jitter=0)
+
+
+def test_local_throttle_is_not_a_circuit_failure(server):
+    server.default = (503, {}, {})
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    def throttle():
+        raise RateLimitExceeded()
+
+    with Transport(retry=FAST_RETRY, breaker=breaker) as transport:
+        with pytest.raises(RateLimitExceeded):
+            transport.get_document(server.url(), before_retry=throttle)
+    assert len(server.requests) == 1
+    assert [state.state for state in breaker.states.values()] == [CLOSED]
+
+
+def test_requests_reuse_the_pooled_connection(server):
+    with Transport() as transport:
+        for _ in range(3):
+            assert transport.get_json(server.url()) == {"ok": True}
+        assert transport.client() is transport.client()
+    assert len(set(server.ports)) == 1
+
+
+def test_not_modified_response_reuses_the_last_payload(server):
+    server.responses.extend(
+        [
+            (200, {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}, {"n": 1}),
+            (304, {"ETag": '"v1"'}, None),
+        ]
+    )
+    with Transport(revalidate=True) as transport:
+        first = transport.get_json(server.url())
+        second = transport.get_json(server.url())
+        assert transport.validators.not_modified == 1
+    assert second is first
+    assert "If-None-Match" not in server.requests[0]
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+    assert server.requests[1]["If-Modified-Since"] == "Mon, 01 Jan 2024"
+
+
+def test_changed_response_replaces_the_validators(server):
+    server.responses.extend(
+        [
+            (200, {"ETag": '"v1"'}, {"n": 1}),
+            (200, {"ETag": '"v2"'}, {"n": 2}),
+        ]
+    )
+    with Transport(revalidate=True) as transport:
+        assert transport.get_json(server.url()) == {"n": 1}
+        assert transport.get_json(server.url()) == {"n": 2}
+        transport.get_json(server.url())
+    assert server.requests[2]["If-None-Match"] == '"v2"'
+
+
+def test_requests_are_unconditional_without_revalidation(server):
+    server.default = (200, {"ETag": '"v1"'}, {"n": 1})
+    with Transport() as transport:
+        transport.get_json(server.url())
+        transport.get_json(server.url())
+    assert "If-None-Match" not in server.requests[1]